@@ -0,0 +1,47 @@
+"""
+Compares two results of `benchmarks/run.py`.
+
+Usage
+-----
+$ python benchmarks/compare.py baseline.json results.json
+"""
+
+import argparse
+import json
+import sys
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("baseline", help="a JSON file of the baseline results")
+    parser.add_argument("results", help="a JSON file of the results to compare")
+    args = parser.parse_args(argv)
+    with open(args.baseline) as f:
+        baseline = {_get_key(r): r for r in json.load(f)["results"]}
+    with open(args.results) as f:
+        results = json.load(f)["results"]
+    print(f"{'case':<52} {'wall time':>10} {'peak RSS':>10} {'file size':>10}")
+    for result in results:
+        base = baseline.get(_get_key(result))
+        if base is None:
+            continue
+        print(
+            f"{_get_key(result):<52} "
+            f"{_get_ratio(base['wall_time'], result['wall_time']):>10} "
+            f"{_get_ratio(base['peak_rss'], result['peak_rss']):>10} "
+            f"{_get_ratio(base['file_size'], result['file_size']):>10}"
+        )
+
+
+def _get_key(result: dict[str, object]) -> str:
+    return f"{result['name']} {json.dumps(result['params'])}"
+
+
+def _get_ratio(base: float | None, value: float | None) -> str:
+    if not base or value is None:
+        return "-"
+    return f"{value / base:.2f}x"
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,200 @@
+"""
+Benchmarks of the hot paths of building a presentation.
+
+Each case runs in a fresh process and reports the wall time, the peak RSS
+and the output file size. The wall time excludes setting up the inputs
+and starting kaleido. A case returning a presentation is timed without
+saving it, and the file size is measured afterwards. The results are written
+as JSON to compare runs with `benchmarks/compare.py`.
+
+Usage
+-----
+$ python benchmarks/run.py -o results.json
+$ python benchmarks/run.py -k add_figure --repeat 5
+"""
+
+import argparse
+import dataclasses
+import datetime
+import functools
+import io
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+import typing as t
+from collections import abc
+from concurrent import futures
+
+import numpy as np
+import plotly.graph_objects as go
+
+import tlab_pptx
+from tlab_pptx.presentation import photo_luminescence
+
+TRACE_SIZES = (100, 10_000, 100_000)
+SLIDE_COUNTS = (1, 10, 100)
+
+
+@dataclasses.dataclass()
+class Result:
+    name: str
+    params: dict[str, t.Any]
+    wall_time: float
+    peak_rss: int
+    file_size: int | None
+
+
+def get_figure(n_points: int) -> go.Figure:
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 10, n_points)
+    y = np.exp(-x / 2) + rng.normal(scale=1e-2, size=n_points)
+    return go.Figure(go.Scatter(x=x, y=y)).update_layout(tlab_pptx.get_default_layout())
+
+
+# Each case sets up its inputs and returns the function to be measured,
+# which returns the file size or the presentation to be sized untimed.
+Output = int | tlab_pptx.Presentation | None
+Case = abc.Callable[[int], abc.Callable[[], Output]]
+
+
+def bench_new_presentation(count: int) -> abc.Callable[[], None]:
+    def func() -> None:
+        for _ in range(count):
+            tlab_pptx.new_presentation()
+
+    tlab_pptx.new_presentation()
+    return func
+
+
+def bench_add_text(count: int) -> abc.Callable[[], None]:
+    slide = tlab_pptx.new_presentation().slides[0]
+
+    def func() -> None:
+        for i in range(count):
+            slide.add_text(f"text {i}", left=1.0, top=1.0)
+
+    return func
+
+
+def bench_add_figure(n_points: int) -> abc.Callable[[], tlab_pptx.Presentation]:
+    fig = get_figure(n_points)
+    prs = tlab_pptx.new_presentation()
+
+    def func() -> tlab_pptx.Presentation:
+        prs.slides[0].add_figure(fig, left=0.33, top=5.0)
+        return prs
+
+    _start_kaleido()
+    return func
+
+
+def bench_save(n_slides: int) -> abc.Callable[[], int]:
+    image = get_figure(100).to_image("png", scale=10)
+    prs = tlab_pptx.new_presentation()
+    for i in range(n_slides):
+        # Varies the images so that they are not shared between slides.
+        prs.add_slide().add_image(image + i.to_bytes(4, "big"), left=0.33, top=5.0)
+    return functools.partial(_get_size, prs)
+
+
+def bench_build(n_points: int) -> abc.Callable[[], tlab_pptx.Presentation]:
+    fig = get_figure(n_points)
+
+    def func() -> tlab_pptx.Presentation:
+        return photo_luminescence.build(
+            "Benchmark", 400, 1, 10, 480, 50.0, 10000, datetime.date(2022, 1, 1),
+            fig, fig, 0.63, 0.37, 1.2, 3.6,
+        )  # fmt: skip
+
+    _start_kaleido()
+    return func
+
+
+CASES: dict[str, tuple[Case, str, tuple[int, ...]]] = {
+    "new_presentation": (bench_new_presentation, "count", (1, 100)),
+    "add_text": (bench_add_text, "count", (1, 100)),
+    "add_figure": (bench_add_figure, "n_points", TRACE_SIZES),
+    "save": (bench_save, "n_slides", SLIDE_COUNTS),
+    "photo_luminescence.build": (bench_build, "n_points", TRACE_SIZES),
+}
+
+
+def run_case(name: str, value: int) -> Result:
+    case, param, _ = CASES[name]
+    func = case(value)
+    start = time.perf_counter()
+    output = func()
+    wall_time = time.perf_counter() - start
+    if isinstance(output, tlab_pptx.Presentation):
+        output = _get_size(output)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        peak_rss *= 1024
+    return Result(name, {param: value}, wall_time, peak_rss, output)
+
+
+def run(names: abc.Iterable[str], repeat: int) -> list[Result]:
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for name in names:
+        for value in CASES[name][2]:
+            runs = []
+            for _ in range(repeat):
+                with futures.ProcessPoolExecutor(1, mp_context=context) as executor:
+                    runs.append(executor.submit(run_case, name, value).result())
+            result = min(runs, key=lambda r: r.wall_time)
+            print(
+                f"{name:<28} {json.dumps(result.params):<24} "
+                f"{result.wall_time:9.3f} s {result.peak_rss / 1024**2:9.1f} MiB "
+                f"{_format_size(result.file_size)}",
+                file=sys.stderr,
+            )
+            results.append(result)
+    return results
+
+
+def _start_kaleido() -> None:
+    # Excludes the startup of kaleido from the measured time.
+    go.Figure().to_image("png")
+
+
+def _get_size(prs: tlab_pptx.Presentation) -> int:
+    with io.BytesIO() as f:
+        prs.save(f)
+        return f.tell()
+
+
+def _format_size(size: int | None) -> str:
+    return "" if size is None else f"{size / 1024:9.1f} KiB"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-o", "--output", help="a JSON file to write the results")
+    parser.add_argument(
+        "-k", dest="keyword", default="", help="run only cases containing this"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="runs per case")
+    args = parser.parse_args(argv)
+    names = [name for name in CASES if args.keyword in name]
+    results = run(names, args.repeat)
+    report = dict(
+        created_at=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        version=tlab_pptx.__version__,
+        python=platform.python_version(),
+        platform=platform.platform(),
+        results=[dataclasses.asdict(result) for result in results],
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
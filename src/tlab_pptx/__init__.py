@@ -1,11 +1,72 @@
 __version__ = "0.1.7"
 
+import importlib
+import typing as t
 
-from . import presentation as presentation
+from . import profiling as profiling
 from . import typing as typing
-from .core import Presentation as Presentation
-from .core import Slide as Slide
-from .core import new_presentation as new_presentation
-from .figure import get_date_annotation as get_date_annotation
-from .figure import get_default_axis as get_default_axis
-from .figure import get_default_layout as get_default_layout
+
+if t.TYPE_CHECKING:
+    from . import chart as chart
+    from . import core as core
+    from . import downsample as downsample
+    from . import figure as figure
+    from . import fitting as fitting
+    from . import pptx as pptx
+    from . import presentation as presentation
+    from . import render as render
+    from . import server as server
+    from . import spectrum as spectrum
+    from . import streak as streak
+    from .core import Presentation as Presentation
+    from .core import PresentationWriter as PresentationWriter
+    from .core import Slide as Slide
+    from .core import TextSpec as TextSpec
+    from .core import merge_presentations as merge_presentations
+    from .core import new_presentation as new_presentation
+    from .figure import get_date_annotation as get_date_annotation
+    from .figure import get_default_axis as get_default_axis
+    from .figure import get_default_layout as get_default_layout
+
+# The modules depending on plotly and python-pptx are imported on first access
+# since importing them takes a while.
+_LAZY_MODULES = (
+    "chart",
+    "core",
+    "downsample",
+    "figure",
+    "fitting",
+    "pptx",
+    "presentation",
+    "render",
+    "server",
+    "spectrum",
+    "streak",
+)
+_LAZY_ATTRIBUTES = {
+    "Presentation": "core",
+    "PresentationWriter": "core",
+    "Slide": "core",
+    "TextSpec": "core",
+    "merge_presentations": "core",
+    "new_presentation": "core",
+    "get_date_annotation": "figure",
+    "get_default_axis": "figure",
+    "get_default_layout": "figure",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_MODULES, *_LAZY_ATTRIBUTES])
@@ -0,0 +1,3 @@
+from tlab_pptx import cli
+
+raise SystemExit(cli.main())
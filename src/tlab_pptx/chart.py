@@ -0,0 +1,256 @@
+import math
+import re
+import typing as t
+
+import plotly.graph_objects as go
+import plotly.io as pio
+import pptx.chart.axis
+import pptx.chart.chart
+import pptx.chart.data
+import pptx.dml.color
+import pptx.enum.chart
+import pptx.oxml
+import pptx.oxml.ns
+import pptx.util
+
+_TICK_MARKS = {
+    "inside": pptx.enum.chart.XL_TICK_MARK.INSIDE,
+    "outside": pptx.enum.chart.XL_TICK_MARK.OUTSIDE,
+    "": pptx.enum.chart.XL_TICK_MARK.NONE,
+}
+
+
+def get_chart_data(fig: go.Figure) -> pptx.chart.data.XyChartData:
+    """
+    Gets chart data of PowerPoint from the scatter traces of a figure.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure
+        A figure with only scatter traces on a single pair of axes.
+
+    Returns
+    -------
+    pptx.chart.data.XyChartData
+        The chart data with a series for each trace.
+
+    Raises
+    ------
+    ValueError
+        If the figure has a trace which cannot be converted,
+        such as one with dates or categories.
+
+    Examples
+    --------
+    >>> fig = go.Figure(go.Scatter(x=[0, 1, 2], y=[1, None, 4], name="A"))
+    >>> chart_data = get_chart_data(fig)
+    >>> [(s.name, s.x_values, s.y_values) for s in chart_data]
+    [('A', [0.0, 2.0], [1.0, 4.0])]
+    """
+    chart_data = pptx.chart.data.XyChartData()
+    for i, trace in enumerate(fig.data):
+        if trace.type not in ("scatter", "scattergl"):
+            raise ValueError(f"{trace.type} trace cannot be converted to a chart")
+        if (trace.xaxis or "x") != "x" or (trace.yaxis or "y") != "y":
+            raise ValueError("Traces on subplots cannot be converted to a chart")
+        ys = trace.y if trace.y is not None else ()
+        xs = trace.x if trace.x is not None else range(len(ys))
+        series = chart_data.add_series(trace.name or f"Series {i + 1}")
+        for x, y in zip(xs, ys):
+            if x is None or y is None:
+                continue
+            try:
+                point = float(x), float(y)
+            except (TypeError, ValueError) as err:
+                raise ValueError(
+                    f"({x!r}, {y!r}) of {series.name} is not a pair of numbers"
+                ) from err
+            if not any(map(math.isnan, point)):
+                series.add_data_point(*point)
+    return chart_data
+
+
+def format_chart(chart: pptx.chart.chart.Chart, fig: go.Figure, width: float) -> None:
+    """
+    Formats a chart of PowerPoint like the layout and the traces of a figure.
+
+    The axes (title, range, log type, ticks and lines), the legend,
+    the font and the colors and widths of the lines are carried over.
+
+    Parameters
+    ----------
+    chart : pptx.chart.chart.Chart
+        A chart created from `get_chart_data(fig)`.
+    fig : plotly.graph_objects.Figure
+        The figure of the chart.
+    width : float
+        The width of the chart on a slide in centimeter,
+        by which sizes in pixel are converted to point.
+    """
+    layout = fig.layout
+    template = layout.template.layout
+    pt_per_px = get_pt_per_px(fig, width)
+    font_size = layout.font.size or template.font.size or 12
+    chart.font.size = pptx.util.Pt(font_size * pt_per_px)
+    if font_family := layout.font.family or template.font.family:
+        chart.font.name = font_family.split(",")[0].strip("'\" ")
+    showlegend = layout.showlegend
+    chart.has_legend = len(fig.data) > 1 if showlegend is None else showlegend
+    axes = chart._chartSpace.valAx_lst
+    for axis_element, name in zip(axes, ("xaxis", "yaxis")):
+        _format_axis(
+            pptx.chart.axis.ValueAxis(axis_element),
+            layout[name],
+            template[name],
+            pt_per_px,
+        )
+    if all(
+        _get_axis_property(layout[name], template[name], "mirror")
+        and _get_axis_property(layout[name], template[name], "showline")
+        for name in ("xaxis", "yaxis")
+    ):
+        plot_area = chart._chartSpace.chart.plotArea
+        plot_area.append(
+            pptx.oxml.parse_xml(
+                f"<c:spPr {pptx.oxml.ns.nsdecls('c', 'a')}>"
+                '<a:noFill/><a:ln><a:solidFill><a:srgbClr val="000000"/>'
+                "</a:solidFill></a:ln></c:spPr>"
+            )
+        )
+    colorway = layout.colorway or template.colorway or ()
+    for i, (trace, series) in enumerate(zip(fig.data, chart.plots[0].series)):
+        series.smooth = False
+        line = series.format.line
+        if "lines" not in (trace.mode or "lines"):
+            line.fill.background()
+        if trace.line.width is not None:
+            line.width = pptx.util.Pt(trace.line.width * pt_per_px)
+        color = trace.line.color or (colorway[i % len(colorway)] if colorway else None)
+        if (rgb := _to_rgb(color)) is not None:
+            line.color.rgb = rgb
+        if "markers" in (trace.mode or ""):
+            series.marker.style = pptx.enum.chart.XL_MARKER_STYLE.CIRCLE
+            if rgb is not None:
+                series.marker.format.fill.solid()
+                series.marker.format.fill.fore_color.rgb = rgb
+        else:
+            series.marker.style = pptx.enum.chart.XL_MARKER_STYLE.NONE
+
+
+def get_paper_annotations(fig: go.Figure, width: float) -> list[dict[str, t.Any]]:
+    """
+    Gets the annotations of a figure positioned relative to the paper.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure
+        A figure with annotations.
+    width : float
+        The width of the figure on a slide in centimeter,
+        by which font sizes in pixel are converted to point.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The text, the position (`x` and `y`) and the font size in point
+        of each annotation.
+
+    Examples
+    --------
+    >>> fig = go.Figure(layout=dict(width=720, font=dict(size=20)))
+    >>> fig = fig.add_annotation(text="A", x=1, y=0, xref="paper", yref="paper")
+    >>> get_paper_annotations(fig, 2.54)
+    [{'text': 'A', 'x': 1, 'y': 0, 'font_size': 2.0}]
+    """
+    pt_per_px = get_pt_per_px(fig, width)
+    font_size = fig.layout.font.size or fig.layout.template.layout.font.size or 12
+    return [
+        dict(
+            text=annotation.text,
+            x=annotation.x,
+            y=annotation.y,
+            font_size=(annotation.font.size or font_size) * pt_per_px,
+        )
+        for annotation in fig.layout.annotations
+        if annotation.xref == "paper" and annotation.yref == "paper"
+    ]
+
+
+def get_pt_per_px(fig: go.Figure, width: float) -> float:
+    """
+    Gets the size in point of a pixel of a figure placed on a slide.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure
+        A figure.
+    width : float
+        The width of the figure on a slide in centimeter.
+
+    Returns
+    -------
+    float
+        The size of a pixel in point.
+
+    Examples
+    --------
+    >>> get_pt_per_px(go.Figure(layout=dict(width=720)), 2.54)
+    0.1
+    """
+    fig_width = fig.layout.width or pio.kaleido.scope.default_width
+    return float(width / 2.54 * 72 / fig_width)
+
+
+def _format_axis(
+    axis: pptx.chart.axis.ValueAxis,
+    fig_axis: t.Any,
+    template_axis: t.Any,
+    pt_per_px: float,
+) -> None:
+    def get(name: str) -> t.Any:
+        return _get_axis_property(fig_axis, template_axis, name)
+
+    axis.has_major_gridlines = bool(get("showgrid"))
+    axis.has_minor_gridlines = False
+    axis.major_tick_mark = _TICK_MARKS.get(get("ticks") or "", _TICK_MARKS[""])
+    axis.minor_tick_mark = pptx.enum.chart.XL_TICK_MARK.NONE
+    axis.tick_label_position = pptx.enum.chart.XL_TICK_LABEL_POSITION.LOW
+    if get("showline"):
+        axis.format.line.color.rgb = pptx.dml.color.RGBColor(0, 0, 0)
+        if (line_width := get("linewidth")) is not None:
+            axis.format.line.width = pptx.util.Pt(line_width * pt_per_px)
+    else:
+        axis.format.line.fill.background()
+    if title := fig_axis.title.text:
+        axis.has_title = True
+        axis.axis_title.text_frame.text = title
+    log = get("type") == "log"
+    if log:
+        scaling = axis._element.scaling
+        scaling.insert(0, pptx.oxml.parse_xml(_LOG_BASE_XML))
+    if (range_ := fig_axis.range) is not None:
+        lower, upper = (10**value if log else value for value in range_)
+        axis.minimum_scale, axis.maximum_scale = sorted((lower, upper))
+
+
+_LOG_BASE_XML = f'<c:logBase {pptx.oxml.ns.nsdecls("c")} val="10"/>'
+
+
+def _get_axis_property(fig_axis: t.Any, template_axis: t.Any, name: str) -> t.Any:
+    value = fig_axis[name]
+    return template_axis[name] if value is None else value
+
+
+def _to_rgb(color: str | None) -> pptx.dml.color.RGBColor | None:
+    if not color:
+        return None
+    if match := re.fullmatch(r"#([0-9a-fA-F]{6})", color):
+        return pptx.dml.color.RGBColor.from_string(match.group(1).upper())
+    if match := re.fullmatch(r"#([0-9a-fA-F]{3})", color):
+        return pptx.dml.color.RGBColor.from_string(
+            "".join(c * 2 for c in match.group(1)).upper()
+        )
+    if match := re.fullmatch(r"rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+).*\)", color):
+        r, g, b = (int(value) for value in match.groups())
+        return pptx.dml.color.RGBColor(r, g, b)
+    return None
@@ -0,0 +1,329 @@
+import argparse
+import collections
+import dataclasses
+import multiprocessing
+import os
+import pathlib
+import sys
+import typing as t
+from collections import abc
+from concurrent import futures
+
+from tlab_pptx import typing
+
+if t.TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# pandas, plotly and python-pptx are imported by the subcommands
+# so that `--help` and parsing the arguments stay fast.
+
+# The fields of `tlab_pptx.presentation.photo_luminescence.Record` except figures.
+_PL_COLUMNS = (
+    "title_text",
+    "excitation_wavelength",
+    "excitation_power",
+    "time_range",
+    "center_wavelength",
+    "FWHM",
+    "frame",
+    "date",
+    "a",
+    "b",
+    "tau1",
+    "tau2",
+)
+_PL_OPTIONAL_COLUMNS = ("center_wavelength", "FWHM")
+_PL_DATA_COLUMNS = ("h_data", "v_data")
+
+
+def main(argv: abc.Sequence[str] | None = None) -> int:
+    """
+    Runs the command line interface.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None
+        The command line arguments. If None (default), `sys.argv[1:]` is used.
+
+    Returns
+    -------
+    int
+        The exit status, which is 1 if any item fails.
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+    status: int = args.func(args)
+    return status
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="tlab-pptx", description="Creates PowerPoint files for Takeuchi Lab."
+    )
+    subparsers = parser.add_subparsers(required=True)
+    build_pl = subparsers.add_parser(
+        "build-pl",
+        help="build photo luminescence decks from a manifest",
+        description=(
+            "Builds a deck for each row of a manifest CSV file. The manifest has a "
+            f"column for each of {', '.join(_PL_COLUMNS)}, where empty or missing "
+            f"{' and '.join(_PL_OPTIONAL_COLUMNS)} are derived from the spectra, "
+            "and the columns "
+            "h_data and v_data with the paths of CSV files, relative to the manifest, "
+            "of the data of PL intensity vs. time and vs. wavelength. "
+            "The first column of a data file is the x values, and each of the others "
+            "is a trace. An optional name column gives the distinct filenames "
+            "of the decks without path separators."
+        ),
+    )
+    build_pl.add_argument("manifest", type=pathlib.Path, help="a manifest CSV file")
+    build_pl.add_argument(
+        "-o",
+        "--output-dir",
+        type=pathlib.Path,
+        default=pathlib.Path("."),
+        help="a directory to which the decks are written (default: .)",
+    )
+    build_pl.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="the number of worker processes (default: the number of CPUs)",
+    )
+    build_pl.add_argument(
+        "--merge",
+        type=pathlib.Path,
+        metavar="PATH",
+        help="a file to which the built decks are also merged in order",
+    )
+    build_pl.add_argument(
+        "--dpi",
+        type=_parse_dpi,
+        help="the resolution of the figures in DPI or draft, screen or print",
+    )
+    build_pl.add_argument(
+        "--figure-format",
+        choices=t.get_args(typing.FigureFormat),
+        default="png",
+        help="the format in which the figures are embedded (default: png)",
+    )
+    build_pl.add_argument(
+        "--downsample",
+        action="store_true",
+        help="downsample large traces before rendering",
+    )
+    build_pl.set_defaults(func=_build_pl)
+    serve = subparsers.add_parser(
+        "serve",
+        help="serve photo luminescence decks over HTTP",
+        description=(
+            "Runs a local HTTP server keeping the rendering processes and the "
+            "template warm. POST /photo-luminescence with a JSON object of the "
+            "parameters of a deck returns the .pptx file."
+        ),
+    )
+    serve.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="the host to which the server is bound (default: 127.0.0.1)",
+    )
+    serve.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="the port to which the server is bound (default: 8000)",
+    )
+    serve.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="the number of rendering processes (default: the number of CPUs)",
+    )
+    serve.add_argument(
+        "--max-builds",
+        type=int,
+        default=4,
+        help="the number of decks built at a time (default: 4)",
+    )
+    serve.add_argument(
+        "--max-pending",
+        type=int,
+        default=16,
+        help="the number of requests waiting for a build, beyond which "
+        "requests are rejected with 503 (default: 16)",
+    )
+    serve.add_argument(
+        "--cache-dir",
+        type=pathlib.Path,
+        metavar="PATH",
+        help="a directory in which rendered figures are cached",
+    )
+    serve.set_defaults(func=_serve)
+    return parser
+
+
+def _parse_dpi(value: str) -> float | typing.Quality:
+    if value in t.get_args(typing.Quality):
+        return t.cast(typing.Quality, value)
+    return float(value)
+
+
+@dataclasses.dataclass(frozen=True)
+class _PLTask:
+    name: str
+    row: dict[str, t.Any]
+    output: pathlib.Path
+    dpi: float | typing.Quality | None
+    figure_format: typing.FigureFormat
+    downsample: bool
+
+
+def _build_pl(args: argparse.Namespace) -> int:
+    import pandas as pd
+
+    from tlab_pptx import core
+
+    manifest = pd.read_csv(args.manifest, dtype={"name": str, "date": str})
+    missing = [
+        c
+        for c in (*_PL_COLUMNS, *_PL_DATA_COLUMNS)
+        if c not in manifest and c not in _PL_OPTIONAL_COLUMNS
+    ]
+    if missing:
+        print(
+            f"{args.manifest}: missing columns: {', '.join(missing)}", file=sys.stderr
+        )
+        return 2
+    rows = [
+        {str(key): value for key, value in record.items()}
+        for record in manifest.to_dict("records")
+    ]
+    names = [
+        name if isinstance(name := row.get("name"), str) and name else f"{i:04d}"
+        for i, row in enumerate(rows)
+    ]
+    if errors := _check_names(names):
+        print(f"{args.manifest}: {'; '.join(errors)}", file=sys.stderr)
+        return 2
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    tasks = []
+    for name, row in zip(names, rows):
+        for column in _PL_DATA_COLUMNS:
+            row[column] = args.manifest.parent / str(row[column])
+        output = args.output_dir / f"{name}.pptx"
+        tasks.append(
+            _PLTask(name, row, output, args.dpi, args.figure_format, args.downsample)
+        )
+    outputs: set[pathlib.Path] = set()
+    for done, (task, err) in enumerate(_run(_build_pl_deck, tasks, args.jobs), 1):
+        progress = f"[{done}/{len(tasks)}]"
+        if err is None:
+            outputs.add(task.output)
+            print(f"{progress} built {task.output}", file=sys.stderr)
+        else:
+            message = f"{type(err).__name__}: {err}"
+            print(f"{progress} failed {task.name}: {message}", file=sys.stderr)
+    n_failed = len(tasks) - sum(task.output in outputs for task in tasks)
+    if args.merge is not None and outputs:
+        paths = [task.output for task in tasks if task.output in outputs]
+        core.merge_presentations(paths, args.merge)
+        print(f"merged {len(paths)} decks into {args.merge}", file=sys.stderr)
+    print(f"{len(tasks) - n_failed} built, {n_failed} failed", file=sys.stderr)
+    return 1 if n_failed else 0
+
+
+def _check_names(names: list[str]) -> list[str]:
+    # The names must be distinct filenames in the output directory,
+    # also on case-insensitive file systems.
+    invalid = [
+        name
+        for name in names
+        if name in (".", "..") or any(sep in name for sep in ("/", "\\"))
+    ]
+    counts = collections.Counter(name.casefold() for name in names)
+    duplicated = [name for name in names if counts[name.casefold()] > 1]
+    errors = []
+    if invalid:
+        errors.append(f"invalid names: {', '.join(invalid)}")
+    if duplicated:
+        errors.append(f"duplicate names: {', '.join(dict.fromkeys(duplicated))}")
+    return errors
+
+
+_T = t.TypeVar("_T")
+
+
+def _run(
+    func: abc.Callable[[_T], None], tasks: list[_T], jobs: int
+) -> abc.Iterator[tuple[_T, Exception | None]]:
+    # Yields each task with its exception, if any, in order of completion.
+    if jobs <= 1:
+        for task in tasks:
+            try:
+                func(task)
+            except Exception as err:
+                yield task, err
+            else:
+                yield task, None
+        return
+    with futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        # Forked workers would share the Kaleido subprocess of the parent.
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        fs = {executor.submit(func, task): task for task in tasks}
+        for future in futures.as_completed(fs):
+            exc = future.exception()
+            yield fs[future], None if exc is None else t.cast(Exception, exc)
+
+
+def _build_pl_deck(task: _PLTask) -> None:
+    from tlab_pptx.presentation import photo_luminescence
+
+    h_fig = _read_figure(task.row["h_data"])
+    v_fig = _read_figure(task.row["v_data"])
+    record = photo_luminescence.Record.from_mapping(
+        {**task.row, "h_fig": h_fig, "v_fig": v_fig}
+    )
+    prs = photo_luminescence.build(
+        **vars(record),
+        dpi=task.dpi,
+        figure_format=task.figure_format,
+        downsample=task.downsample,
+    )
+    prs.save(task.output)
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from tlab_pptx import render, server
+
+    cache = None if args.cache_dir is None else render.RenderCache(args.cache_dir)
+    with server.ReportServer(
+        host=args.host,
+        port=args.port,
+        max_workers=args.jobs,
+        max_builds=args.max_builds,
+        max_pending=args.max_pending,
+        cache=cache,
+    ) as report_server:
+        report_server.warm_up()
+        host, port = report_server.address
+        print(f"serving on http://{host}:{port}", file=sys.stderr)
+        try:
+            report_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def _read_figure(path: pathlib.Path) -> "go.Figure":
+    import pandas as pd
+    import plotly.graph_objects as go
+
+    df = pd.read_csv(path)
+    x = df.columns[0]
+    fig = go.Figure([go.Scatter(x=df[x], y=df[y], name=str(y)) for y in df.columns[1:]])
+    fig.update_xaxes(title=str(x))
+    return fig
@@ -1,3 +1,8 @@
+from .merge import copy_slides as copy_slides
+from .merge import merge_presentations as merge_presentations
+from .merge import read_slide_tags as read_slide_tags
 from .presentation import Presentation as Presentation
 from .presentation import new_presentation as new_presentation
 from .slide import Slide as Slide
+from .slide import TextSpec as TextSpec
+from .writer import PresentationWriter as PresentationWriter
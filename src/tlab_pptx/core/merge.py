@@ -0,0 +1,304 @@
+import dataclasses
+import hashlib
+import os
+import re
+import typing as t
+import zipfile
+from collections import abc
+
+import pptx
+import pptx.opc.constants
+import pptx.opc.oxml
+import pptx.opc.package
+import pptx.opc.packuri
+import pptx.oxml
+import pptx.presentation
+
+from tlab_pptx import profiling, typing
+from tlab_pptx.core import presentation, slide
+
+_RT = pptx.opc.constants.RELATIONSHIP_TYPE
+_RTM = pptx.opc.constants.RELATIONSHIP_TARGET_MODE
+_SKIPPED_RELTYPES = frozenset([_RT.NOTES_SLIDE, _RT.COMMENTS])
+_MEDIA_DIR = "/ppt/media/"
+
+
+def merge_presentations(
+    paths: abc.Iterable[typing.FilePath],
+    filepath_or_buffer: typing.FilePathOrBuffer,
+) -> None:
+    """
+    Merges the slides of many presentations into one.
+
+    The first presentation is used as the base, and the slides of the others
+    are appended in order together with their images, charts and other parts.
+    Each slide inherits the slide layout of the base with the same name,
+    and slide layouts identical to those of the base are not parsed.
+    Identical media are stored once. Notes and comments are not copied.
+
+    Parameters
+    ----------
+    paths : Iterable[tlab_pptx.typing.FilePath]
+        Filepaths of `.pptx` files to be merged.
+    filepath_or_buffer : tlab_pptx.typing.FilePathOrBuffer
+        A filepath string or buffer object to which the merged presentation is saved.
+
+    Raises
+    ------
+    ValueError
+        If no filepath is given,
+        or a slide layout is not found in the first presentation.
+
+    Examples
+    --------
+    >>> merge_presentations(["a.pptx", "b.pptx"], "merged.pptx")  # doctest: +SKIP
+    """
+    paths = list(paths)
+    if not paths:
+        raise ValueError("no presentation to be merged")
+    base, *others = paths
+    prs = pptx.Presentation(os.fspath(base))
+    assert isinstance(prs, pptx.presentation.Presentation)
+    merger = _Merger(prs)
+    for path in others:
+        with profiling.span("merge") as recorder:
+            recorder.nbytes = merger.append(path)
+    prs.save(filepath_or_buffer)
+
+
+def copy_slides(
+    prs: presentation.Presentation,
+    filepath: typing.FilePath,
+    indices: abc.Iterable[int],
+) -> list[slide.Slide]:
+    """
+    Copies slides of a `.pptx` file to the end of a presentation as they are.
+
+    The slides are copied in the same way as `merge_presentations`,
+    so their parts are saved byte for byte as in the file.
+
+    Parameters
+    ----------
+    prs : tlab_pptx.core.presentation.Presentation
+        A presentation to which the slides are added.
+    filepath : tlab_pptx.typing.FilePath
+        A filepath of a `.pptx` file.
+    indices : Iterable[int]
+        The indices of the slides to be copied in the file.
+
+    Returns
+    -------
+    list[tlab_pptx.core.slide.Slide]
+        The copied slides in order.
+
+    Raises
+    ------
+    ValueError
+        If a slide layout is not found in `prs`.
+    """
+    merger = _Merger(prs._prs)
+    with zipfile.ZipFile(filepath) as z:
+        source = _Source(z)
+        partnames = source.get_slide_partnames()
+        copied: dict[str, pptx.opc.package.Part] = {}
+        slide_parts = [merger._copy(source, partnames[i], copied) for i in indices]
+    for slide_part in slide_parts:
+        merger._add_slide(slide_part)
+    slides = prs.slides
+    return list(slides[len(slides) - len(slide_parts) :])
+
+
+def read_slide_tags(filepath: typing.FilePath, name: str) -> list[str | None]:
+    """
+    Reads the value of a tag of each slide in a `.pptx` file
+    without loading the presentation (see `tlab_pptx.core.Slide.get_tag`).
+
+    Parameters
+    ----------
+    filepath : tlab_pptx.typing.FilePath
+        A filepath of a `.pptx` file.
+    name : str
+        The name of a tag.
+
+    Returns
+    -------
+    list[str | None]
+        The values of the tag in the order of the slides,
+        which are None for the slides without the tag.
+    """
+    values: list[str | None] = []
+    with zipfile.ZipFile(filepath) as z:
+        source = _Source(z)
+        for partname in source.get_slide_partnames():
+            value: str | None = None
+            for rel in source.get_rels(partname):
+                if rel.reltype != _RT.TAGS or rel.targetMode == _RTM.EXTERNAL:
+                    continue
+                tags_partname = pptx.opc.packuri.PackURI.from_rel_ref(
+                    partname.baseURI, rel.target_ref
+                )
+                tag_lst = pptx.oxml.parse_xml(source.read(tags_partname))
+                tag = slide._find_tag(tag_lst, name)
+                if tag is not None:
+                    value = tag.get("val")
+                    break
+            values.append(value)
+    return values
+
+
+@dataclasses.dataclass()
+class _Merger:
+    prs: pptx.presentation.Presentation
+    _indices: dict[str, int] = dataclasses.field(default_factory=dict)
+    _media: dict[str, pptx.opc.package.Part] = dataclasses.field(default_factory=dict)
+    _layouts: dict[bytes, pptx.opc.package.Part] = dataclasses.field(
+        default_factory=dict
+    )
+    _next_slide_id: int = 256
+
+    def __post_init__(self) -> None:
+        for part in self.prs.part.package.iter_parts():
+            self._reserve_partname(part.partname)
+            if part.partname.startswith(_MEDIA_DIR):
+                self._media[hashlib.sha1(part.blob).hexdigest()] = part
+        for master in self.prs.slide_masters:
+            for layout in master.slide_layouts:
+                self._layouts.setdefault(layout.part.blob, layout.part)
+        ids = [sld_id.id for sld_id in self.prs.slides._sldIdLst.sldId_lst]
+        self._next_slide_id = max([255, *ids]) + 1
+
+    def append(self, path: typing.FilePath) -> int:
+        """Appends the slides of a presentation and returns the size of the file."""
+        with zipfile.ZipFile(path) as z:
+            source = _Source(z)
+            copied: dict[str, pptx.opc.package.Part] = {}
+            for partname in source.get_slide_partnames():
+                self._add_slide(self._copy(source, partname, copied))
+        return os.path.getsize(path)
+
+    def _add_slide(self, slide_part: pptx.opc.package.Part) -> None:
+        # Adds relationships and slide ids in O(1) instead of searching them.
+        rId = self.prs.part.rels._add_relationship(_RT.SLIDE, slide_part)
+        self.prs.slides._sldIdLst._add_sldId(id=self._next_slide_id, rId=rId)
+        self._next_slide_id += 1
+
+    def _copy(
+        self,
+        source: "_Source",
+        partname: pptx.opc.packuri.PackURI,
+        copied: dict[str, pptx.opc.package.Part],
+    ) -> pptx.opc.package.Part:
+        if (part := copied.get(partname)) is not None:
+            return part
+        blob = source.read(partname)
+        digest = hashlib.sha1(blob).hexdigest()
+        is_media = partname.startswith(_MEDIA_DIR)
+        if is_media and (part := self._media.get(digest)) is not None:
+            copied[partname] = part
+            return part
+        part = pptx.opc.package.PartFactory(
+            self._next_partname(partname),
+            source.content_types[partname],
+            self.prs.part.package,
+            blob,
+        )
+        copied[partname] = part
+        if is_media:
+            self._media[digest] = part
+            slide._register_image_part(self.prs.part.package, part, digest)
+        rels = part.rels
+        for rel in source.get_rels(partname):
+            target: pptx.opc.package.Part | str
+            if rel.targetMode == _RTM.EXTERNAL:
+                target = rel.target_ref
+            elif rel.reltype in _SKIPPED_RELTYPES:
+                continue
+            else:
+                target_partname = pptx.opc.packuri.PackURI.from_rel_ref(
+                    partname.baseURI, rel.target_ref
+                )
+                if target_partname not in source:
+                    continue
+                if rel.reltype == _RT.SLIDE_LAYOUT:
+                    target = self._get_layout(source, target_partname)
+                else:
+                    target = self._copy(source, target_partname, copied)
+            # Keeps the rIds since the part refers to its relationships by them.
+            rels._rels[rel.rId] = pptx.opc.package._Relationship(
+                rels._base_uri, rel.rId, rel.reltype, rel.targetMode, target
+            )
+        return part
+
+    def _get_layout(
+        self, source: "_Source", partname: pptx.opc.packuri.PackURI
+    ) -> pptx.opc.package.Part:
+        blob = source.read(partname)
+        if (part := self._layouts.get(blob)) is None:
+            name = pptx.oxml.parse_xml(blob).cSld.name
+            for master in self.prs.slide_masters:
+                if (layout := master.slide_layouts.get_by_name(name)) is not None:
+                    part = self._layouts[blob] = layout.part
+                    break
+            else:
+                raise ValueError(
+                    f"slide layout `{name}` is not found in the first presentation"
+                )
+        return part
+
+    def _next_partname(
+        self, partname: pptx.opc.packuri.PackURI
+    ) -> pptx.opc.packuri.PackURI:
+        template, _ = _split_partname(partname)
+        idx = self._indices[template] = self._indices.get(template, 0) + 1
+        return pptx.opc.packuri.PackURI(template % idx)
+
+    def _reserve_partname(self, partname: pptx.opc.packuri.PackURI) -> None:
+        template, idx = _split_partname(partname)
+        self._indices[template] = max(self._indices.get(template, 0), idx)
+
+
+@dataclasses.dataclass()
+class _Source:
+    """A `.pptx` file whose parts are read on demand."""
+
+    _zip: zipfile.ZipFile
+    _names: frozenset[str] = dataclasses.field(init=False)
+    content_types: t.Any = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        self._names = frozenset(self._zip.namelist())
+        self.content_types = pptx.opc.package._ContentTypeMap.from_xml(
+            self._zip.read("[Content_Types].xml")
+        )
+
+    def __contains__(self, partname: pptx.opc.packuri.PackURI) -> bool:
+        return partname.membername in self._names
+
+    def read(self, partname: pptx.opc.packuri.PackURI) -> bytes:
+        return self._zip.read(partname.membername)
+
+    def get_slide_partnames(self) -> list[pptx.opc.packuri.PackURI]:
+        prs_partname = pptx.opc.packuri.PackURI("/ppt/presentation.xml")
+        prs_rels = {rel.rId: rel for rel in self.get_rels(prs_partname)}
+        prs_element = pptx.oxml.parse_xml(self.read(prs_partname))
+        return [
+            pptx.opc.packuri.PackURI.from_rel_ref(
+                prs_partname.baseURI, prs_rels[sld_id.rId].target_ref
+            )
+            for sld_id in prs_element.sldIdLst.sldId_lst
+        ]
+
+    def get_rels(self, partname: pptx.opc.packuri.PackURI) -> list[t.Any]:
+        membername = partname.rels_uri.membername
+        if membername not in self._names:
+            return []
+        rels = pptx.opc.oxml.parse_xml(self._zip.read(membername)).relationship_lst
+        assert isinstance(rels, list)
+        return rels
+
+
+def _split_partname(partname: str) -> tuple[str, int]:
+    match = re.fullmatch(r"(.*?)(\d*)(\.\w+)?", partname)
+    assert match is not None
+    head, digits, ext = match.groups()
+    return f"{head}%d{ext or ''}", int(digits or 0)
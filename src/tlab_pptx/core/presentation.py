@@ -1,11 +1,17 @@
+import asyncio
 import dataclasses
+import functools
+import os
+import typing as t
+from collections import abc
 
 import pptx
+import pptx.opc.package
 import pptx.presentation
 import pptx.slide
 
 from tlab_pptx import pptx as tpptx
-from tlab_pptx import typing
+from tlab_pptx import profiling, typing
 from tlab_pptx.core import slide
 
 
@@ -17,8 +23,16 @@ class Presentation:
 
     _prs: pptx.presentation.Presentation
     """The internal presentation."""
+    figure_format: typing.FigureFormat = "png"
+    """The default format in which figures are embedded in the slides."""
+    _slides: dict[pptx.opc.package.Part, slide.Slide] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _slide_ids: dict[int, t.Any] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    @property
+    @functools.cached_property
     def slide_layouts(self) -> tuple[pptx.slide.SlideLayout, ...]:
         """
         A tuple of slide layouts belonging to the first slide master.
@@ -26,33 +40,105 @@ class Presentation:
         return tuple(self._prs.slide_layouts)
 
     @property
-    def slides(self) -> tuple[slide.Slide, ...]:
+    def slides(self) -> "SlideView":
         """
-        A tuple of slides in the presentation.
+        A sequence of slides in the presentation.
         """
-        return tuple(map(slide.Slide, self._prs.slides))
+        return SlideView(self)
 
-    def add_slide(self, layout_idx: int | None = None) -> slide.Slide:
+    def get_layout_by_name(self, name: str) -> pptx.slide.SlideLayout | None:
+        """
+        Gets a slide layout by its name.
+
+        Parameters
+        ----------
+        name : str
+            The name of a slide layout such as `Title Slide`.
+
+        Returns
+        -------
+        pptx.slide.SlideLayout | None
+            The first slide layout with the name, or None if there is no such layout.
+        """
+        idx = self._layout_indices.get(name)
+        return None if idx is None else self.slide_layouts[idx]
+
+    def add_slide(self, layout_idx: int | str | None = None) -> slide.Slide:
         """
         Creates a new slide and add it to the presentation.
 
         Parameters
         ----------
-        layout_idx : int
-            An index of Presentation.slide_layouts to be inherited by the slide.
+        layout_idx : int | str
+            An index of Presentation.slide_layouts or the name of a slide layout
+            to be inherited by the slide.
 
         Returns
         -------
         tlab_pptx.core.slide.Slide
             A new slide.
+
+        Raises
+        ------
+        KeyError
+            If there is no slide layout with the name.
         """
         if layout_idx is None:
             layout_idx = 0
+        if isinstance(layout_idx, str):
+            layout_idx = self._layout_indices[layout_idx]
         slides = self._prs.slides
         assert isinstance(slides, pptx.slide.Slides)
         sld = slides.add_slide(self.slide_layouts[layout_idx])
         assert isinstance(sld, pptx.slide.Slide)
-        return slide.Slide(sld)
+        new_slide = slide.Slide(sld, self.figure_format)
+        self._slides[sld.part] = new_slide
+        return new_slide
+
+    def remove_slide(self, sld: slide.Slide) -> None:
+        """
+        Removes a slide from the presentation.
+
+        Parameters
+        ----------
+        sld : tlab_pptx.core.slide.Slide
+            A slide in the presentation.
+
+        Raises
+        ------
+        ValueError
+            If the slide is not in the presentation.
+        """
+        sld_id = self._get_sld_ids().get(id(sld))
+        if sld_id is None:
+            raise ValueError(f"{sld} is not in the presentation")
+        self._slides.pop(sld._slide.part, None)
+        self._slide_ids.pop(sld_id.id, None)
+        self._prs.slides._sldIdLst.remove(sld_id)
+        self._prs.part.drop_rel(sld_id.rId)
+
+    def reorder_slides(self, slides: abc.Iterable[slide.Slide]) -> None:
+        """
+        Reorders the slides of the presentation.
+
+        Parameters
+        ----------
+        slides : Iterable[tlab_pptx.core.slide.Slide]
+            All the slides in the presentation in a new order.
+
+        Raises
+        ------
+        ValueError
+            If `slides` is not a permutation of the slides in the presentation.
+        """
+        slides = list(slides)
+        sld_ids = self._get_sld_ids()
+        if sorted(map(id, slides)) != sorted(sld_ids):
+            raise ValueError("slides must be a permutation of the slides")
+        sld_id_lst = self._prs.slides._sldIdLst
+        for sld in slides:
+            # Appending an element moves it to the end.
+            sld_id_lst.append(sld_ids[id(sld)])
 
     def save(self, filepath_or_buffer: typing.FilePathOrBuffer) -> None:
         """
@@ -63,11 +149,138 @@ class Presentation:
         filepath_or_buffer : tlab_pptx.typing.FilePathOrBuffer
             A filepath string or buffer object to which the presentation is saved.
         """
-        self._prs.save(filepath_or_buffer)
+        with profiling.span("save") as recorder:
+            self._prs.save(filepath_or_buffer)
+            if recorder.enabled:
+                recorder.nbytes = (
+                    os.path.getsize(filepath_or_buffer)
+                    if isinstance(filepath_or_buffer, str | os.PathLike)
+                    else filepath_or_buffer.tell()
+                )
+
+    async def save_async(self, filepath_or_buffer: typing.FilePathOrBuffer) -> None:
+        """
+        Saves as a `pptx` file in a thread without blocking the event loop.
+
+        The presentation must not be modified until saving is completed.
+
+        Parameters
+        ----------
+        filepath_or_buffer : tlab_pptx.typing.FilePathOrBuffer
+            A filepath string or buffer object to which the presentation is saved.
+        """
+        await asyncio.to_thread(self.save, filepath_or_buffer)
+
+    @functools.cached_property
+    def _layout_indices(self) -> dict[str, int]:
+        indices: dict[str, int] = {}
+        for i, layout in enumerate(self.slide_layouts):
+            indices.setdefault(layout.name, i)
+        return indices
+
+    def _get_sld_ids(self) -> dict[int, t.Any]:
+        # Maps the id of each slide wrapper to its `p:sldId` element.
+        return {
+            id(self._get_slide(sld_id)): sld_id
+            for sld_id in self._prs.slides._sldIdLst.sldId_lst
+        }
+
+    def _get_slide(self, sld_id: t.Any) -> slide.Slide:
+        # Wrappers are keyed by the slide parts rather than by positions,
+        # so they stay valid when slides are reordered or replaced
+        # through python-pptx.
+        part = self._prs.part.related_part(sld_id.rId)
+        wrapper = self._slides.get(part)
+        if wrapper is None:
+            wrapper = slide.Slide(part.slide, self.figure_format)
+            self._slides[part] = wrapper
+        return wrapper
+
+    def _sync_slides(self) -> list[slide.Slide]:
+        # Wraps all the slides and drops the wrappers of removed slides.
+        sld_ids = self._prs.slides._sldIdLst.sldId_lst
+        slides = [self._get_slide(sld_id) for sld_id in sld_ids]
+        self._slides = {sld._slide.part: sld for sld in slides}
+        self._slide_ids = {sld_id.id: sld_id for sld_id in sld_ids}
+        return slides
+
+
+@dataclasses.dataclass(frozen=True)
+class SlideView(abc.Sequence[slide.Slide]):
+    """
+    A lazy sequence of the slides in a presentation.
+
+    The wrapper of each slide is created once and reused,
+    so indexing does not wrap the other slides even on large presentations.
+    The view follows slides added, removed or reordered through python-pptx.
+    """
+
+    _prs: Presentation
+    """The presentation of the slides."""
+
+    def __len__(self) -> int:
+        return len(self._prs._prs.slides._sldIdLst)
+
+    @t.overload
+    def __getitem__(self, index: int) -> slide.Slide: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> tuple[slide.Slide, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> slide.Slide | tuple[slide.Slide, ...]:
+        sld_ids = self._prs._prs.slides._sldIdLst
+        if isinstance(index, slice):
+            return tuple(map(self._prs._get_slide, sld_ids[index]))
+        return self._prs._get_slide(sld_ids[index])
+
+    def __iter__(self) -> abc.Iterator[slide.Slide]:
+        return iter(self._prs._sync_slides())
+
+    def get_by_id(self, slide_id: int) -> slide.Slide | None:
+        """
+        Gets a slide by its id.
+
+        Parameters
+        ----------
+        slide_id : int
+            The id of a slide, which is unique in the presentation.
+
+        Returns
+        -------
+        tlab_pptx.core.slide.Slide | None
+            The slide with the id, or None if there is no such slide.
+        """
+        sld_id = self._prs._slide_ids.get(slide_id)
+        sld_id_lst = self._prs._prs.slides._sldIdLst
+        if sld_id is None or sld_id.getparent() is not sld_id_lst:
+            self._prs._sync_slides()
+            sld_id = self._prs._slide_ids.get(slide_id)
+        return None if sld_id is None else self._prs._get_slide(sld_id)
+
+    def get_by_title(self, title: str) -> slide.Slide | None:
+        """
+        Gets a slide by its title text.
+
+        Parameters
+        ----------
+        title : str
+            The title text of a slide.
+
+        Returns
+        -------
+        tlab_pptx.core.slide.Slide | None
+            The first slide with the title, or None if there is no such slide.
+        """
+        for sld in self._prs._sync_slides():
+            shape = sld._slide.shapes.title
+            if shape is not None and shape.text_frame.text == title:
+                return sld
+        return None
 
 
 def new_presentation(
     filepath_or_buffer: typing.FilePathOrBuffer | None = None,
+    figure_format: typing.FigureFormat = "png",
 ) -> Presentation:
     """
     Creates a new presentation.
@@ -77,6 +290,9 @@ def new_presentation(
     filepath_or_buffer : tlab_pptx.typing.FilePathOrBuffer | None
         A filepath string or buffer object of a `.pptx` file as a base.
         if None (default), `tlab_pptx.pptx.DEFAULT_PPTX` is used.
+        A filepath is parsed once per process (see `tlab_pptx.pptx.load_pptx`).
+    figure_format : tlab_pptx.typing.FigureFormat
+        The default format in which figures are embedded in the slides.
 
     Returns
     -------
@@ -85,6 +301,9 @@ def new_presentation(
     """
     if filepath_or_buffer is None:
         filepath_or_buffer = tpptx.DEFAULT_PPTX
-    prs = pptx.Presentation(filepath_or_buffer)
+    if isinstance(filepath_or_buffer, str | os.PathLike):
+        prs = tpptx.load_pptx(filepath_or_buffer)
+    else:
+        prs = pptx.Presentation(filepath_or_buffer)
     assert isinstance(prs, pptx.presentation.Presentation)
-    return Presentation(prs)
+    return Presentation(prs, figure_format)
@@ -1,14 +1,35 @@
+import asyncio
 import dataclasses
-import io
+import functools
+import hashlib
+import re
+import typing as t
+import weakref
+from collections import abc
+from xml.sax import saxutils
 
 import plotly.graph_objects as go
 import pptx
+import pptx.chart.chart
+import pptx.enum.chart
+import pptx.enum.text
+import pptx.opc.constants
+import pptx.opc.oxml
+import pptx.opc.package
+import pptx.opc.packuri
+import pptx.opc.spec
+import pptx.oxml
+import pptx.oxml.ns
+import pptx.oxml.text
+import pptx.parts.image
 import pptx.shapes.autoshape
 import pptx.shapes.placeholder
 import pptx.shapes.shapetree
 import pptx.slide
 import pptx.util
 
+from tlab_pptx import chart, profiling, render, typing
+
 
 @dataclasses.dataclass()
 class Slide:
@@ -18,6 +39,8 @@ class Slide:
 
     _slide: pptx.slide.Slide
     """The internal slide."""
+    figure_format: typing.FigureFormat = "png"
+    """The default format in which figures are embedded."""
 
     def update_title(
         self,
@@ -128,6 +151,46 @@ class Slide:
             paragraph.font.italic = font_italic
         return self
 
+    def add_texts(self, specs: abc.Iterable["TextSpec"]) -> "Slide":
+        """
+        Adds texts to the slide at once.
+
+        The textboxes are the same as those added by `Slide.add_text`,
+        but their XML is built and parsed in one pass,
+        which is much faster for many texts.
+
+        Parameters
+        ----------
+        specs : Iterable[tlab_pptx.core.slide.TextSpec]
+            Specifications of the texts to be added.
+
+        Returns
+        -------
+        tlab_pptx.core.slide.Slide
+            Itself.
+
+        Examples
+        --------
+        >>> slide.add_texts(  # doctest: +SKIP
+        ...     TextSpec(f"{name} : {value}", left=1.0, top=2.0 + i)
+        ...     for i, (name, value) in enumerate(params.items())
+        ... )
+        """
+        shapes = self._slide.shapes
+        assert isinstance(shapes, pptx.shapes.shapetree.SlideShapes)
+        shape_id = shapes._next_shape_id
+        xml = "".join(
+            _get_textbox_xml(spec, shape_id + i) for i, spec in enumerate(specs)
+        )
+        if not xml:
+            return self
+        sp_tree = shapes._spTree
+        for element in pptx.oxml.parse_xml(
+            f"<p:spTree {pptx.oxml.ns.nsdecls('p', 'a')}>{xml}</p:spTree>"
+        ):
+            sp_tree.insert_element_before(element, "p:extLst")
+        return self
+
     def add_figure(
         self,
         fig: go.Figure,
@@ -135,6 +198,10 @@ class Slide:
         top: float,
         width: float = 11.5,
         height: float = 11.5,
+        cache: render.RenderCache | None = None,
+        dpi: float | typing.Quality | None = None,
+        figure_format: typing.FigureFormat | None = None,
+        optimize: typing.PngOptimization | None = None,
     ) -> "Slide":
         """
         Adds a figure to the slide.
@@ -151,20 +218,563 @@ class Slide:
             The width of the figure in centimeter.
         height : float
             The height of the figure in centimeter.
+        cache : tlab_pptx.render.RenderCache | None
+            A cache of rendered images.
+            If None (default), the figure is rendered every time.
+        dpi : float | tlab_pptx.typing.Quality | None
+            The resolution of the rendered image in DPI or a quality profile
+            (`draft`, `screen` or `print`) for the size on the slide.
+            If None (default), the figure is rendered at 10 times its layout size.
+            For `svg`, this is the resolution of the fallback image
+            and defaults to `draft`.
+        figure_format : tlab_pptx.typing.FigureFormat | None
+            The format in which the figure is embedded.
+            `png` embeds a raster image, `svg` embeds a vector image
+            with a PNG fallback for viewers without SVG support
+            and `chart` converts the figure to a native chart (see `Slide.add_chart`).
+            If None (default), `Slide.figure_format` is used.
+        optimize : tlab_pptx.typing.PngOptimization | None
+            The level at which the rendered PNG image is optimized
+            (see `tlab_pptx.render.optimize_png`).
+            If None (default), the image is embedded as rendered.
+
+        Returns
+        -------
+        tlab_pptx.core.slide.Slide
+            Itself.
+        """
+        if figure_format is None:
+            figure_format = self.figure_format
+        if figure_format == "chart":
+            return self.add_chart(fig, left, top, width=width, height=height)
+        if figure_format == "svg":
+            svg = render.to_image(fig, "svg", scale=1, cache=cache)
+            scale = render.get_scale(fig, width, height, dpi or "draft")
+            fallback = render.to_image(fig, "png", scale=scale, cache=cache)
+            if optimize is not None:
+                fallback = render.optimize_png(fallback, optimize)
+            return self.add_svg(svg, fallback, left, top, width=width, height=height)
+        scale = 10.0 if dpi is None else render.get_scale(fig, width, height, dpi)
+        image = render.to_image(fig, "png", scale=scale, cache=cache)
+        if optimize is not None:
+            image = render.optimize_png(image, optimize)
+        return self.add_image(image, left, top, width=width, height=height)
+
+    async def add_figure_async(
+        self,
+        fig: go.Figure,
+        left: float,
+        top: float,
+        width: float = 11.5,
+        height: float = 11.5,
+        cache: render.RenderCache | None = None,
+        dpi: float | typing.Quality | None = None,
+        figure_format: typing.FigureFormat | None = None,
+        pool: render.RenderPool | None = None,
+        optimize: typing.PngOptimization | None = None,
+    ) -> "Slide":
+        """
+        Adds a figure to the slide without blocking the event loop.
+
+        The figure is rendered in a thread or in a pool,
+        and the picture is added to the slide in the event loop.
+
+        Parameters
+        ----------
+        fig : plotly.graph_objects.Figure
+            A figure to be added.
+        left : float
+            The left position of the figure in centimeter.
+        top : float
+            The top position of the figure in centimeter.
+        width : float
+            The width of the figure in centimeter.
+        height : float
+            The height of the figure in centimeter.
+        cache : tlab_pptx.render.RenderCache | None
+            A cache of rendered images.
+            If None (default), the figure is rendered every time.
+        dpi : float | tlab_pptx.typing.Quality | None
+            The resolution of the rendered image (see `Slide.add_figure`).
+        figure_format : tlab_pptx.typing.FigureFormat | None
+            The format in which the figure is embedded (see `Slide.add_figure`).
+        pool : tlab_pptx.render.RenderPool | None
+            A pool in which the figure is rendered.
+            If None (default), the figure is rendered in a thread.
+        optimize : tlab_pptx.typing.PngOptimization | None
+            The level at which the rendered PNG image is optimized
+            in a thread (see `Slide.add_figure`).
+
+        Returns
+        -------
+        tlab_pptx.core.slide.Slide
+            Itself.
+        """
+        if figure_format is None:
+            figure_format = self.figure_format
+        if figure_format == "chart":
+            return self.add_chart(fig, left, top, width=width, height=height)
+        if figure_format == "svg":
+            scale = render.get_scale(fig, width, height, dpi or "draft")
+            svg, fallback = await asyncio.gather(
+                render.to_image_async(fig, "svg", 1, cache, pool),
+                render.to_image_async(fig, "png", scale, cache, pool),
+            )
+            if optimize is not None:
+                fallback = await asyncio.to_thread(
+                    render.optimize_png, fallback, optimize
+                )
+            return self.add_svg(svg, fallback, left, top, width=width, height=height)
+        scale = 10.0 if dpi is None else render.get_scale(fig, width, height, dpi)
+        image = await render.to_image_async(fig, "png", scale, cache, pool)
+        if optimize is not None:
+            image = await asyncio.to_thread(render.optimize_png, image, optimize)
+        return self.add_image(image, left, top, width=width, height=height)
+
+    def add_image(
+        self,
+        image: bytes,
+        left: float,
+        top: float,
+        width: float = 11.5,
+        height: float = 11.5,
+    ) -> "Slide":
+        """
+        Adds an image to the slide.
+
+        This is useful to place figures rendered in advance,
+        for example by `tlab_pptx.render.RenderPool`.
+        The bytes are stored in the package as they are without being copied,
+        and an image already in the package is looked up by its hash
+        instead of comparing it with every image.
+
+        Parameters
+        ----------
+        image : bytes
+            An image such as PNG to be added.
+        left : float
+            The left position of the image in centimeter.
+        top : float
+            The top position of the image in centimeter.
+        width : float
+            The width of the image in centimeter.
+        height : float
+            The height of the image in centimeter.
 
         Returns
         -------
         tlab_pptx.core.slide.Slide
             Itself.
         """
+        with profiling.span("insert_picture") as recorder:
+            self._add_picture(image, left, top, width, height)
+            recorder.nbytes = len(image)
+        return self
+
+    def add_svg(
+        self,
+        svg: bytes,
+        fallback: bytes,
+        left: float,
+        top: float,
+        width: float = 11.5,
+        height: float = 11.5,
+    ) -> "Slide":
+        """
+        Adds an SVG image to the slide.
+
+        The SVG image is embedded as PowerPoint 2016 and later does,
+        with a raster image shown by viewers without SVG support.
+
+        Parameters
+        ----------
+        svg : bytes
+            An SVG image to be added.
+        fallback : bytes
+            A raster image such as PNG shown instead of the SVG image.
+        left : float
+            The left position of the image in centimeter.
+        top : float
+            The top position of the image in centimeter.
+        width : float
+            The width of the image in centimeter.
+        height : float
+            The height of the image in centimeter.
+
+        Returns
+        -------
+        tlab_pptx.core.slide.Slide
+            Itself.
+        """
+        with profiling.span("insert_svg") as recorder:
+            pic = self._add_picture(fallback, left, top, width, height)
+            slide_part = self._slide.part
+            rId = slide_part.relate_to(
+                _get_or_add_image_part(slide_part.package, svg, ext="svg"),
+                pptx.opc.constants.RELATIONSHIP_TYPE.IMAGE,
+            )
+            pic.blipFill.blip.append(
+                pptx.oxml.parse_xml(
+                    f"<a:extLst {pptx.oxml.ns.nsdecls('a', 'r')}>"
+                    f'<a:ext uri="{_SVG_BLIP_EXT_URI}">'
+                    f'<asvg:svgBlip xmlns:asvg="{_SVG_NS}" r:embed="{rId}"/>'
+                    "</a:ext>"
+                    "</a:extLst>"
+                )
+            )
+            recorder.nbytes = len(svg) + len(fallback)
+        return self
+
+    def add_chart(
+        self,
+        fig: go.Figure,
+        left: float,
+        top: float,
+        width: float = 11.5,
+        height: float = 11.5,
+    ) -> "Slide":
+        """
+        Adds a figure to the slide as a native chart without rendering.
+
+        The scatter traces of the figure are converted to an XY scatter chart
+        formatted like the figure (see `tlab_pptx.chart.format_chart`),
+        and annotations relative to the paper are added as texts.
+
+        Parameters
+        ----------
+        fig : plotly.graph_objects.Figure
+            A figure with only scatter traces on a single pair of axes.
+        left : float
+            The left position of the chart in centimeter.
+        top : float
+            The top position of the chart in centimeter.
+        width : float
+            The width of the chart in centimeter.
+        height : float
+            The height of the chart in centimeter.
+
+        Returns
+        -------
+        tlab_pptx.core.slide.Slide
+            Itself.
+
+        Raises
+        ------
+        ValueError
+            If the figure has a trace which cannot be converted.
+        """
         shapes = self._slide.shapes
         assert isinstance(shapes, pptx.shapes.shapetree.SlideShapes)
-        with io.BytesIO(fig.to_image("png", scale=10)) as f:
-            shapes.add_picture(
-                f,
-                left=pptx.util.Cm(left),
-                top=pptx.util.Cm(top),
-                width=pptx.util.Cm(width),
-                height=pptx.util.Cm(height),
+        with profiling.span("insert_chart"):
+            frame = shapes.add_chart(
+                pptx.enum.chart.XL_CHART_TYPE.XY_SCATTER_LINES_NO_MARKERS,
+                x=pptx.util.Cm(left),
+                y=pptx.util.Cm(top),
+                cx=pptx.util.Cm(width),
+                cy=pptx.util.Cm(height),
+                chart_data=chart.get_chart_data(fig),
+            )
+            assert isinstance(frame.chart, pptx.chart.chart.Chart)
+            chart.format_chart(frame.chart, fig, width)
+        for annotation in chart.get_paper_annotations(fig, width):
+            box_width, box_height = width / 2, 1.0
+            box_left = left + annotation["x"] * width
+            if annotation["x"] > 2 / 3:
+                box_left -= box_width
+            elif annotation["x"] > 1 / 3:
+                box_left -= box_width / 2
+            box_top = top + (1 - annotation["y"]) * height - box_height / 2
+            box_top = min(max(box_top, top), top + height - box_height)
+            self.add_text(
+                annotation["text"],
+                left=box_left,
+                top=box_top,
+                width=box_width,
+                height=box_height,
+                font_size=round(annotation["font_size"]),
+            )
+            textbox = shapes[-1]
+            assert isinstance(textbox, pptx.shapes.autoshape.Shape)
+            alignment = (
+                pptx.enum.text.PP_ALIGN.RIGHT
+                if annotation["x"] > 2 / 3
+                else pptx.enum.text.PP_ALIGN.CENTER
+                if annotation["x"] > 1 / 3
+                else pptx.enum.text.PP_ALIGN.LEFT
             )
+            for paragraph in textbox.text_frame.paragraphs:
+                paragraph.alignment = alignment
         return self
+
+    def get_tag(self, name: str) -> str | None:
+        """
+        Gets the value of a tag of the slide.
+
+        Tags are hidden name-value pairs saved with the slide.
+
+        Parameters
+        ----------
+        name : str
+            The name of a tag.
+
+        Returns
+        -------
+        str | None
+            The value of the tag, or None if the slide has no such tag.
+        """
+        part = self._get_tags_part()
+        if part is None:
+            return None
+        tag = _find_tag(pptx.oxml.parse_xml(part.blob), name)
+        return None if tag is None else tag.get("val")
+
+    def set_tag(self, name: str, value: str) -> "Slide":
+        """
+        Sets the value of a tag of the slide.
+
+        Parameters
+        ----------
+        name : str
+            The name of a tag.
+        value : str
+            The value of the tag.
+
+        Returns
+        -------
+        tlab_pptx.core.slide.Slide
+            Itself.
+        """
+        part = self._get_tags_part() or self._add_tags_part()
+        tag_lst = pptx.oxml.parse_xml(part.blob)
+        tag = _find_tag(tag_lst, name)
+        if tag is None:
+            tag = tag_lst.makeelement(pptx.oxml.ns.qn("p:tag"), name=name)
+            tag_lst.append(tag)
+        tag.set("val", value)
+        part._blob = pptx.opc.oxml.serialize_part_xml(tag_lst)
+        return self
+
+    def _add_picture(
+        self, image: bytes, left: float, top: float, width: float, height: float
+    ) -> t.Any:
+        # Hands the bytes to a new image part without python-pptx reading them
+        # from a file object and searching the package (see `_ImageParts`).
+        shapes = self._slide.shapes
+        assert isinstance(shapes, pptx.shapes.shapetree.SlideShapes)
+        slide_part = self._slide.part
+        image_part = _get_or_add_image_part(slide_part.package, image)
+        rId = slide_part.relate_to(
+            image_part, pptx.opc.constants.RELATIONSHIP_TYPE.IMAGE
+        )
+        return shapes._add_pic_from_image_part(
+            image_part,
+            rId,
+            pptx.util.Cm(left),
+            pptx.util.Cm(top),
+            pptx.util.Cm(width),
+            pptx.util.Cm(height),
+        )
+
+    def _get_tags_part(self) -> pptx.opc.package.Part | None:
+        c_sld = self._slide._element.cSld
+        tags = c_sld.find("p:custDataLst/p:tags", _NSMAP)
+        if tags is None:
+            return None
+        part = self._slide.part.related_part(tags.get(pptx.oxml.ns.qn("r:id")))
+        assert isinstance(part, pptx.opc.package.Part)
+        return part
+
+    def _add_tags_part(self) -> pptx.opc.package.Part:
+        slide_part = self._slide.part
+        package = slide_part.package
+        part = pptx.opc.package.Part(
+            package.next_partname("/ppt/tags/tag%d.xml"),
+            pptx.opc.constants.CONTENT_TYPE.PML_TAGS,
+            package,
+            _EMPTY_TAGS_XML,
+        )
+        rId = slide_part.relate_to(part, pptx.opc.constants.RELATIONSHIP_TYPE.TAGS)
+        c_sld = self._slide._element.cSld
+        cust_data_lst = c_sld.find("p:custDataLst", _NSMAP)
+        if cust_data_lst is None:
+            cust_data_lst = pptx.oxml.parse_xml(
+                f'<p:custDataLst {pptx.oxml.ns.nsdecls("p")}/>'
+            )
+            c_sld.insert_element_before(cust_data_lst, "p:controls", "p:extLst")
+        tags = pptx.oxml.ns.qn("p:tags")
+        cust_data_lst.append(
+            cust_data_lst.makeelement(tags, {pptx.oxml.ns.qn("r:id"): rId})
+        )
+        return part
+
+
+@dataclasses.dataclass(frozen=True)
+class TextSpec:
+    """
+    A specification of a text added by `Slide.add_texts`.
+
+    The fields are the same as the parameters of `Slide.add_text`.
+    """
+
+    text: str
+    left: float
+    top: float
+    width: float = 6.0
+    height: float = 4.0
+    font_name: str = "Arial"
+    font_size: int = 18
+    font_bold: bool = False
+    font_italic: bool = False
+
+
+def _get_textbox_xml(spec: TextSpec, shape_id: int) -> str:
+    paragraph_properties = _get_paragraph_properties_xml(
+        spec.font_name, spec.font_size, spec.font_bold, spec.font_italic
+    )
+    paragraphs = "".join(
+        f"<a:p>{paragraph_properties}{_get_runs_xml(text)}</a:p>"
+        for text in spec.text.split("\n")
+    )
+    return (
+        "<p:sp>"
+        f'<p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {shape_id - 1}"/>'
+        '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        "<p:spPr>"
+        f'<a:xfrm><a:off x="{pptx.util.Cm(spec.left)}" y="{pptx.util.Cm(spec.top)}"/>'
+        f'<a:ext cx="{pptx.util.Cm(spec.width)}" cy="{pptx.util.Cm(spec.height)}"/>'
+        "</a:xfrm>"
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/>'
+        "</p:spPr>"
+        '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+        f"{paragraphs}"
+        "</p:txBody>"
+        "</p:sp>"
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _get_paragraph_properties_xml(
+    font_name: str, font_size: int, font_bold: bool, font_italic: bool
+) -> str:
+    # Shared by all the paragraphs with the same font.
+    return (
+        f'<a:pPr><a:defRPr sz="{pptx.util.Pt(font_size).centipoints}" '
+        f'b="{int(font_bold)}" i="{int(font_italic)}">'
+        f"<a:latin typeface={saxutils.quoteattr(font_name)}/>"
+        "</a:defRPr></a:pPr>"
+    )
+
+
+def _get_runs_xml(text: str) -> str:
+    # Vertical tabs are line breaks in a paragraph as python-pptx does.
+    return "<a:br/>".join(
+        f"<a:r><a:t>{saxutils.escape(_escape_ctrl_chars(run))}</a:t></a:r>"
+        if run
+        else ""
+        for run in re.split("\n|\v", text)
+    )
+
+
+_escape_ctrl_chars = pptx.oxml.text.CT_RegularTextRun._escape_ctrl_chars
+
+_NSMAP = pptx.oxml.ns.nsmap("p")
+_EMPTY_TAGS_XML = (
+    b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+    + f'<p:tagLst {pptx.oxml.ns.nsdecls("p")}/>'.encode()
+)
+
+
+def _find_tag(tag_lst: t.Any, name: str) -> t.Any:
+    for tag in tag_lst.iterfind("p:tag", _NSMAP):
+        if tag.get("name") == name:
+            return tag
+    return None
+
+
+@dataclasses.dataclass()
+class _ImageParts:
+    """
+    The image parts of a package indexed by SHA1.
+
+    python-pptx searches every part of the package for an identical image
+    and a free partname each time an image is added, which takes O(n^2) time
+    for n images. The index is built once per package instead.
+    The new parts are named `picture<n>` rather than `image<n>`,
+    so they never take the partnames python-pptx chooses for the images
+    added without the index, such as by `shapes.add_picture`.
+    """
+
+    by_sha1: dict[str, pptx.opc.package.Part] = dataclasses.field(default_factory=dict)
+    partnames: set[str] = dataclasses.field(default_factory=set)
+    next_idx: int = 1
+
+    def add(self, part: pptx.opc.package.Part, sha1: str) -> None:
+        self.by_sha1.setdefault(sha1, part)
+        self.partnames.add(part.partname)
+        if match := _PICTURE_PARTNAME_RE.fullmatch(part.partname):
+            self.next_idx = max(self.next_idx, int(match[1]) + 1)
+
+    def next_partname(self, ext: str) -> pptx.opc.packuri.PackURI:
+        while True:
+            partname = f"{_PICTURE_PARTNAME_PREFIX}{self.next_idx}.{ext}"
+            self.next_idx += 1
+            if partname not in self.partnames:
+                return pptx.opc.packuri.PackURI(partname)
+
+
+_image_parts: weakref.WeakKeyDictionary[pptx.opc.package.OpcPackage, _ImageParts] = (
+    weakref.WeakKeyDictionary()
+)
+_PICTURE_PARTNAME_PREFIX = "/ppt/media/picture"
+_PICTURE_PARTNAME_RE = re.compile(r"/ppt/media/picture(\d+)\.\w+")
+_IMAGE_PARTNAME_PREFIXES = ("/ppt/media/image", _PICTURE_PARTNAME_PREFIX)
+
+
+def _get_image_parts(package: pptx.opc.package.OpcPackage) -> _ImageParts:
+    if (parts := _image_parts.get(package)) is None:
+        parts = _image_parts[package] = _ImageParts()
+        for part in package.iter_parts():
+            if not part.partname.startswith(_IMAGE_PARTNAME_PREFIXES):
+                continue
+            if isinstance(part, pptx.parts.image.ImagePart):
+                # Also available for the parts released by `PresentationWriter`.
+                parts.add(part, part.sha1)
+            else:
+                parts.add(part, hashlib.sha1(part.blob).hexdigest())
+    return parts
+
+
+def _register_image_part(
+    package: pptx.opc.package.OpcPackage, part: pptx.opc.package.Part, sha1: str
+) -> None:
+    # Called for the image parts added without `_get_or_add_image_part`.
+    parts = _image_parts.get(package)
+    if parts is not None and part.partname.startswith(_IMAGE_PARTNAME_PREFIXES):
+        parts.add(part, sha1)
+
+
+def _get_or_add_image_part(
+    package: pptx.opc.package.OpcPackage, image: bytes, ext: str | None = None
+) -> pptx.opc.package.Part:
+    parts = _get_image_parts(package)
+    sha1 = hashlib.sha1(image).hexdigest()
+    if (part := parts.by_sha1.get(sha1)) is not None:
+        return part
+    if ext is None:
+        ext = pptx.parts.image.Image.from_blob(image).ext
+    partname = parts.next_partname(ext)
+    if ext == "svg":
+        part = pptx.opc.package.Part(partname, _SVG_CONTENT_TYPE, package, image)
+    else:
+        part = pptx.parts.image.ImagePart(
+            partname, pptx.opc.spec.image_content_types[ext], package, image
+        )
+        # Sets the lazy property of python-pptx so that it is not hashed again.
+        part.__dict__["sha1"] = sha1
+    parts.add(part, sha1)
+    return part
+
+
+_SVG_BLIP_EXT_URI = "{96DAC541-7B7A-43D3-8B79-37D633B846F1}"
+_SVG_NS = "http://schemas.microsoft.com/office/drawing/2016/SVG/main"
+_SVG_CONTENT_TYPE = "image/svg+xml"
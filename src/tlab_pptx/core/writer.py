@@ -0,0 +1,182 @@
+import dataclasses
+import os
+import types
+import typing as t
+import zipfile
+
+import pptx.opc.constants
+import pptx.opc.oxml
+import pptx.opc.package
+import pptx.opc.packuri
+import pptx.opc.serialized
+import pptx.parts.image
+
+from tlab_pptx import profiling, typing
+from tlab_pptx.core import presentation, slide
+
+_STORED_EXTS = frozenset(["png", "jpg", "jpeg", "gif", "xlsx"])
+
+
+@dataclasses.dataclass()
+class PresentationWriter:
+    """
+    A writer saving a presentation slide by slide with bounded memory.
+
+    Each slide added by `PresentationWriter.add_slide` is written to the file
+    together with its images and charts when the next slide is added,
+    and then released. The rest of the presentation is written on closing.
+    Released slides are empty and can no longer be edited.
+
+    Examples
+    --------
+    >>> import tlab_pptx
+    >>> with PresentationWriter(tlab_pptx.new_presentation(), "out.pptx") as writer:  # doctest: +SKIP
+    ...     for fig in figs:
+    ...         writer.add_slide().add_figure(fig, left=2.5, top=2.5)
+    """  # noqa: E501
+
+    prs: presentation.Presentation
+    """The presentation to be written."""
+    filepath_or_buffer: typing.FilePathOrBuffer
+    """A filepath string or buffer object to which the presentation is written."""
+    _zip: zipfile.ZipFile = dataclasses.field(init=False, repr=False)
+    _template_parts: set[pptx.opc.package.Part] = dataclasses.field(
+        init=False, repr=False
+    )
+    _written_parts: set[pptx.opc.package.Part] = dataclasses.field(
+        default_factory=set, init=False, repr=False
+    )
+    _pending_slides: list[slide.Slide] = dataclasses.field(
+        default_factory=list, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        file = self.filepath_or_buffer
+        self._zip = zipfile.ZipFile(
+            file if isinstance(file, str | os.PathLike) else t.cast(t.IO[bytes], file),
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+        )
+        self._template_parts = set(self._package.iter_parts())
+
+    def __enter__(self) -> "PresentationWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def _package(self) -> pptx.opc.package.OpcPackage:
+        return self.prs._prs.part.package
+
+    def add_slide(self, layout_idx: int | str | None = None) -> slide.Slide:
+        """
+        Writes the slides added so far and adds a new slide to the presentation.
+
+        Parameters
+        ----------
+        layout_idx : int | str
+            An index of Presentation.slide_layouts or the name of a slide layout
+            to be inherited by the slide.
+
+        Returns
+        -------
+        tlab_pptx.core.slide.Slide
+            A new slide.
+        """
+        self.flush()
+        sld = self.prs.add_slide(layout_idx)
+        self._pending_slides.append(sld)
+        return sld
+
+    def flush(self) -> None:
+        """
+        Writes and releases the slides added so far.
+        """
+        for sld in self._pending_slides:
+            slide_part = sld._slide.part
+            with profiling.span("write_slide") as recorder:
+                recorder.nbytes = self._write_part(slide_part)
+            sp_tree = sld._slide.shapes._spTree
+            for shape_element in list(sp_tree.iter_shape_elms()):
+                sp_tree.remove(shape_element)
+        self._pending_slides.clear()
+
+    def close(self) -> None:
+        """
+        Writes the rest of the presentation and closes the file.
+        """
+        if self._zip.fp is None:
+            return
+        self.flush()
+        with profiling.span("write_package") as recorder:
+            nbytes = 0
+            parts = tuple(self._package.iter_parts())
+            for part in parts:
+                if part not in self._written_parts:
+                    nbytes += self._write(part.partname, part.blob)
+                    if part._rels:
+                        nbytes += self._write(part.partname.rels_uri, part.rels.xml)
+            nbytes += self._write(
+                pptx.opc.packuri.PACKAGE_URI.rels_uri, self._package._rels.xml
+            )
+            nbytes += self._write(
+                pptx.opc.packuri.CONTENT_TYPES_URI,
+                pptx.opc.oxml.serialize_part_xml(
+                    pptx.opc.serialized._ContentTypesItem.xml_for(parts)
+                ),
+            )
+            self._zip.close()
+            recorder.nbytes = nbytes
+
+    def _write_part(self, part: pptx.opc.package.Part) -> int:
+        if part in self._written_parts or part in self._template_parts:
+            return 0
+        nbytes = self._write(part.partname, part.blob)
+        if part._rels:
+            nbytes += self._write(part.partname.rels_uri, part.rels.xml)
+        self._written_parts.add(part)
+        for rel in part.rels.values():
+            if (
+                rel.is_external
+                or rel.reltype == pptx.opc.constants.RELATIONSHIP_TYPE.SLIDE
+            ):
+                continue
+            nbytes += self._write_part(rel.target_part)
+        _release(part)
+        return nbytes
+
+    def _write(self, partname: pptx.opc.packuri.PackURI, blob: bytes) -> int:
+        compress_type = (
+            zipfile.ZIP_STORED
+            if partname.ext.lower() in _STORED_EXTS
+            else zipfile.ZIP_DEFLATED
+        )
+        self._zip.writestr(partname.membername, blob, compress_type=compress_type)
+        return len(blob)
+
+
+class _ReleasedImagePart(pptx.parts.image.ImagePart):  # type: ignore[misc]
+    """An image part whose blob has been written and released."""
+
+    _released_size: tuple[int, int]
+
+    @property
+    def _native_size(self) -> tuple[int, int]:
+        return self._released_size
+
+
+def _release(part: t.Any) -> None:
+    if isinstance(part, pptx.parts.image.ImagePart):
+        # Keeps what python-pptx needs to reuse the part for identical images.
+        part.sha1
+        part._released_size = part._native_size
+        part.__class__ = _ReleasedImagePart
+        part._blob = b""
+    elif not hasattr(part, "_element"):
+        part._blob = b""
@@ -0,0 +1,217 @@
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+import plotly.graph_objects as go
+
+from tlab_pptx import render, typing
+
+Method = t.Literal["minmax", "lttb"]
+
+_PER_POINT_PROPERTIES = ("text", "hovertext", "customdata", "ids")
+
+
+def minmax_indices(y: npt.ArrayLike, n_out: int) -> npt.NDArray[np.intp]:
+    """
+    Gets the indices of the minimum and maximum points in bins of equal counts.
+
+    The first and the last points are always kept. The first NaN value
+    in each bin is also kept so that gaps in a line remain.
+
+    Parameters
+    ----------
+    y : ArrayLike
+        The values of the points.
+    n_out : int
+        The maximum number of points to be kept except NaN values.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sorted indices of the points to be kept.
+
+    Examples
+    --------
+    >>> minmax_indices([0, 5, 1, 2, 9, 3, 4, 8], 6).tolist()
+    [0, 1, 2, 4, 5, 7]
+    """
+    values = np.asarray(y, dtype=float)
+    n = len(values)
+    n_bins = max((n_out - 2) // 2, 1)
+    if n <= n_out or n <= 2:
+        return np.arange(n)
+    bin_size = -(-(n - 2) // n_bins)
+    n_bins = -(-(n - 2) // bin_size)
+    padded = np.full(n_bins * bin_size, np.nan)
+    padded[: n - 2] = values[1:-1]
+    bins = padded.reshape(n_bins, bin_size)
+    nan = np.isnan(bins)
+    offsets = np.arange(n_bins) * bin_size + 1
+    mins = np.where(nan, np.inf, bins).argmin(axis=1) + offsets
+    maxs = np.where(nan, -np.inf, bins).argmax(axis=1) + offsets
+    gaps = (nan.argmax(axis=1) + offsets)[nan.any(axis=1)]
+    indices = np.concatenate([[0], mins, maxs, gaps, [n - 1]])
+    return np.unique(np.minimum(indices, n - 1))
+
+
+def lttb_indices(
+    x: npt.ArrayLike, y: npt.ArrayLike, n_out: int
+) -> npt.NDArray[np.intp]:
+    """
+    Gets the indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    Parameters
+    ----------
+    x : ArrayLike
+        The x values of the points in ascending order.
+    y : ArrayLike
+        The y values of the points without NaN.
+    n_out : int
+        The number of points to be kept, at least 3.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sorted indices of the points to be kept.
+
+    Examples
+    --------
+    >>> lttb_indices([0, 1, 2, 3, 4, 5], [0, 5, 1, 2, 9, 3], 4).tolist()
+    [0, 1, 4, 5]
+    """
+    xs = np.asarray(x, dtype=float)
+    ys = np.asarray(y, dtype=float)
+    n = len(ys)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    # The centroid of each bucket is the third vertex for the previous bucket.
+    x_means = np.add.reduceat(xs[: n - 1], edges[:-1]) / np.diff(edges)
+    y_means = np.add.reduceat(ys[: n - 1], edges[:-1]) / np.diff(edges)
+    x_means = np.append(x_means[1:], xs[-1])
+    y_means = np.append(y_means[1:], ys[-1])
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i, (start, stop) in enumerate(zip(edges[:-1], edges[1:]), start=1):
+        areas = np.abs(
+            (xs[a] - x_means[i - 1]) * (ys[start:stop] - ys[a])
+            - (xs[a] - xs[start:stop]) * (y_means[i - 1] - ys[a])
+        )
+        a = start + int(areas.argmax())
+        indices[i] = a
+    return indices
+
+
+def get_n_points(
+    width: float,
+    dpi: float | typing.Quality = "print",
+    method: Method = "minmax",
+) -> int:
+    """
+    Gets the number of points which a trace needs at most on a slide.
+
+    Parameters
+    ----------
+    width : float
+        The width of the figure on a slide in centimeter.
+    dpi : float | tlab_pptx.typing.Quality
+        The resolution of the figure in DPI or a quality profile.
+    method : tlab_pptx.downsample.Method
+        The method of downsampling. `minmax` keeps two points per pixel column.
+
+    Returns
+    -------
+    int
+        The number of points.
+
+    Examples
+    --------
+    >>> get_n_points(2.54, 100)
+    200
+    >>> get_n_points(2.54, "draft", method="lttb")
+    72
+    """
+    if isinstance(dpi, str):
+        dpi = render.QUALITY_DPI[dpi]
+    n_pixels = round(width / 2.54 * dpi)
+    return 2 * n_pixels if method == "minmax" else n_pixels
+
+
+def downsample_figure(
+    fig: go.Figure, n_points: int, method: Method = "minmax"
+) -> go.Figure:
+    """
+    Downsamples the large scatter traces of a figure preserving their shapes.
+
+    Traces with more points than `n_points` are decimated by the min/max
+    of bins (`minmax`) or by Largest-Triangle-Three-Buckets (`lttb`).
+    The other traces and the layout are kept as they are.
+    Traces with non-numeric data or per-point error bars and markers are not decimated.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure
+        A figure to be downsampled, which is not modified.
+    n_points : int
+        The maximum number of points of each trace (see `get_n_points`).
+    method : tlab_pptx.downsample.Method
+        The method of downsampling. `lttb` expects the x values in ascending order.
+
+    Returns
+    -------
+    plotly.graph_objects.Figure
+        A new figure with the downsampled traces.
+
+    Examples
+    --------
+    >>> fig = go.Figure(go.Scatter(y=np.sin(np.linspace(0, 10, 10000))))
+    >>> len(downsample_figure(fig, 1000).data[0].y) <= 1000
+    True
+    """
+    data = [_downsample_trace(trace, n_points, method) for trace in fig.data]
+    return go.Figure(data=data, layout=fig.layout)
+
+
+def _downsample_trace(trace: t.Any, n_points: int, method: Method) -> t.Any:
+    if trace.type not in ("scatter", "scattergl") or trace.y is None:
+        return trace
+    n = len(trace.y)
+    if n <= n_points or _has_per_point_style(trace):
+        return trace
+    try:
+        ys = np.asarray(trace.y, dtype=float)
+        if trace.x is None:
+            xs = (trace.x0 or 0) + (trace.dx or 1) * np.arange(n, dtype=float)
+        else:
+            xs = np.asarray(trace.x, dtype=float)
+    except (TypeError, ValueError):
+        return trace
+    if method == "lttb":
+        finite = ~(np.isnan(xs) | np.isnan(ys))
+        if not finite.all():
+            return trace
+        indices = lttb_indices(xs, ys, n_points)
+    else:
+        indices = minmax_indices(ys, n_points)
+    props = {
+        name: trace[name] for name in trace._props if name not in ("x", "y", "x0", "dx")
+    }
+    for name in _PER_POINT_PROPERTIES:
+        value = props.get(name)
+        if value is not None and not isinstance(value, str) and len(value) == n:
+            props[name] = np.asarray(value)[indices]
+    return type(trace)(props, x=xs[indices], y=ys[indices])
+
+
+def _has_per_point_style(trace: t.Any) -> bool:
+    return any(
+        value is not None and not isinstance(value, str | int | float)
+        for value in (
+            trace.error_x.array,
+            trace.error_y.array,
+            trace.marker.color,
+            trace.marker.size,
+            trace.marker.symbol,
+        )
+    )
@@ -1,5 +1,11 @@
 import datetime
+import functools
+import re
 import typing as t
+from collections import abc
+
+if t.TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 
 def get_default_layout() -> dict[str, t.Any]:
@@ -125,3 +131,101 @@ def get_date_annotation(date: datetime.date | tuple[int, int, int]) -> dict[str,
         showarrow=False,
         font=dict(size=14),
     )
+
+
+def update_figure_dict(
+    fig: "go.Figure | dict[str, t.Any]",
+    layout: dict[str, t.Any] | None = None,
+    xaxes: dict[str, t.Any] | None = None,
+    yaxes: dict[str, t.Any] | None = None,
+    traces: dict[str, t.Any] | None = None,
+    annotations: abc.Iterable[dict[str, t.Any]] = (),
+) -> dict[str, t.Any]:
+    """
+    Gets a figure dict updated like the `update_*` methods of a figure
+    without copying the trace data or validating the updates.
+
+    Only the dicts on the paths to the updated properties are copied,
+    so the cost does not depend on the number of points.
+    The result can be rendered by `tlab_pptx.render.to_image`
+    and must not be modified in place since it shares the data with `fig`.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure | dict[str, Any]
+        A figure or a figure dict, which is not modified.
+    layout : dict[str, Any] | None
+        Properties merged into the layout as `update_layout` does.
+        A template name is expanded into the template.
+    xaxes : dict[str, Any] | None
+        Properties merged into every x axis as `update_xaxes` does.
+    yaxes : dict[str, Any] | None
+        Properties merged into every y axis as `update_yaxes` does.
+    traces : dict[str, Any] | None
+        Properties merged into every trace as `update_traces` does.
+    annotations : Iterable[dict[str, Any]]
+        Annotations appended to the layout as `add_annotation` does.
+
+    Returns
+    -------
+    dict[str, Any]
+        The updated figure dict with `data` and `layout`.
+
+    Examples
+    --------
+    >>> import plotly.graph_objects as go
+    >>> fig = go.Figure(go.Scatter(y=[1, 2, 3]))
+    >>> fig_dict = update_figure_dict(
+    ...     fig, layout=dict(width=450), traces=dict(line=dict(width=1))
+    ... )
+    >>> fig_dict["data"]
+    [{'y': [1, 2, 3], 'type': 'scatter', 'line': {'width': 1}}]
+    >>> fig_dict["layout"]["width"]
+    450
+    """
+    if isinstance(fig, dict):
+        data, fig_layout = fig.get("data", []), fig.get("layout", {})
+    else:
+        # The internal dicts of a figure hold the data without copying.
+        data, fig_layout = fig._data, fig._layout
+    new_layout = _merge(fig_layout, layout or {})
+    if isinstance(template := new_layout.get("template"), str):
+        new_layout["template"] = _get_template(template)
+    for prefix, axis in (("xaxis", xaxes), ("yaxis", yaxes)):
+        if axis is None:
+            continue
+        names = {name for name in new_layout if re.fullmatch(rf"{prefix}\d*", name)}
+        for name in {prefix} | names:
+            new_layout[name] = _merge(new_layout.get(name) or {}, axis)
+    if annotations := list(annotations):
+        new_layout["annotations"] = [*new_layout.get("annotations", ()), *annotations]
+    return dict(
+        data=[_merge(trace, traces or {}) for trace in data],
+        layout=new_layout,
+    )
+
+
+def _merge(base: dict[str, t.Any], update: dict[str, t.Any]) -> dict[str, t.Any]:
+    merged = dict(base)
+    for key, value in update.items():
+        if value is None:
+            merged.pop(key, None)
+        elif (
+            isinstance(value, dict)
+            and isinstance(merged.get(key), dict)
+            and key != "template"
+        ):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+@functools.lru_cache(maxsize=8)
+def _get_template(name: str) -> dict[str, t.Any]:
+    # Deferred since importing plotly takes a while (see `tlab_pptx.__getattr__`).
+    import plotly.io as pio
+
+    template = pio.templates[name].to_plotly_json()
+    assert isinstance(template, dict)
+    return template
@@ -0,0 +1,223 @@
+import dataclasses
+
+import numpy as np
+import numpy.typing as npt
+
+from tlab_pptx import profiling
+
+_CHUNK_SIZE = 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class BiexponentialFit:
+    """
+    The parameters of bi-exponential decays fitted by `fit_biexponential`.
+
+    Each field is an array with a value for each curve.
+    """
+
+    a: npt.NDArray[np.float64]
+    """The amplitudes of the fast decays at the first time."""
+    b: npt.NDArray[np.float64]
+    """The amplitudes of the slow decays at the first time."""
+    tau1: npt.NDArray[np.float64]
+    """The decay times of the fast decays."""
+    tau2: npt.NDArray[np.float64]
+    """The decay times of the slow decays."""
+    rmse: npt.NDArray[np.float64]
+    """The root mean square errors of the fits."""
+
+    def __len__(self) -> int:
+        return len(self.a)
+
+    def params(self, i: int) -> dict[str, float]:
+        """
+        Gets the parameters of a curve to be passed to
+        `tlab_pptx.presentation.photo_luminescence.build`.
+
+        Parameters
+        ----------
+        i : int
+            The index of the curve.
+
+        Returns
+        -------
+        dict[str, float]
+            The values of `a`, `b`, `tau1` and `tau2`.
+        """
+        return dict(
+            a=float(self.a[i]),
+            b=float(self.b[i]),
+            tau1=float(self.tau1[i]),
+            tau2=float(self.tau2[i]),
+        )
+
+
+def fit_biexponential(
+    t: npt.ArrayLike,
+    y: npt.ArrayLike,
+    max_iter: int = 100,
+    tol: float = 1e-8,
+    n_grid: int = 32,
+) -> BiexponentialFit:
+    """
+    Fits `a * exp(-(t - t[0]) / tau1) + b * exp(-(t - t[0]) / tau2)`
+    to a batch of decay curves by least squares.
+
+    All the curves are fitted at once with NumPy.
+    The decay times are first chosen from a grid for each curve,
+    solving the amplitudes linearly for every pair of them,
+    and then refined together with the amplitudes by Levenberg-Marquardt.
+    The curves are processed in chunks to bound the memory.
+
+    Parameters
+    ----------
+    t : ArrayLike
+        The times shared by the curves in ascending order,
+        which start at the onset of the decays.
+    y : ArrayLike
+        The intensities of a curve or a 2D array of curves in rows.
+    max_iter : int
+        The maximum number of iterations of Levenberg-Marquardt.
+    tol : float
+        The relative decrease of the squared error below which
+        a fit is regarded as converged.
+    n_grid : int
+        The number of the decay times of the grid, in geometric progression
+        from the time step to ten times the time span.
+
+    Returns
+    -------
+    tlab_pptx.fitting.BiexponentialFit
+        The fitted parameters of each curve, with `tau1 <= tau2`.
+
+    Raises
+    ------
+    ValueError
+        If the shapes of `t` and `y` do not match,
+        or there are less than 4 points.
+
+    Examples
+    --------
+    >>> t = np.linspace(0, 10, 501)
+    >>> fit = fit_biexponential(t, 3 * np.exp(-t / 0.5) + np.exp(-t / 4))
+    >>> np.round([fit.a[0], fit.b[0], fit.tau1[0], fit.tau2[0]], 3).tolist()
+    [3.0, 1.0, 0.5, 4.0]
+    """
+    ts = np.asarray(t, dtype=float)
+    ys = np.atleast_2d(np.asarray(y, dtype=float))
+    if ts.ndim != 1 or ys.ndim != 2 or ys.shape[1] != len(ts):
+        raise ValueError(f"shapes {ts.shape} and {ys.shape} do not match")
+    if len(ts) < 4 or ts[-1] <= ts[0]:
+        raise ValueError("at least 4 points over a positive time span are needed")
+    ts = ts - ts[0]
+    with profiling.span("fit_biexponential") as recorder:
+        chunks = [
+            _fit_chunk(ts, ys[start : start + _CHUNK_SIZE], max_iter, tol, n_grid)
+            for start in range(0, len(ys), _CHUNK_SIZE)
+        ]
+        params = np.concatenate(chunks) if chunks else np.empty((0, 5))
+        recorder.nbytes = ys.nbytes
+    a, b, tau1, tau2, rmse = params.T
+    return BiexponentialFit(a=a, b=b, tau1=tau1, tau2=tau2, rmse=rmse)
+
+
+def _fit_chunk(
+    t: npt.NDArray[np.float64],
+    y: npt.NDArray[np.float64],
+    max_iter: int,
+    tol: float,
+    n_grid: int,
+) -> npt.NDArray[np.float64]:
+    # Returns the rows of (a, b, tau1, tau2, rmse).
+    p = _get_initial_params(t, y, n_grid)
+    cost = _get_cost(t, y, p)
+    damping = np.full(len(y), 1e-3)
+    active = np.ones(len(y), dtype=bool)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+        step = _get_step(t, y[idx], p[idx], damping[idx])
+        new_p = p[idx] + step
+        new_cost = _get_cost(t, y[idx], new_p)
+        better = new_cost < cost[idx]
+        converged = better & (cost[idx] - new_cost <= tol * cost[idx])
+        p[idx[better]] = new_p[better]
+        cost[idx[better]] = new_cost[better]
+        damping[idx] = np.where(better, damping[idx] / 10, damping[idx] * 10)
+        active[idx[converged | (damping[idx] > 1e10)]] = False
+    a, b = p[:, 0], p[:, 1]
+    tau1, tau2 = np.exp(p[:, 2]), np.exp(p[:, 3])
+    swap = tau1 > tau2
+    a, b = np.where(swap, b, a), np.where(swap, a, b)
+    tau1, tau2 = np.where(swap, tau2, tau1), np.where(swap, tau1, tau2)
+    rmse = np.sqrt(cost / len(t))
+    return np.column_stack([a, b, tau1, tau2, rmse])
+
+
+def _get_initial_params(
+    t: npt.NDArray[np.float64], y: npt.NDArray[np.float64], n_grid: int
+) -> npt.NDArray[np.float64]:
+    # Chooses the pair of decay times on a grid explaining each curve the best
+    # with non-negative amplitudes, which are solved from the normal equations.
+    taus = np.geomspace(t[-1] / (len(t) - 1), 10 * t[-1], n_grid)
+    basis = np.exp(-t / taus[:, None])
+    gram = basis @ basis.T
+    proj = y @ basis.T
+    i, j = np.triu_indices(n_grid, k=1)
+    det = gram[i, i] * gram[j, j] - gram[i, j] ** 2
+    a = (gram[j, j] * proj[:, i] - gram[i, j] * proj[:, j]) / det
+    b = (gram[i, i] * proj[:, j] - gram[i, j] * proj[:, i]) / det
+    explained = a * proj[:, i] + b * proj[:, j]
+    valid = (a >= 0) & (b >= 0)
+    valid |= ~valid.any(axis=1, keepdims=True)
+    k = np.where(valid, explained, -np.inf).argmax(axis=1)
+    rows = np.arange(len(y))
+    return np.column_stack(
+        [a[rows, k], b[rows, k], np.log(taus[i[k]]), np.log(taus[j[k]])]
+    )
+
+
+def _get_model(
+    t: npt.NDArray[np.float64], p: npt.NDArray[np.float64]
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    e1 = np.exp(-t * np.exp(-p[:, 2:3]))
+    e2 = np.exp(-t * np.exp(-p[:, 3:4]))
+    return p[:, 0:1] * e1 + p[:, 1:2] * e2, e1, e2
+
+
+def _get_cost(
+    t: npt.NDArray[np.float64], y: npt.NDArray[np.float64], p: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    model, _, _ = _get_model(t, p)
+    cost: npt.NDArray[np.float64] = ((y - model) ** 2).sum(axis=1)
+    return np.where(np.isfinite(cost), cost, np.inf)
+
+
+def _get_step(
+    t: npt.NDArray[np.float64],
+    y: npt.NDArray[np.float64],
+    p: npt.NDArray[np.float64],
+    damping: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    # Solves the damped normal equations of all the curves at once.
+    model, e1, e2 = _get_model(t, p)
+    jac = np.stack(
+        [
+            e1,
+            e2,
+            p[:, 0:1] * e1 * t * np.exp(-p[:, 2:3]),
+            p[:, 1:2] * e2 * t * np.exp(-p[:, 3:4]),
+        ],
+        axis=1,
+    )
+    jtj = jac @ jac.transpose(0, 2, 1)
+    jtr = jac @ (y - model)[:, :, None]
+    diag = np.einsum("kii->ki", jtj)
+    jtj[:, np.arange(4), np.arange(4)] += damping[:, None] * (diag + 1e-12)
+    try:
+        step: npt.NDArray[np.float64] = np.linalg.solve(jtj, jtr)[:, :, 0]
+    except np.linalg.LinAlgError:
+        step = (np.linalg.pinv(jtj) @ jtr)[:, :, 0]
+    return np.where(np.isfinite(step), step, 0.0)
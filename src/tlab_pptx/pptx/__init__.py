@@ -1,5 +1,13 @@
+import copy
+import functools
+import os
 import pathlib
 
+import pptx
+import pptx.presentation
+
+from tlab_pptx import typing
+
 _PPTX_DIR = pathlib.Path(__file__).parent
 _DEFAULT_PPTX = _PPTX_DIR / "universal.pptx"
 
@@ -31,3 +39,33 @@ def get_pptx_filepaths() -> list[str]:
         A list of filepaths of built-in `.pptx` files.
     """
     return [str(path) for path in _PPTX_DIR.glob("**/*.pptx")]
+
+
+def load_pptx(filepath: typing.FilePath) -> pptx.presentation.Presentation:
+    """
+    Loads a `.pptx` file as a template.
+
+    Each file is parsed once per process and cached by its path and modification
+    time, and an independent copy of the parsed presentation is returned.
+
+    Parameters
+    ----------
+    filepath : tlab_pptx.typing.FilePath
+        A filepath of a `.pptx` file.
+
+    Returns
+    -------
+    pptx.presentation.Presentation
+        A new presentation loaded from the file.
+    """
+    path = os.path.realpath(filepath)
+    return copy.deepcopy(_load_pptx(path, os.stat(path).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_pptx(path: str, mtime_ns: int) -> pptx.presentation.Presentation:
+    # The cached presentation must stay untouched because deepcopy does not
+    # handle the lazily cached properties of python-pptx objects.
+    prs = pptx.Presentation(path)
+    assert isinstance(prs, pptx.presentation.Presentation)
+    return prs
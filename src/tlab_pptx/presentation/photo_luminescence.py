@@ -1,8 +1,21 @@
+import asyncio
+import contextlib
+import dataclasses
 import datetime
+import hashlib
+import math
+import os
+import types
+import typing as t
+from collections import abc
 
+import numpy as np
+import numpy.typing as npt
+import plotly
 import plotly.graph_objects as go
 
-from tlab_pptx import core, figure
+from tlab_pptx import __version__, core, figure, profiling, render, spectrum, typing
+from tlab_pptx import downsample as tdownsample
 
 
 def build(
@@ -10,8 +23,8 @@ def build(
     excitation_wavelength: int,
     excitation_power: int,
     time_range: int,
-    center_wavelength: int,
-    FWHM: float,
+    center_wavelength: float | None,
+    FWHM: float | None,
     frame: int,
     date: datetime.date,
     h_fig: go.Figure,
@@ -20,6 +33,11 @@ def build(
     b: float,
     tau1: float,
     tau2: float,
+    cache: render.RenderCache | None = None,
+    pool: render.RenderPool | None = None,
+    dpi: float | typing.Quality | None = None,
+    figure_format: typing.FigureFormat = "png",
+    downsample: bool = False,
 ) -> core.Presentation:
     """
     Builds a Presentation object for a photo luminescence experiment.
@@ -34,10 +52,13 @@ def build(
         The excitation power of the experiment.
     time_range : int
         The time range of the experiment.
-    center_wavelength : int
+    center_wavelength : float | None
         The center wavelength of the PL intensity.
-    FWHM : float
+        If None, it is derived from the first trace of `v_fig`
+        by `tlab_pptx.spectrum.analyze_spectra`.
+    FWHM : float | None
         The full width at half maximum of the PL intensity.
+        If None, it is derived from the first trace of `v_fig` as well.
     frame : int
         The frame count of the streak scope used in the experiment.
     date : datetime.date
@@ -54,12 +75,33 @@ def build(
         The decay time of the fast decay.
     tau2 : float
         The decay time of the slow decay.
+    cache : tlab_pptx.render.RenderCache | None
+        A cache of rendered figures.
+        If None (default), the figures are rendered every time.
+    pool : tlab_pptx.render.RenderPool | None
+        A pool rendering the two figures concurrently.
+        If None (default), the figures are rendered one by one in this process.
+    dpi : float | tlab_pptx.typing.Quality | None
+        The resolution of the rendered figures in DPI or a quality profile.
+        If None (default), the figures are rendered at 10 times their layout size.
+    figure_format : tlab_pptx.typing.FigureFormat
+        The format in which the figures are embedded.
+        `chart` converts them to native charts without rendering.
+    downsample : bool
+        If true, traces with more points than the figures can show at `dpi`
+        (or `print` quality) are downsampled before rendering.
+        See `tlab_pptx.downsample.downsample_figure`.
 
     Returns
     -------
     tlab_pptx.core.Presentation
         A built presentation.
 
+    Raises
+    ------
+    ValueError
+        If `center_wavelength` or `FWHM` is None and cannot be derived.
+
     Exapmles
     --------
     >>> prs = build(
@@ -79,43 +121,514 @@ def build(
     ...     tau2=3.6
     ... )
     """
-    prs = core.new_presentation()
-    slide = prs.slides[0]
-    _a = int(100 * a / (a + b))
-    slide.update_title(text=title_text).add_figure(
-        _get_formatted_figure(h_fig, date), left=0.33, top=5.0
-    ).add_figure(_get_formatted_figure(v_fig, date), left=12.33, top=5.0).add_text(
-        f"Excitation wavelength : {int(excitation_wavelength):d} nm\n"
-        f"Excitation power : {int(excitation_power):d} mW\n"
-        f"Time range : {int(time_range):d} ns\n",
-        left=2.33,
-        top=2.5,
-    ).add_text(
-        f"Center wavelength : {int(center_wavelength):d} nm\n"
-        f"FWHM : {FWHM:.2g} nm\n"
-        f"Frame : {int(frame):d}\n",
-        left=14.33,
-        top=2.5,
-    ).add_text(
-        f"a : b = {_a:d} : {100 - _a:d}",
-        left=14.33,
-        top=17.0,
-        font_name="Cambria Math",
-    ).add_text(
-        f"τ₁ = {tau1:.2g} ns\n" f"τ₂ = {tau2:.2g} ns\n",
-        left=19.33,
-        top=17.0,
-        font_name="Cambria Math",
+    record = Record(
+        title_text=title_text,
+        excitation_wavelength=excitation_wavelength,
+        excitation_power=excitation_power,
+        time_range=time_range,
+        center_wavelength=center_wavelength,
+        FWHM=FWHM,
+        frame=frame,
+        date=date,
+        h_fig=h_fig,
+        v_fig=v_fig,
+        a=a,
+        b=b,
+        tau1=tau1,
+        tau2=tau2,
     )
+    return _build([record], cache, pool, dpi, figure_format, downsample, None)
+
+
+@dataclasses.dataclass()
+class Record:
+    """
+    A record of a photo luminescence experiment.
+
+    The fields are the same as the parameters of `build`.
+    """
+
+    title_text: str
+    excitation_wavelength: int
+    excitation_power: int
+    time_range: int
+    center_wavelength: float | None
+    FWHM: float | None
+    frame: int
+    date: datetime.date
+    h_fig: go.Figure
+    v_fig: go.Figure
+    a: float
+    b: float
+    tau1: float
+    tau2: float
+
+    @classmethod
+    def from_mapping(cls, values: abc.Mapping[str, t.Any]) -> "Record":
+        """
+        Creates a record from loosely typed values,
+        such as a row of a CSV file or a JSON object.
+
+        Each value is converted to the type of its field, where `date` may be
+        an ISO format string. `center_wavelength` and `FWHM` may be missing,
+        None or NaN, in which case they are None.
+        `h_fig` and `v_fig` must be figures.
+
+        Parameters
+        ----------
+        values : Mapping[str, Any]
+            The values of the fields by name. Other keys are ignored.
+
+        Returns
+        -------
+        tlab_pptx.presentation.photo_luminescence.Record
+            The record of the values.
+
+        Raises
+        ------
+        ValueError
+            If a required field is missing or a value cannot be converted.
+
+        Examples
+        --------
+        >>> record = Record.from_mapping(
+        ...     dict(
+        ...         title_text="Title", excitation_wavelength="400",
+        ...         excitation_power=1, time_range=10, frame=10000,
+        ...         date="2022-01-01", h_fig=go.Figure(), v_fig=go.Figure(),
+        ...         a=63, b=37, tau1=1.2, tau2=3.6,
+        ...     )
+        ... )  # fmt: skip
+        >>> record.excitation_wavelength, record.date, record.FWHM
+        (400, datetime.date(2022, 1, 1), None)
+        """
+        fields = dataclasses.fields(cls)
+        missing = [
+            field.name
+            for field in fields
+            if field.name not in values and types.NoneType not in t.get_args(field.type)
+        ]
+        if missing:
+            raise ValueError(f"missing fields: {', '.join(missing)}")
+        params = {}
+        for field in fields:
+            value = values.get(field.name)
+            try:
+                params[field.name] = _convert(value, field.type)
+            except (TypeError, ValueError) as err:
+                raise ValueError(f"{field.name}: {value!r} is invalid") from err
+        return cls(**params)
+
+
+def build_all(
+    records: abc.Iterable[Record],
+    cache: render.RenderCache | None = None,
+    pool: render.RenderPool | None = None,
+    dpi: float | typing.Quality | None = None,
+    figure_format: typing.FigureFormat = "png",
+    downsample: bool = False,
+    previous: typing.FilePath | None = None,
+) -> core.Presentation:
+    """
+    Builds a Presentation object with a slide for each photo luminescence experiment.
+
+    All the figures are rendered in bulk before the slides are built,
+    and the slides share the template and identical images.
+    Each slide is tagged with a fingerprint of its record and the build options,
+    so that a later build can reuse the slides whose inputs are unchanged.
+
+    Parameters
+    ----------
+    records : Iterable[tlab_pptx.presentation.photo_luminescence.Record]
+        Records of the experiments.
+    cache : tlab_pptx.render.RenderCache | None
+        A cache of rendered figures.
+        If None (default), the figures are rendered every time.
+    pool : tlab_pptx.render.RenderPool | None
+        A pool rendering the figures concurrently.
+        If None (default), a temporary pool is used. Since its worker processes
+        are spawned and import the main module, a script calling this function
+        must do so under `if __name__ == "__main__":`.
+    dpi : float | tlab_pptx.typing.Quality | None
+        The resolution of the rendered figures in DPI or a quality profile.
+        If None (default), the figures are rendered at 10 times their layout size.
+    figure_format : tlab_pptx.typing.FigureFormat
+        The format in which the figures are embedded.
+        `chart` converts them to native charts without rendering.
+    downsample : bool
+        If true, traces with more points than the figures can show at `dpi`
+        (or `print` quality) are downsampled before rendering.
+        See `tlab_pptx.downsample.downsample_figure`.
+    previous : tlab_pptx.typing.FilePath | None
+        A `.pptx` file built by `build_all` before.
+        The slides in it whose fingerprints match the records are copied
+        byte for byte, and only the other records are rendered and built.
+        If None (default) or the file does not exist, all the records are built.
+
+    Returns
+    -------
+    tlab_pptx.core.Presentation
+        A built presentation with a slide for each record in order.
+
+    Examples
+    --------
+    >>> prs = build_all(records, previous="campaign.pptx")  # doctest: +SKIP
+    >>> prs.save("campaign.pptx")  # doctest: +SKIP
+    """
+    records = list(records)
+    if pool is None and figure_format != "chart":
+        with render.RenderPool() as pool:
+            return _build(
+                records, cache, pool, dpi, figure_format, downsample, previous
+            )
+    return _build(records, cache, pool, dpi, figure_format, downsample, previous)
+
+
+async def build_async(
+    record: Record,
+    cache: render.RenderCache | None = None,
+    pool: render.RenderPool | None = None,
+    dpi: float | typing.Quality | None = None,
+    figure_format: typing.FigureFormat = "png",
+    semaphore: asyncio.Semaphore | None = None,
+    downsample: bool = False,
+) -> core.Presentation:
+    """
+    Builds a Presentation object for a photo luminescence experiment
+    without blocking the event loop.
+
+    The figures are rendered concurrently in threads or in a pool.
+
+    Parameters
+    ----------
+    record : tlab_pptx.presentation.photo_luminescence.Record
+        A record of the experiment.
+    cache : tlab_pptx.render.RenderCache | None
+        A cache of rendered figures.
+        If None (default), the figures are rendered every time.
+    pool : tlab_pptx.render.RenderPool | None
+        A pool in which the figures are rendered.
+        If None (default), the figures are rendered in threads.
+    dpi : float | tlab_pptx.typing.Quality | None
+        The resolution of the rendered figures in DPI or a quality profile.
+        If None (default), the figures are rendered at 10 times their layout size.
+    figure_format : tlab_pptx.typing.FigureFormat
+        The format in which the figures are embedded.
+    semaphore : asyncio.Semaphore | None
+        A semaphore shared by concurrent builds to limit how many of them
+        render figures at the same time. If None (default), there is no limit.
+    downsample : bool
+        If true, large traces are downsampled before rendering (see `build`).
+
+    Returns
+    -------
+    tlab_pptx.core.Presentation
+        A built presentation.
+    """
+    records = _complete_records([record])
+    figs = _get_formatted_figures(records, _get_n_points(dpi, downsample))
+    fingerprints = _get_fingerprints(records, figs, dpi, figure_format, downsample)
+    async with semaphore or contextlib.nullcontext():
+        images = await asyncio.gather(
+            *(
+                _render_async(figs, format, scale, cache, pool)
+                for format, scale in _get_render_options(figs, dpi, figure_format)
+            )
+        )
+    return _assemble(records, figs, list(images), figure_format, fingerprints)
+
+
+def _build(
+    records: list[Record],
+    cache: render.RenderCache | None,
+    pool: render.RenderPool | None,
+    dpi: float | typing.Quality | None,
+    figure_format: typing.FigureFormat,
+    downsample: bool,
+    previous: typing.FilePath | None,
+) -> core.Presentation:
+    records = _complete_records(records)
+    figs = _get_formatted_figures(records, _get_n_points(dpi, downsample))
+    fingerprints = _get_fingerprints(records, figs, dpi, figure_format, downsample)
+    unchanged = _find_unchanged(fingerprints, previous)
+    changed = [i for i in range(len(records)) if i not in unchanged]
+    changed_figs = [figs[j] for i in changed for j in (2 * i, 2 * i + 1)]
+    images = [
+        _render(changed_figs, format, scale, cache, pool)
+        for format, scale in _get_render_options(changed_figs, dpi, figure_format)
+    ]
+    prs = _assemble(
+        [records[i] for i in changed],
+        changed_figs,
+        images,
+        figure_format,
+        [fingerprints[i] for i in changed],
+    )
+    if previous is not None and unchanged:
+        slides = dict(zip(changed, prs.slides)) if changed else {}
+        if not changed:
+            prs.remove_slide(prs.slides[0])
+        copied = core.copy_slides(prs, previous, unchanged.values())
+        slides.update(zip(unchanged, copied))
+        prs.reorder_slides(slides[i] for i in range(len(records)))
+    return prs
+
+
+def _convert(value: t.Any, type_: t.Any) -> t.Any:
+    if types.NoneType in t.get_args(type_):
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return None
+        (type_,) = (arg for arg in t.get_args(type_) if arg is not types.NoneType)
+    if type_ is go.Figure:
+        if not isinstance(value, go.Figure):
+            raise TypeError(f"{type(value).__name__} is not a figure")
+        return value
+    if type_ is datetime.date:
+        return datetime.date.fromisoformat(str(value))
+    if type_ is int and float(value) != int(value):
+        raise ValueError(f"{value} is not an integer")
+    return type_(value)
+
+
+def _complete_records(records: list[Record]) -> list[Record]:
+    # Derives the omitted peaks from the spectra in a batch for each length.
+    incomplete: dict[int, list[tuple[int, npt.NDArray[np.float64]]]] = {}
+    for i, record in enumerate(records):
+        if record.center_wavelength is None or record.FWHM is None:
+            xy = _get_first_trace(record.v_fig)
+            if xy is None:
+                raise ValueError(
+                    f"no trace in v_fig of `{record.title_text}` to derive the peak"
+                )
+            incomplete.setdefault(xy.shape[1], []).append((i, xy))
+    if not incomplete:
+        return records
+    records = list(records)
+    for items in incomplete.values():
+        stacked = np.stack([xy for _, xy in items])
+        peaks = spectrum.analyze_spectra(stacked[:, 0], stacked[:, 1])
+        for (i, _), center, fwhm in zip(items, peaks.center_wavelength, peaks.FWHM):
+            record = records[i]
+            if record.center_wavelength is not None:
+                center = record.center_wavelength
+            if record.FWHM is not None:
+                fwhm = record.FWHM
+            if np.isnan(center) or np.isnan(fwhm):
+                raise ValueError(
+                    f"no half maximum in v_fig of `{record.title_text}` to derive FWHM"
+                )
+            records[i] = dataclasses.replace(
+                record, center_wavelength=float(center), FWHM=float(fwhm)
+            )
+    return records
+
+
+def _get_first_trace(fig: go.Figure) -> npt.NDArray[np.float64] | None:
+    # Returns the x and y values of the first trace in rows.
+    for trace in fig.data:
+        if getattr(trace, "y", None) is None:
+            continue
+        y = np.asarray(trace.y, dtype=float)
+        if trace.x is None:
+            x = (trace.x0 or 0) + (trace.dx or 1) * np.arange(len(y), dtype=float)
+        else:
+            x = np.asarray(trace.x, dtype=float)
+        return np.stack([x, y])
+    return None
+
+
+def _get_fingerprints(
+    records: list[Record],
+    figs: list[dict[str, t.Any]],
+    dpi: float | typing.Quality | None,
+    figure_format: typing.FigureFormat,
+    downsample: bool,
+) -> list[str]:
+    fingerprints = []
+    for i, record in enumerate(records):
+        h = hashlib.sha256()
+        h.update(repr((__version__, plotly.__version__)).encode())
+        h.update(repr((dpi, figure_format, downsample)).encode())
+        for field in dataclasses.fields(record):
+            if field.type is not go.Figure:
+                h.update(f"{field.name}={getattr(record, field.name)!r};".encode())
+        for fig in figs[2 * i : 2 * i + 2]:
+            _update_hash(h, fig)
+        fingerprints.append(h.hexdigest())
+    return fingerprints
+
+
+def _update_hash(h: "hashlib._Hash", obj: t.Any) -> None:
+    # Numeric arrays are hashed as raw bytes instead of being serialized.
+    if isinstance(obj, dict):
+        h.update(b"{")
+        for key in sorted(obj):
+            h.update(f"{key!r}:".encode())
+            _update_hash(h, obj[key])
+        h.update(b"}")
+    elif isinstance(obj, list | tuple | np.ndarray):
+        try:
+            array = np.asarray(obj)
+        except ValueError:
+            array = np.empty(0, dtype=object)
+        if array.dtype.kind in "biufcmM":
+            h.update(f"{array.dtype.str}{array.shape}".encode())
+            h.update(np.ascontiguousarray(array).tobytes())
+        else:
+            h.update(b"[")
+            for item in obj:
+                _update_hash(h, item)
+            h.update(b"]")
+    else:
+        h.update(f"{obj!r};".encode())
+
+
+def _find_unchanged(
+    fingerprints: list[str], previous: typing.FilePath | None
+) -> dict[int, int]:
+    # Maps the indices of the records to those of the slides built from them.
+    if previous is None or not os.path.exists(previous):
+        return {}
+    indices: dict[str | None, list[int]] = {}
+    for j, fingerprint in enumerate(core.read_slide_tags(previous, _FINGERPRINT_TAG)):
+        indices.setdefault(fingerprint, []).append(j)
+    return {
+        i: indices[fingerprint].pop(0)
+        for i, fingerprint in enumerate(fingerprints)
+        if indices.get(fingerprint)
+    }
+
+
+def _get_formatted_figures(
+    records: list[Record], n_points: int | None = None
+) -> list[dict[str, t.Any]]:
+    return [
+        _get_formatted_figure(
+            fig if n_points is None else tdownsample.downsample_figure(fig, n_points),
+            record.date,
+        )
+        for record in records
+        for fig in (record.h_fig, record.v_fig)
+    ]
+
+
+def _get_n_points(dpi: float | typing.Quality | None, downsample: bool) -> int | None:
+    return tdownsample.get_n_points(11.5, dpi or "print") if downsample else None
+
+
+def _get_render_options(
+    figs: list[dict[str, t.Any]],
+    dpi: float | typing.Quality | None,
+    figure_format: typing.FigureFormat,
+) -> list[tuple[str, float]]:
+    if not figs or figure_format == "chart":
+        return []
+    if figure_format == "svg":
+        return [
+            ("svg", 1.0),
+            ("png", render.get_scale(figs[0], 11.5, 11.5, dpi or "draft")),
+        ]
+    scale = 10.0 if dpi is None else render.get_scale(figs[0], 11.5, 11.5, dpi)
+    return [("png", scale)]
+
+
+def _assemble(
+    records: list[Record],
+    figs: list[dict[str, t.Any]],
+    images: list[list[bytes]],
+    figure_format: typing.FigureFormat,
+    fingerprints: list[str],
+) -> core.Presentation:
+    prs = core.new_presentation(figure_format=figure_format)
+    for i, record in enumerate(records):
+        slide = prs.slides[0] if i == 0 else prs.add_slide()
+        slide.set_tag(_FINGERPRINT_TAG, fingerprints[i])
+        for j, left in enumerate(_FIGURE_LEFTS, start=2 * i):
+            if figure_format == "chart":
+                slide.add_chart(go.Figure(figs[j]), left=left, top=_FIGURE_TOP)
+            elif figure_format == "svg":
+                slide.add_svg(images[0][j], images[1][j], left=left, top=_FIGURE_TOP)
+            else:
+                slide.add_image(images[0][j], left=left, top=_FIGURE_TOP)
+        _add_texts(slide, record)
     return prs
 
 
-def _get_formatted_figure(fig: go.Figure, date: datetime.date) -> go.Figure:
-    return (
-        go.Figure(fig)
-        .add_annotation(figure.get_date_annotation(date))
-        .update_layout(figure.get_default_layout(), showlegend=False)
-        .update_xaxes(figure.get_default_axis())
-        .update_yaxes(figure.get_default_axis())
-        .update_traces(line=dict(width=1))
+def _add_texts(slide: core.Slide, record: Record) -> None:
+    # The omitted peaks have been derived by `_complete_records`.
+    assert record.center_wavelength is not None and record.FWHM is not None
+    _a = int(100 * record.a / (record.a + record.b))
+    slide.update_title(text=record.title_text).add_texts(
+        [
+            core.TextSpec(
+                f"Excitation wavelength : {int(record.excitation_wavelength):d} nm\n"
+                f"Excitation power : {int(record.excitation_power):d} mW\n"
+                f"Time range : {int(record.time_range):d} ns\n",
+                left=2.33,
+                top=2.5,
+            ),
+            core.TextSpec(
+                f"Center wavelength : {round(record.center_wavelength):d} nm\n"
+                f"FWHM : {record.FWHM:.2g} nm\n"
+                f"Frame : {int(record.frame):d}\n",
+                left=14.33,
+                top=2.5,
+            ),
+            core.TextSpec(
+                f"a : b = {_a:d} : {100 - _a:d}",
+                left=14.33,
+                top=17.0,
+                font_name="Cambria Math",
+            ),
+            core.TextSpec(
+                f"τ₁ = {record.tau1:.2g} ns\n" f"τ₂ = {record.tau2:.2g} ns\n",
+                left=19.33,
+                top=17.0,
+                font_name="Cambria Math",
+            ),
+        ]
     )
+
+
+_FINGERPRINT_TAG = "TLAB_PPTX_FINGERPRINT"
+_FIGURE_LEFTS = (0.33, 12.33)
+_FIGURE_TOP = 5.0
+
+
+def _render(
+    figs: list[dict[str, t.Any]],
+    format: str,
+    scale: float,
+    cache: render.RenderCache | None,
+    pool: render.RenderPool | None,
+) -> list[bytes]:
+    if pool is None:
+        return [render.to_image(fig, format, scale, cache) for fig in figs]
+    return pool.render(figs, format, scale, cache)
+
+
+async def _render_async(
+    figs: list[dict[str, t.Any]],
+    format: str,
+    scale: float,
+    cache: render.RenderCache | None,
+    pool: render.RenderPool | None,
+) -> list[bytes]:
+    return list(
+        await asyncio.gather(
+            *(render.to_image_async(fig, format, scale, cache, pool) for fig in figs)
+        )
+    )
+
+
+def _get_formatted_figure(fig: go.Figure, date: datetime.date) -> dict[str, t.Any]:
+    # The trace data is shared with fig instead of being copied and validated.
+    with profiling.span("format_figure"):
+        return figure.update_figure_dict(
+            fig,
+            layout=dict(figure.get_default_layout(), showlegend=False),
+            xaxes=figure.get_default_axis(),
+            yaxes=figure.get_default_axis(),
+            traces=dict(line=dict(width=1)),
+            annotations=[figure.get_date_annotation(date)],
+        )
@@ -0,0 +1,200 @@
+import contextlib
+import contextvars
+import dataclasses
+import sys
+import time
+import types
+import typing as t
+from collections import abc
+
+
+@dataclasses.dataclass(frozen=True)
+class Span:
+    """
+    A timing of a stage of building a presentation.
+    """
+
+    name: str
+    """The name of the stage such as `render` and `save`."""
+    duration: float
+    """The wall time of the stage in seconds."""
+    nbytes: int | None = None
+    """The number of bytes produced by the stage if any."""
+
+
+Hook = abc.Callable[[Span], None]
+"""A callback called with each finished span."""
+
+# Hooks are per context, so that concurrent builds in threads
+# or asyncio tasks are profiled separately.
+_hooks: contextvars.ContextVar[tuple[Hook, ...]] = contextvars.ContextVar(
+    "hooks", default=()
+)
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Registers a callback called with each finished span.
+
+    The callback is registered in the current context, i.e., it receives
+    the spans of the current thread or asyncio task and of the tasks and
+    `asyncio.to_thread` calls started from it afterwards.
+
+    Parameters
+    ----------
+    hook : tlab_pptx.profiling.Hook
+        A callback. It may be called from other threads.
+    """
+    _hooks.set((*_hooks.get(), hook))
+
+
+def remove_hook(hook: Hook) -> None:
+    """
+    Unregisters a callback registered by `add_hook` in the current context.
+
+    Parameters
+    ----------
+    hook : tlab_pptx.profiling.Hook
+        A registered callback.
+
+    Raises
+    ------
+    ValueError
+        If the callback is not registered.
+    """
+    hooks = list(_hooks.get())
+    hooks.remove(hook)
+    _hooks.set(tuple(hooks))
+
+
+@dataclasses.dataclass()
+class Recorder:
+    """
+    A recorder of a span being measured.
+    """
+
+    enabled: bool
+    """True if any hook is registered and the span is emitted."""
+    nbytes: int | None = None
+    """The number of bytes produced by the stage if any."""
+
+
+@contextlib.contextmanager
+def span(name: str) -> abc.Iterator[Recorder]:
+    """
+    Measures a stage and emits its span to the registered hooks.
+
+    Nothing is measured while no hook is registered.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage.
+
+    Yields
+    ------
+    tlab_pptx.profiling.Recorder
+        A recorder to which the number of bytes produced can be set.
+
+    Examples
+    --------
+    >>> with Profile() as profile:
+    ...     with span("encode") as recorder:
+    ...         recorder.nbytes = len("text".encode())
+    >>> [(s.name, s.nbytes) for s in profile.spans]
+    [('encode', 4)]
+    """
+    hooks = _hooks.get()
+    recorder = Recorder(enabled=bool(hooks))
+    if not hooks:
+        yield recorder
+        return
+    start = time.perf_counter()
+    try:
+        yield recorder
+    finally:
+        finished = Span(name, time.perf_counter() - start, recorder.nbytes)
+        for hook in hooks:
+            hook(finished)
+
+
+@dataclasses.dataclass()
+class Profile:
+    """
+    A hook aggregating spans into a breakdown by stage.
+
+    Spans are collected while it is used as a context manager,
+    from the thread or asyncio task in which it is entered.
+
+    Examples
+    --------
+    >>> with Profile() as profile:  # doctest: +SKIP
+    ...     prs = photo_luminescence.build(...)
+    ...     prs.save("out.pptx")
+    >>> profile.print()  # doctest: +SKIP
+    stage              count   total (s)   mean (ms)   bytes (KiB)
+    render                 2       0.912       456.0         620.1
+    ...
+    """
+
+    spans: list[Span] = dataclasses.field(default_factory=list)
+    """The collected spans in the order in which they finished."""
+
+    def __call__(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def __enter__(self) -> "Profile":
+        add_hook(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        remove_hook(self)
+
+    def summary(self) -> dict[str, dict[str, t.Any]]:
+        """
+        Aggregates the spans by stage.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            The count, the total duration in seconds and the total bytes
+            of each stage in the order in which the stages first finished.
+        """
+        stages: dict[str, dict[str, t.Any]] = {}
+        for span in self.spans:
+            stage = stages.setdefault(
+                span.name, dict(count=0, duration=0.0, nbytes=None)
+            )
+            stage["count"] += 1
+            stage["duration"] += span.duration
+            if span.nbytes is not None:
+                stage["nbytes"] = (stage["nbytes"] or 0) + span.nbytes
+        return stages
+
+    def print(self, file: t.TextIO | None = None) -> None:
+        """
+        Prints the breakdown by stage.
+
+        Parameters
+        ----------
+        file : TextIO | None
+            A file to which the breakdown is printed.
+            If None (default), it is printed to the standard error.
+        """
+        lines = [
+            f"{'stage':<16} {'count':>7} {'total (s)':>11} "
+            f"{'mean (ms)':>11} {'bytes (KiB)':>13}"
+        ]
+        for name, stage in self.summary().items():
+            nbytes = stage["nbytes"]
+            lines.append(
+                f"{name:<16} {stage['count']:>7d} {stage['duration']:>11.3f} "
+                f"{stage['duration'] / stage['count'] * 1000:>11.1f} "
+                f"{'' if nbytes is None else f'{nbytes / 1024:.1f}':>13}"
+            )
+        print("\n".join(lines), file=file or sys.stderr)
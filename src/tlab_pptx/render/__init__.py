@@ -0,0 +1,9 @@
+from .cache import RenderCache as RenderCache
+from .cache import get_default_cache_dir as get_default_cache_dir
+from .image import QUALITY_DPI as QUALITY_DPI
+from .image import get_scale as get_scale
+from .image import to_image as to_image
+from .image import to_image_async as to_image_async
+from .optimize import optimize_png as optimize_png
+from .pool import RenderPool as RenderPool
+from .pool import to_images as to_images
@@ -0,0 +1,190 @@
+import dataclasses
+import functools
+import hashlib
+import importlib.metadata
+import json
+import os
+import pathlib
+import tempfile
+import typing as t
+
+import plotly
+import plotly.graph_objects as go
+import plotly.utils
+
+from tlab_pptx import typing
+
+_CACHE_DIR_ENV = "TLAB_PPTX_CACHE_DIR"
+# The entries are kept in a subdirectory of their own so that the cache
+# never deletes other files in the directory given by the user.
+_ENTRIES_DIR = "images"
+_LOW_WATER = 0.9
+
+
+def get_default_cache_dir() -> str:
+    """
+    Gets the default directory of the render cache.
+
+    The directory is taken from the environment variable `TLAB_PPTX_CACHE_DIR`
+    if it is set, otherwise `$XDG_CACHE_HOME/tlab-pptx` (`~/.cache/tlab-pptx`).
+
+    Returns
+    -------
+    str
+        The default cache directory.
+    """
+    if cache_dir := os.environ.get(_CACHE_DIR_ENV):
+        return cache_dir
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "tlab-pptx")
+
+
+@dataclasses.dataclass()
+class RenderCache:
+    """
+    A content-addressed on-disk cache of rendered figure images.
+
+    Entries are keyed on a stable hash of the figure JSON and the render options.
+    When the total size exceeds `max_bytes`, the least recently used entries
+    are evicted down to 90% of it, so that the directory is scanned
+    only once in a while rather than on every `RenderCache.put`.
+    The entries are stored in the subdirectory `images` of `directory`.
+    """
+
+    directory: typing.FilePath = dataclasses.field(
+        default_factory=get_default_cache_dir
+    )
+    """The directory in which rendered images are stored."""
+    max_bytes: int = 1024**3
+    """The maximum total size of the cached images in bytes."""
+    _nbytes: int | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def _path(self) -> pathlib.Path:
+        return pathlib.Path(self.directory) / _ENTRIES_DIR
+
+    def get_key(self, fig: go.Figure | dict[str, t.Any], **options: t.Any) -> str:
+        """
+        Gets the cache key of a figure rendered with options.
+
+        The key also depends on the versions of plotly and Kaleido,
+        so images rendered by other versions are not reused.
+
+        Parameters
+        ----------
+        fig : plotly.graph_objects.Figure | dict[str, Any]
+            A figure or a figure dict to be rendered.
+        **options : Any
+            Render options such as `format` and `scale`.
+
+        Returns
+        -------
+        str
+            A hex digest identifying the rendered image.
+        """
+        h = hashlib.sha256()
+        h.update(plotly.__version__.encode())
+        h.update(_get_kaleido_version().encode())
+        h.update(json.dumps(options, sort_keys=True).encode())
+        h.update(
+            json.dumps(
+                fig if isinstance(fig, dict) else fig.to_plotly_json(),
+                cls=plotly.utils.PlotlyJSONEncoder,
+                sort_keys=True,
+            ).encode()
+        )
+        return h.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Gets a cached image and marks it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            A key returned by `RenderCache.get_key`.
+
+        Returns
+        -------
+        bytes | None
+            The cached image, or None if it is not cached.
+        """
+        path = self._path / key
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Stores an image and evicts the least recently used entries if needed.
+
+        Parameters
+        ----------
+        key : str
+            A key returned by `RenderCache.get_key`.
+        data : bytes
+            The rendered image.
+        """
+        self._path.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._path, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path / key)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        # The total is scanned once and then kept running. Entries put by other
+        # processes are counted on the next scan.
+        if self._nbytes is None:
+            self._nbytes = sum(size for _, size, _ in self._scan())
+        else:
+            self._nbytes += len(data)
+        if self._nbytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries
+        until the cache takes up at most 90% of `max_bytes`.
+        """
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes * _LOW_WATER:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._nbytes = total
+
+    def clear(self) -> None:
+        """
+        Removes all entries in the cache.
+        """
+        for _, _, path in self._scan():
+            path.unlink(missing_ok=True)
+        self._nbytes = 0
+
+    def _scan(self) -> list[tuple[int, int, pathlib.Path]]:
+        # Returns the last access time, the size and the path of each entry.
+        entries = []
+        for path in self._path.glob("[!.]*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+
+
+@functools.cache
+def _get_kaleido_version() -> str:
+    # Read from the metadata to avoid importing Kaleido.
+    return importlib.metadata.version("kaleido")
@@ -0,0 +1,165 @@
+import asyncio
+import typing as t
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from tlab_pptx import profiling, typing
+from tlab_pptx.render import cache as rcache
+from tlab_pptx.render import pool as rpool
+
+QUALITY_DPI: dict[typing.Quality, float] = {
+    "draft": 72,
+    "screen": 150,
+    "print": 300,
+}
+"""The resolution in DPI of each quality profile."""
+
+
+def to_image(
+    fig: go.Figure | dict[str, t.Any],
+    format: str = "png",
+    scale: float = 10,
+    cache: rcache.RenderCache | None = None,
+) -> bytes:
+    """
+    Renders a figure as an image.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure | dict[str, Any]
+        A figure or a figure dict to be rendered. A dict is not validated.
+    format : str
+        The image format such as `png` and `svg`.
+    scale : float
+        The scale factor of the image relative to the figure layout size.
+    cache : tlab_pptx.render.RenderCache | None
+        A cache of rendered images. If None (default), the figure is always rendered.
+
+    Returns
+    -------
+    bytes
+        The rendered image.
+    """
+    if cache is None:
+        return _render(fig, format, scale)
+    with profiling.span("cache_get"):
+        key = cache.get_key(fig, format=format, scale=scale)
+        data = cache.get(key)
+    if data is None:
+        data = _render(fig, format, scale)
+        cache.put(key, data)
+    return data
+
+
+async def to_image_async(
+    fig: go.Figure | dict[str, t.Any],
+    format: str = "png",
+    scale: float = 10,
+    cache: rcache.RenderCache | None = None,
+    pool: rpool.RenderPool | None = None,
+) -> bytes:
+    """
+    Renders a figure as an image without blocking the event loop.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure | dict[str, Any]
+        A figure or a figure dict to be rendered. A dict is not validated.
+    format : str
+        The image format such as `png` and `svg`.
+    scale : float
+        The scale factor of the image relative to the figure layout size.
+    cache : tlab_pptx.render.RenderCache | None
+        A cache of rendered images. If None (default), the figure is always rendered.
+    pool : tlab_pptx.render.RenderPool | None
+        A pool in which the figure is rendered, so that renders awaited
+        concurrently run in parallel up to its number of workers.
+        If None (default), the figure is rendered in a thread.
+
+    Returns
+    -------
+    bytes
+        The rendered image.
+    """
+    if pool is None:
+        return await asyncio.to_thread(to_image, fig, format, scale, cache)
+    if cache is not None:
+        with profiling.span("cache_get"):
+            key = cache.get_key(fig, format=format, scale=scale)
+            data = cache.get(key)
+        if data is not None:
+            return data
+    with profiling.span("render") as recorder:
+        image = await asyncio.wrap_future(pool.submit(fig, format, scale))
+        recorder.nbytes = len(image)
+    if cache is not None:
+        cache.put(key, image)
+    return image
+
+
+def get_scale(
+    fig: go.Figure | dict[str, t.Any],
+    width: float,
+    height: float,
+    dpi: float | typing.Quality,
+) -> float:
+    """
+    Gets the scale factor to render a figure at a resolution for its size on a slide.
+
+    Parameters
+    ----------
+    fig : plotly.graph_objects.Figure | dict[str, Any]
+        A figure or a figure dict to be rendered.
+    width : float
+        The width of the figure on a slide in centimeter.
+    height : float
+        The height of the figure on a slide in centimeter.
+    dpi : float | tlab_pptx.typing.Quality
+        The target resolution in DPI or a quality profile in `QUALITY_DPI`.
+
+    Returns
+    -------
+    float
+        The scale factor relative to the figure layout size.
+
+    Raises
+    ------
+    ValueError
+        If dpi is an unknown quality profile.
+
+    Examples
+    --------
+    >>> fig = go.Figure(layout=dict(width=450, height=450))
+    >>> round(get_scale(fig, 11.43, 11.43, 150), 3)
+    1.5
+    >>> round(get_scale(fig, 11.43, 11.43, "print"), 3)
+    3.0
+    """
+    if isinstance(dpi, str):
+        try:
+            dpi = QUALITY_DPI[dpi]
+        except KeyError as err:
+            raise ValueError(f"Unknown quality profile {dpi!r}") from err
+    if isinstance(fig, dict):
+        layout = fig.get("layout", {})
+        fig_width, fig_height = layout.get("width"), layout.get("height")
+    else:
+        fig_width, fig_height = fig.layout.width, fig.layout.height
+    px_width: float = fig_width or pio.kaleido.scope.default_width
+    px_height: float = fig_height or pio.kaleido.scope.default_height
+    return max(
+        width / 2.54 * dpi / px_width,
+        height / 2.54 * dpi / px_height,
+    )
+
+
+def _render(fig: go.Figure | dict[str, t.Any], format: str, scale: float) -> bytes:
+    with profiling.span("render") as recorder:
+        if isinstance(fig, dict):
+            data = pio.to_image(fig, format, scale=scale, validate=False)
+        else:
+            data = fig.to_image(format, scale=scale)
+        assert isinstance(data, bytes)
+        recorder.nbytes = len(data)
+    return data
@@ -0,0 +1,178 @@
+import dataclasses
+import multiprocessing
+import threading
+import types
+import typing as t
+from collections import abc
+from concurrent import futures
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from tlab_pptx import profiling
+from tlab_pptx.render import cache as rcache
+
+
+@dataclasses.dataclass()
+class RenderPool:
+    """
+    A pool of worker processes rendering figures concurrently.
+
+    Each worker keeps its own Kaleido subprocess warm between renders.
+    Workers are spawned lazily on the first render and stopped by
+    `RenderPool.shutdown` or on leaving the `with` block.
+    A pool can be shared by threads.
+    Since the workers are spawned and import the main module,
+    a script using a pool must do so under `if __name__ == "__main__":`.
+
+    Examples
+    --------
+    >>> with RenderPool(max_workers=4) as pool:  # doctest: +SKIP
+    ...     images = pool.render([fig1, fig2, fig3])
+    """
+
+    max_workers: int | None = None
+    """The number of worker processes. If None, the number of CPUs is used."""
+    _executor: futures.ProcessPoolExecutor | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __enter__(self) -> "RenderPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    def submit(
+        self,
+        fig: go.Figure | dict[str, t.Any],
+        format: str = "png",
+        scale: float = 10,
+    ) -> "futures.Future[bytes]":
+        """
+        Schedules a figure to be rendered.
+
+        Parameters
+        ----------
+        fig : plotly.graph_objects.Figure | dict[str, Any]
+            A figure or a figure dict to be rendered. A dict is not validated.
+        format : str
+            The image format such as `png` and `svg`.
+        scale : float
+            The scale factor of the image relative to the figure layout size.
+
+        Returns
+        -------
+        concurrent.futures.Future[bytes]
+            A future of the rendered image.
+        """
+        fig_dict = fig if isinstance(fig, dict) else fig.to_plotly_json()
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    # Forked workers would share the Kaleido subprocess of the parent.
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor.submit(_render, fig_dict, format, scale)
+
+    def render(
+        self,
+        figs: abc.Iterable[go.Figure | dict[str, t.Any]],
+        format: str = "png",
+        scale: float = 10,
+        cache: rcache.RenderCache | None = None,
+    ) -> list[bytes]:
+        """
+        Renders figures concurrently.
+
+        Parameters
+        ----------
+        figs : Iterable[plotly.graph_objects.Figure | dict[str, Any]]
+            Figures or figure dicts to be rendered.
+        format : str
+            The image format such as `png` and `svg`.
+        scale : float
+            The scale factor of the images relative to the figure layout size.
+        cache : tlab_pptx.render.RenderCache | None
+            A cache of rendered images. Only figures missing in the cache are rendered.
+
+        Returns
+        -------
+        list[bytes]
+            The rendered images in the same order as `figs`.
+        """
+        images: list[bytes | futures.Future[bytes]] = []
+        keys: dict[int, str] = {}
+        with profiling.span("render") as recorder:
+            for i, fig in enumerate(figs):
+                if cache is not None:
+                    keys[i] = cache.get_key(fig, format=format, scale=scale)
+                    if (data := cache.get(keys[i])) is not None:
+                        images.append(data)
+                        continue
+                images.append(self.submit(fig, format, scale))
+            results = []
+            for i, image in enumerate(images):
+                if isinstance(image, futures.Future):
+                    image = image.result()
+                    if cache is not None:
+                        cache.put(keys[i], image)
+                results.append(image)
+            recorder.nbytes = sum(map(len, results))
+        return results
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+def to_images(
+    figs: abc.Iterable[go.Figure | dict[str, t.Any]],
+    format: str = "png",
+    scale: float = 10,
+    cache: rcache.RenderCache | None = None,
+    max_workers: int | None = None,
+) -> list[bytes]:
+    """
+    Renders figures concurrently with a temporary `RenderPool`.
+
+    Parameters
+    ----------
+    figs : Iterable[plotly.graph_objects.Figure | dict[str, Any]]
+        Figures or figure dicts to be rendered.
+    format : str
+        The image format such as `png` and `svg`.
+    scale : float
+        The scale factor of the images relative to the figure layout size.
+    cache : tlab_pptx.render.RenderCache | None
+        A cache of rendered images.
+    max_workers : int | None
+        The number of worker processes. If None, the number of CPUs is used.
+
+    Returns
+    -------
+    list[bytes]
+        The rendered images in the same order as `figs`.
+    """
+    with RenderPool(max_workers) as pool:
+        return pool.render(figs, format, scale, cache)
+
+
+def _render(fig: dict[str, t.Any], format: str, scale: float) -> bytes:
+    data = pio.to_image(fig, format, scale=scale, validate=False)
+    assert isinstance(data, bytes)
+    return data
@@ -0,0 +1,270 @@
+import dataclasses
+import http
+import http.server
+import io
+import json
+import os
+import threading
+import types
+import typing as t
+
+import plotly.graph_objects as go
+
+from tlab_pptx import core, render, typing
+from tlab_pptx.presentation import photo_luminescence
+
+_PPTX_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+)
+
+
+class _RequestError(Exception):
+    def __init__(self, status: http.HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclasses.dataclass()
+class ReportServer:
+    """
+    A local HTTP server building photo luminescence decks on request.
+
+    The server keeps the worker processes of a `tlab_pptx.render.RenderPool`
+    and the parsed template alive between requests, so a deck is built
+    without starting Kaleido or parsing the template again.
+    Each request is handled in a thread. Up to `max_builds` decks are built
+    at a time, up to `max_pending` more requests wait for their turn,
+    and the others are rejected with 503 instead of piling up.
+
+    `POST /photo-luminescence` takes a JSON object with the fields of
+    `tlab_pptx.presentation.photo_luminescence.Record`, where `date` is
+    an ISO format string and `h_fig` and `v_fig` are replaced by `h_data` and
+    `v_data` of the form `{"x": [...], "y": {"<trace name>": [...]}}` with
+    an optional `x_title`. The options `dpi`, `figure_format` and `downsample`
+    of `tlab_pptx.presentation.photo_luminescence.build` are also accepted.
+    The response is the `.pptx` file.
+    `GET /health` returns 200 when the server is up.
+
+    Examples
+    --------
+    >>> with ReportServer(port=8000) as server:  # doctest: +SKIP
+    ...     server.warm_up()
+    ...     server.serve_forever()
+    """
+
+    host: str = "127.0.0.1"
+    """The host to which the server is bound."""
+    port: int = 8000
+    """The port to which the server is bound. If 0, a free port is chosen."""
+    max_workers: int | None = None
+    """The number of rendering processes. If None, the number of CPUs is used."""
+    max_builds: int = 4
+    """The maximum number of decks built at a time."""
+    max_pending: int = 16
+    """The maximum number of requests waiting for a build to finish."""
+    max_request_bytes: int = 64 * 1024**2
+    """The maximum size of a request body."""
+    cache: render.RenderCache | None = None
+    """A cache of rendered figures shared by the requests."""
+    _pool: render.RenderPool = dataclasses.field(init=False, repr=False)
+    _admission: threading.BoundedSemaphore = dataclasses.field(init=False, repr=False)
+    _builds: threading.BoundedSemaphore = dataclasses.field(init=False, repr=False)
+    _httpd: "_HTTPServer" = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._pool = render.RenderPool(self.max_workers)
+        self._admission = threading.BoundedSemaphore(self.max_builds + self.max_pending)
+        self._builds = threading.BoundedSemaphore(self.max_builds)
+        self._httpd = _HTTPServer((self.host, self.port), _Handler, self)
+
+    def __enter__(self) -> "ReportServer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The host and the port to which the server is bound."""
+        host, port = self._httpd.server_address[:2]
+        return str(host), int(port)
+
+    def warm_up(self) -> None:
+        """
+        Parses the template and starts all the rendering processes in advance,
+        so that the first requests are as fast as the others.
+        """
+        core.new_presentation()
+        n_workers = self.max_workers or os.cpu_count() or 1
+        self._pool.render([go.Figure()] * n_workers, scale=1)
+
+    def serve_forever(self) -> None:
+        """
+        Handles requests until `ReportServer.shutdown` is called.
+        """
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        """
+        Stops `ReportServer.serve_forever` running in another thread.
+        """
+        self._httpd.shutdown()
+
+    def close(self) -> None:
+        """
+        Closes the socket and stops the rendering processes.
+        """
+        self._httpd.server_close()
+        self._pool.shutdown()
+
+    def _build(self, request: dict[str, t.Any]) -> bytes:
+        record = photo_luminescence.Record.from_mapping(
+            {
+                **request,
+                "h_fig": _get_figure(request, "h_data"),
+                "v_fig": _get_figure(request, "v_data"),
+            }
+        )
+        options = _get_options(request)
+        # Waits in the queue admitted by `_admission` until a build slot is free.
+        with self._builds:
+            prs = photo_luminescence.build(
+                **vars(record), cache=self.cache, pool=self._pool, **options
+            )
+            buffer = io.BytesIO()
+            prs.save(buffer)
+        return buffer.getvalue()
+
+
+class _HTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        handler: type[http.server.BaseHTTPRequestHandler],
+        report_server: ReportServer,
+    ) -> None:
+        super().__init__(address, handler)
+        self.report_server = report_server
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server: _HTTPServer
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(http.HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send_error(http.HTTPStatus.NOT_FOUND, f"{self.path} is not found")
+
+    def do_POST(self) -> None:
+        if self.path != "/photo-luminescence":
+            self._send_error(http.HTTPStatus.NOT_FOUND, f"{self.path} is not found")
+            return
+        report_server = self.server.report_server
+        try:
+            length = self._get_content_length(report_server.max_request_bytes)
+        except _RequestError as err:
+            self._send_error(err.status, str(err))
+            return
+        if not report_server._admission.acquire(blocking=False):
+            self._send_error(
+                http.HTTPStatus.SERVICE_UNAVAILABLE, "too many pending requests"
+            )
+            return
+        try:
+            request = json.loads(self.rfile.read(length))
+            if not isinstance(request, dict):
+                raise ValueError("the request is not a JSON object")
+            data = report_server._build(request)
+        except (ValueError, TypeError) as err:
+            self._send_error(
+                http.HTTPStatus.BAD_REQUEST, f"{type(err).__name__}: {err}"
+            )
+        except Exception as err:
+            self.log_error("failed to build a deck: %r", err)
+            self._send_error(
+                http.HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(err).__name__}: {err}"
+            )
+        else:
+            self._send(http.HTTPStatus.OK, _PPTX_CONTENT_TYPE, data)
+        finally:
+            report_server._admission.release()
+
+    def _get_content_length(self, max_bytes: int) -> int:
+        value = self.headers.get("Content-Length")
+        if value is None:
+            raise _RequestError(
+                http.HTTPStatus.LENGTH_REQUIRED, "Content-Length is required"
+            )
+        try:
+            length = int(value)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise _RequestError(
+                http.HTTPStatus.BAD_REQUEST, f"Content-Length {value} is invalid"
+            )
+        if length > max_bytes:
+            raise _RequestError(
+                http.HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"the request is larger than {max_bytes} bytes",
+            )
+        return length
+
+    def _send(self, status: http.HTTPStatus, content_type: str, data: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        if status == http.HTTPStatus.SERVICE_UNAVAILABLE:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status: http.HTTPStatus, obj: dict[str, t.Any]) -> None:
+        self._send(status, "application/json", json.dumps(obj).encode())
+
+    def _send_error(self, status: http.HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+
+def _get_options(request: dict[str, t.Any]) -> dict[str, t.Any]:
+    options: dict[str, t.Any] = {}
+    if (dpi := request.get("dpi")) is not None:
+        if not (
+            dpi in t.get_args(typing.Quality)
+            or (isinstance(dpi, int | float) and not isinstance(dpi, bool))
+        ):
+            raise ValueError(f"{dpi!r} is not a DPI or a quality")
+        options["dpi"] = dpi
+    if (figure_format := request.get("figure_format")) is not None:
+        if figure_format not in t.get_args(typing.FigureFormat):
+            raise ValueError(f"{figure_format!r} is not a figure format")
+        options["figure_format"] = figure_format
+    if (downsample := request.get("downsample")) is not None:
+        if not isinstance(downsample, bool):
+            raise ValueError(f"downsample {downsample!r} is not a boolean")
+        options["downsample"] = downsample
+    return options
+
+
+def _get_figure(request: dict[str, t.Any], name: str) -> go.Figure:
+    if name not in request:
+        raise ValueError(f"missing fields: {name}")
+    data = request[name]
+    if not isinstance(data, dict) or not isinstance(data.get("y"), dict):
+        raise ValueError(f'{name} must be {{"x": [...], "y": {{"<name>": [...]}}}}')
+    fig = go.Figure(
+        [
+            go.Scatter(x=data.get("x"), y=y, name=str(trace_name))
+            for trace_name, y in data["y"].items()
+        ]
+    )
+    fig.update_xaxes(title=data.get("x_title"))
+    return fig
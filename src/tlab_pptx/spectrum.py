@@ -0,0 +1,173 @@
+import dataclasses
+
+import numpy as np
+import numpy.typing as npt
+
+from tlab_pptx import profiling
+
+
+@dataclasses.dataclass(frozen=True)
+class SpectrumPeaks:
+    """
+    The peaks of spectra found by `analyze_spectra`.
+
+    Each field is an array with a value for each spectrum,
+    which is NaN if the spectrum has no finite value or no half maximum.
+    """
+
+    center_wavelength: npt.NDArray[np.float64]
+    """The wavelengths of the peaks."""
+    FWHM: npt.NDArray[np.float64]
+    """The full widths at half maximum of the peaks."""
+    height: npt.NDArray[np.float64]
+    """The intensities of the peaks."""
+
+    def __len__(self) -> int:
+        return len(self.center_wavelength)
+
+    def params(self, i: int) -> dict[str, float]:
+        """
+        Gets the parameters of a spectrum to be passed to
+        `tlab_pptx.presentation.photo_luminescence.build`.
+
+        Parameters
+        ----------
+        i : int
+            The index of the spectrum.
+
+        Returns
+        -------
+        dict[str, float]
+            The values of `center_wavelength` and `FWHM`.
+        """
+        return dict(
+            center_wavelength=float(self.center_wavelength[i]),
+            FWHM=float(self.FWHM[i]),
+        )
+
+
+def analyze_spectra(
+    wavelength: npt.ArrayLike, intensity: npt.ArrayLike
+) -> SpectrumPeaks:
+    """
+    Finds the peak wavelength and the FWHM of a stack of spectra at once.
+
+    The peak is interpolated by the parabola through the maximum point
+    and its neighbors, and the half maximum is crossed between the points
+    by linear interpolation, so both are finer than the wavelength step.
+    The FWHM is measured from zero intensity, so a background
+    has to be subtracted in advance.
+
+    Parameters
+    ----------
+    wavelength : ArrayLike
+        The wavelengths in ascending or descending order,
+        shared by the spectra or in the same shape as `intensity`.
+    intensity : ArrayLike
+        The intensities of a spectrum or a 2D array of spectra in rows.
+        NaN values are skipped in finding the maximum, but the peak is not
+        interpolated next to them, and the FWHM is NaN if one lies
+        between the peak and a half maximum.
+
+    Returns
+    -------
+    tlab_pptx.spectrum.SpectrumPeaks
+        The peak of each spectrum.
+
+    Raises
+    ------
+    ValueError
+        If the shapes of `wavelength` and `intensity` do not match.
+
+    Examples
+    --------
+    >>> wavelength = np.arange(400, 600, 2)
+    >>> intensity = np.exp(-4 * np.log(2) * ((wavelength - 482) / 30) ** 2)
+    >>> peaks = analyze_spectra(wavelength, intensity)
+    >>> np.round([peaks.center_wavelength[0], peaks.FWHM[0]], 1).tolist()
+    [482.0, 30.0]
+    """
+    ys = np.atleast_2d(np.asarray(intensity, dtype=float))
+    try:
+        xs = np.broadcast_to(np.asarray(wavelength, dtype=float), ys.shape)
+    except ValueError as err:
+        raise ValueError(
+            f"shapes {np.shape(wavelength)} and {np.shape(intensity)} do not match"
+        ) from err
+    if ys.ndim != 2:
+        raise ValueError(f"intensity of {ys.ndim} dimensions is not supported")
+    if ys.shape[1] == 0:
+        empty = np.full(len(ys), np.nan)
+        return SpectrumPeaks(center_wavelength=empty, FWHM=empty, height=empty)
+    with profiling.span("analyze_spectra") as recorder:
+        valid = np.isfinite(ys).any(axis=1)
+        k = np.where(np.isfinite(ys), ys, -np.inf).argmax(axis=1)
+        center, height = _get_peaks(xs, ys, k)
+        fwhm = _get_widths(xs, ys, k, height / 2)
+        center, height, fwhm = (
+            np.where(valid, v, np.nan) for v in (center, height, fwhm)
+        )
+        recorder.nbytes = ys.nbytes
+    return SpectrumPeaks(center_wavelength=center, FWHM=fwhm, height=height)
+
+
+def _get_peaks(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64], k: npt.NDArray[np.intp]
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    rows = np.arange(len(y))
+    n = y.shape[1]
+    # The vertex of the parabola through the points k - 1, k and k + 1
+    # relative to the point k.
+    km, kp = np.maximum(k - 1, 0), np.minimum(k + 1, n - 1)
+    x1, y1 = x[rows, k], y[rows, k]
+    u0, u2 = x[rows, km] - x1, x[rows, kp] - x1
+    d0, d2 = y[rows, km] - y1, y[rows, kp] - y1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        det = u0 * u2 * (u0 - u2)
+        a = (d0 * u2 - d2 * u0) / det
+        b = (u0**2 * d2 - u2**2 * d0) / det
+        vertex = -b / (2 * a)
+        ok = (km < k) & (k < kp) & (a < 0) & np.isfinite(d0 + d2)
+        vertex = np.clip(vertex, np.minimum(u0, u2), np.maximum(u0, u2))
+        center = np.where(ok, x1 + vertex, x1)
+        peak = np.where(ok, y1 - b**2 / (4 * a), y1)
+    return center, peak
+
+
+def _get_widths(
+    x: npt.NDArray[np.float64],
+    y: npt.NDArray[np.float64],
+    k: npt.NDArray[np.intp],
+    half: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    rows = np.arange(len(y))
+    n = y.shape[1]
+    idx = np.arange(n)
+    below = y < half[:, None]
+    # The last point below the half maximum before the peak
+    # and the first one after it.
+    left = np.where(below & (idx < k[:, None]), idx, -1).max(axis=1, initial=-1)
+    right = np.where(below & (idx > k[:, None]), idx, n).min(axis=1, initial=n)
+    found = (left >= 0) & (right < n)
+    left, right = np.where(found, left, 0), np.where(found, right, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_left = _interpolate(x, y, half, rows, left, left + 1)
+        x_right = _interpolate(x, y, half, rows, right - 1, right)
+    return np.where(found, np.abs(x_right - x_left), np.nan)
+
+
+def _interpolate(
+    x: npt.NDArray[np.float64],
+    y: npt.NDArray[np.float64],
+    level: npt.NDArray[np.float64],
+    rows: npt.NDArray[np.intp],
+    i: npt.NDArray[np.intp],
+    j: npt.NDArray[np.intp],
+) -> npt.NDArray[np.float64]:
+    # The x values at which the lines between the points i and j cross the level.
+    n = y.shape[1]
+    i, j = np.clip(i, 0, n - 1), np.clip(j, 0, n - 1)
+    xi, xj, yi, yj = x[rows, i], x[rows, j], y[rows, i], y[rows, j]
+    ratio = np.where(yj != yi, (level - yi) / (yj - yi), 0.0)
+    crossing: npt.NDArray[np.float64] = xi + ratio * (xj - xi)
+    return crossing
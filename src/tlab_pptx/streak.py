@@ -0,0 +1,264 @@
+import dataclasses
+import os
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+import PIL.Image
+import plotly.graph_objects as go
+
+from tlab_pptx import profiling, typing
+
+_CHUNK_SIZE = 1 << 26
+_TIFF_DTYPES = {
+    "L": "u1",
+    "I;16": "<u2",
+    "I;16B": ">u2",
+    "I;16S": "<i2",
+    "I;16BS": ">i2",
+    "I;32": "<u4",
+    "I;32S": "<i4",
+    "F;32F": "<f4",
+    "F;32BF": ">f4",
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class StreakProjections:
+    """
+    The projections of a streak image computed by `StreakImage.project`.
+    """
+
+    time: npt.NDArray[np.float64]
+    """The times of the rows."""
+    decay: npt.NDArray[np.float64]
+    """The intensities vs. time summed over the wavelength ROI."""
+    wavelength: npt.NDArray[np.float64]
+    """The wavelengths of the columns."""
+    spectrum: npt.NDArray[np.float64]
+    """The intensities vs. wavelength summed over the time ROI."""
+
+    def to_figures(self) -> tuple[go.Figure, go.Figure]:
+        """
+        Creates the figures of the projections for
+        `tlab_pptx.presentation.photo_luminescence.build`.
+
+        Returns
+        -------
+        tuple[plotly.graph_objects.Figure, plotly.graph_objects.Figure]
+            The figures of PL intensity vs. time (`h_fig`)
+            and vs. wavelength (`v_fig`).
+        """
+        h_fig = go.Figure(go.Scatter(x=self.time, y=self.decay))
+        h_fig.update_layout(
+            xaxis_title="Time (ns)", yaxis_title="Intensity (arb. units)"
+        )
+        v_fig = go.Figure(go.Scatter(x=self.wavelength, y=self.spectrum))
+        v_fig.update_layout(
+            xaxis_title="Wavelength (nm)", yaxis_title="Intensity (arb. units)"
+        )
+        return h_fig, v_fig
+
+
+@dataclasses.dataclass(frozen=True)
+class StreakImage:
+    """
+    Frames of a streak image memory-mapped from a file by `open_streak_image`.
+
+    Each frame has a row for each time and a column for each wavelength.
+    """
+
+    frames: list[np.memmap[t.Any, np.dtype[t.Any]]]
+    """The frames, which are read from the file on demand."""
+    time: npt.NDArray[np.float64]
+    """The times of the rows."""
+    wavelength: npt.NDArray[np.float64]
+    """The wavelengths of the columns."""
+
+    def project(
+        self,
+        time_roi: tuple[float, float] | None = None,
+        wavelength_roi: tuple[float, float] | None = None,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> StreakProjections:
+        """
+        Sums the frames into the decay and the spectrum.
+
+        The frames are read in chunks of rows, once for both projections,
+        so the memory does not depend on the size of the file.
+
+        Parameters
+        ----------
+        time_roi : tuple[float, float] | None
+            The range of the times over which the spectrum is summed.
+            If None (default), all the rows are summed.
+        wavelength_roi : tuple[float, float] | None
+            The range of the wavelengths over which the decay is summed.
+            If None (default), all the columns are summed.
+        chunk_size : int
+            The number of bytes read at a time.
+
+        Returns
+        -------
+        tlab_pptx.streak.StreakProjections
+            The decay and the spectrum.
+        """
+        rows = _get_mask(self.time, time_roi)
+        columns = _get_mask(self.wavelength, wavelength_roi)
+        decay = np.zeros(len(self.time))
+        spectrum = np.zeros(len(self.wavelength))
+        with profiling.span("project_streak") as recorder:
+            for frame in self.frames:
+                n_rows = max(chunk_size // max(frame[:1].nbytes, 1), 1)
+                for start in range(0, len(frame), n_rows):
+                    stop = min(start + n_rows, len(frame))
+                    chunk = np.asarray(frame[start:stop], dtype=float)
+                    decay[start:stop] += chunk[:, columns].sum(axis=1)
+                    spectrum += chunk[rows[start:stop]].sum(axis=0)
+            recorder.nbytes = sum(frame.nbytes for frame in self.frames)
+        return StreakProjections(
+            time=self.time,
+            decay=decay,
+            wavelength=self.wavelength,
+            spectrum=spectrum,
+        )
+
+
+def open_streak_image(
+    filepath: typing.FilePath,
+    shape: tuple[int, int] | None = None,
+    dtype: npt.DTypeLike = "<u2",
+    offset: int = 0,
+    time: npt.ArrayLike | None = None,
+    wavelength: npt.ArrayLike | None = None,
+) -> StreakImage:
+    """
+    Opens a streak image file without reading it into memory.
+
+    A raw file is a sequence of frames of `shape` after a header of `offset` bytes.
+    Without `shape`, the file is opened as a TIFF file with a page for each frame,
+    which must be uncompressed.
+
+    Parameters
+    ----------
+    filepath : tlab_pptx.typing.FilePath
+        A filepath of a streak image.
+    shape : tuple[int, int] | None
+        The numbers of the times and the wavelengths of each frame of a raw file.
+        If None (default), the file is a TIFF file.
+    dtype : DTypeLike
+        The data type of the pixels of a raw file.
+    offset : int
+        The size of the header of a raw file in bytes.
+    time : ArrayLike | None
+        The times of the rows, such as in nanoseconds.
+        If None (default), the indices of the rows are used.
+    wavelength : ArrayLike | None
+        The wavelengths of the columns, such as in nanometers.
+        If None (default), the indices of the columns are used.
+
+    Returns
+    -------
+    tlab_pptx.streak.StreakImage
+        The memory-mapped frames.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a raw file of `shape` or an uncompressed TIFF file,
+        or `time` or `wavelength` does not match the frames.
+
+    Examples
+    --------
+    >>> image = open_streak_image("streak.raw", shape=(640, 480))  # doctest: +SKIP
+    >>> h_fig, v_fig = image.project(time_roi=(0, 2)).to_figures()  # doctest: +SKIP
+    """
+    if shape is None:
+        frames = _open_tiff(filepath)
+    else:
+        frames = _open_raw(filepath, shape, np.dtype(dtype), offset)
+    n_rows, n_columns = frames[0].shape if frames else shape or (0, 0)
+    if any(frame.shape != (n_rows, n_columns) for frame in frames):
+        raise ValueError(f"{filepath!s} has frames of different shapes")
+    return StreakImage(
+        frames=frames,
+        time=_get_axis(time, n_rows, "time"),
+        wavelength=_get_axis(wavelength, n_columns, "wavelength"),
+    )
+
+
+def _open_raw(
+    filepath: typing.FilePath,
+    shape: tuple[int, int],
+    dtype: np.dtype[t.Any],
+    offset: int,
+) -> list[np.memmap[t.Any, np.dtype[t.Any]]]:
+    frame_size = shape[0] * shape[1] * dtype.itemsize
+    size = os.path.getsize(filepath) - offset
+    if frame_size <= 0 or size < 0 or size % frame_size:
+        raise ValueError(f"{filepath!s} is not a sequence of frames of {shape}")
+    if size == 0:
+        return []
+    data = np.memmap(
+        filepath,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=(size // frame_size, *shape),
+    )
+    return list(data)
+
+
+def _open_tiff(filepath: typing.FilePath) -> list[np.memmap[t.Any, np.dtype[t.Any]]]:
+    # Only the tags are read by Pillow to find where the pixels are.
+    # The tiles are unpacked by position since they are plain tuples
+    # of (codec, extents, offset, args) before Pillow 11.
+    # The file is mapped once and the frames are views of it,
+    # since each mapping holds a file descriptor.
+    data = np.memmap(filepath, dtype=np.uint8, mode="r")
+    frames = []
+    with PIL.Image.open(filepath) as img:
+        for i in range(getattr(img, "n_frames", 1)):
+            img.seek(i)
+            width, height = img.size
+            tiles: list[t.Any] = sorted(img.tile, key=lambda tile: tile[1][1])
+            rawmode = tiles[0][3][0] if tiles and tiles[0][3] else None
+            if rawmode not in _TIFF_DTYPES:
+                raise ValueError(f"page {i} of {filepath!s} is not uncompressed")
+            dtype = np.dtype(_TIFF_DTYPES[rawmode])
+            stride = width * dtype.itemsize
+            offset = tiles[0][2]
+            for codec, (x0, y0, x1, _), tile_offset, tile_args in tiles:
+                if (
+                    codec != "raw"
+                    or tile_args[0] != rawmode
+                    or (x0, x1) != (0, width)
+                    or tile_offset != offset + y0 * stride
+                ):
+                    raise ValueError(f"page {i} of {filepath!s} is not contiguous")
+            if offset + height * stride > len(data):
+                raise ValueError(f"page {i} of {filepath!s} is truncated")
+            frame = data[offset : offset + height * stride].view(dtype)
+            frames.append(t.cast(np.memmap[t.Any, t.Any], frame.reshape(height, width)))
+    return frames
+
+
+def _get_axis(
+    values: npt.ArrayLike | None, n: int, name: str
+) -> npt.NDArray[np.float64]:
+    if values is None:
+        return np.arange(n, dtype=float)
+    axis = np.asarray(values, dtype=float)
+    if axis.shape != (n,):
+        raise ValueError(f"{name} of shape {axis.shape} does not match {n} pixels")
+    return axis
+
+
+def _get_mask(
+    axis: npt.NDArray[np.float64], roi: tuple[float, float] | None
+) -> npt.NDArray[np.bool_]:
+    if roi is None:
+        return np.ones(len(axis), dtype=bool)
+    low, high = sorted(roi)
+    mask: npt.NDArray[np.bool_] = (low <= axis) & (axis <= high)
+    return mask
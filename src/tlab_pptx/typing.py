@@ -1,5 +1,9 @@
 import io
 import os
+import typing as t
 
 FilePath = str | os.PathLike[str]
 FilePathOrBuffer = FilePath | io.BufferedIOBase
+FigureFormat = t.Literal["png", "svg", "chart"]
+Quality = t.Literal["draft", "screen", "print"]
+PngOptimization = t.Literal["lossless", "lossy"]
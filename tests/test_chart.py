@@ -0,0 +1,108 @@
+import datetime
+
+import plotly.graph_objects as go
+import pptx
+import pptx.chart.chart
+import pptx.enum.chart
+import pptx.oxml.ns
+import pptx.util
+import pytest
+
+from tlab_pptx import chart, figure
+
+
+def test_get_chart_data() -> None:
+    fig = go.Figure(
+        [
+            go.Scatter(x=[0, 1, 2], y=[1.0, float("nan"), 4.0], name="A"),
+            go.Scatter(y=[3, 4]),
+        ]
+    )
+    chart_data = chart.get_chart_data(fig)
+    assert [s.name for s in chart_data] == ["A", "Series 2"]
+    assert chart_data[0].x_values == [0.0, 2.0]
+    assert chart_data[0].y_values == [1.0, 4.0]
+    assert chart_data[1].x_values == [0.0, 1.0]
+
+
+@pytest.mark.parametrize(
+    "fig",
+    [
+        go.Figure(go.Bar(x=[0], y=[1])),
+        go.Figure(go.Scatter(x=[0], y=[1], xaxis="x2")),
+        go.Figure(go.Scatter(x=[datetime.date(2022, 1, 1)], y=[1])),
+        go.Figure(go.Scatter(x=["a"], y=[1])),
+    ],
+)
+def test_get_chart_data_unsupported(fig: go.Figure) -> None:
+    with pytest.raises(ValueError):
+        chart.get_chart_data(fig)
+
+
+@pytest.mark.parametrize(["width", "expected"], [(2.54, 0.1), (5.08, 0.2)])
+def test_get_pt_per_px(width: float, expected: float) -> None:
+    fig = go.Figure(layout=dict(width=720))
+    assert chart.get_pt_per_px(fig, width) == pytest.approx(expected)
+
+
+def test_get_paper_annotations() -> None:
+    fig = go.Figure(layout=dict(width=720, font=dict(size=20)))
+    fig.add_annotation(figure.get_date_annotation((2022, 1, 1)))
+    fig.add_annotation(text="data", x=0, y=0)
+    (annotation,) = chart.get_paper_annotations(fig, 2.54)
+    assert annotation == dict(
+        text="2022.01.01", x=1.0, y=-0.125, font_size=pytest.approx(1.4)
+    )
+
+
+def describe_format_chart() -> None:
+    @pytest.fixture()
+    def fig() -> go.Figure:
+        return go.Figure(
+            go.Scatter(x=[1, 2, 3], y=[1, 10, 100], line=dict(color="#ff0000", width=2))
+        ).update_layout(
+            figure.get_default_layout(),
+            xaxis_title="Time (ns)",
+            yaxis=dict(type="log", range=[0, 2]),
+        )
+
+    @pytest.fixture()
+    def pptx_chart(fig: go.Figure) -> pptx.chart.chart.Chart:
+        prs = pptx.Presentation()
+        frame = prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_chart(
+            pptx.enum.chart.XL_CHART_TYPE.XY_SCATTER_LINES_NO_MARKERS,
+            0,
+            0,
+            pptx.util.Cm(11.5),
+            pptx.util.Cm(11.5),
+            chart.get_chart_data(fig),
+        )
+        chart.format_chart(frame.chart, fig, 11.5)
+        return frame.chart
+
+    def test_axes(pptx_chart: pptx.chart.chart.Chart) -> None:
+        x_axis, y_axis = pptx_chart.category_axis, pptx_chart.value_axis
+        for axis in (x_axis, y_axis):
+            assert axis.major_tick_mark == pptx.enum.chart.XL_TICK_MARK.INSIDE
+            assert not axis.has_major_gridlines
+        assert x_axis.axis_title.text_frame.text == "Time (ns)"
+        assert not y_axis.has_title
+        assert y_axis.minimum_scale == 1
+        assert y_axis.maximum_scale == 100
+        assert y_axis._element.scaling.find(pptx.oxml.ns.qn("c:logBase")) is not None
+        assert x_axis._element.scaling.find(pptx.oxml.ns.qn("c:logBase")) is None
+
+    def test_plot_area_border(pptx_chart: pptx.chart.chart.Chart) -> None:
+        plot_area = pptx_chart._chartSpace.chart.plotArea
+        assert plot_area.find(pptx.oxml.ns.qn("c:spPr")) is not None
+
+    def test_font_and_legend(pptx_chart: pptx.chart.chart.Chart) -> None:
+        assert pptx_chart.font.name == "Arial"
+        pt_per_px = chart.get_pt_per_px(go.Figure(layout=dict(width=450)), 11.5)
+        assert pptx_chart.font.size.pt == pytest.approx(18 * pt_per_px, abs=1e-2)
+        assert not pptx_chart.has_legend
+
+    def test_series(pptx_chart: pptx.chart.chart.Chart) -> None:
+        (series,) = pptx_chart.plots[0].series
+        assert str(series.format.line.color.rgb) == "FF0000"
+        assert series.marker.style == pptx.enum.chart.XL_MARKER_STYLE.NONE
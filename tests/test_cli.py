@@ -0,0 +1,156 @@
+import dataclasses
+import pathlib
+import subprocess
+import sys
+import types
+import typing as t
+from unittest import mock
+
+import pptx
+import pytest
+
+from tlab_pptx import cli, server
+from tlab_pptx.presentation import photo_luminescence
+
+_HEADER = (
+    "name,title_text,excitation_wavelength,excitation_power,time_range,"
+    "center_wavelength,FWHM,frame,date,a,b,tau1,tau2,h_data,v_data"
+)
+
+
+def _row(name: str, title_text: str, date: str, h_data: str = "h.csv") -> str:
+    return f"{name},{title_text},400,1,10,450,30,1000,{date},60,40,1,3,{h_data},v.csv"
+
+
+@pytest.fixture()
+def manifest(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / "h.csv").write_text("time,intensity\n0,1\n1,0.5\n2,0.2\n")
+    (tmp_path / "v.csv").write_text("wavelength,intensity\n400,0.1\n450,1\n500,0.1\n")
+    path = tmp_path / "manifest.csv"
+    path.write_text(
+        "\n".join(
+            [
+                _HEADER,
+                _row("first", "Sample A", "2022-01-01"),
+                _row("second", "Sample B", "2022-01-02"),
+            ]
+        )
+    )
+    return path
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_build_pl(manifest: pathlib.Path, tmp_path: pathlib.Path, jobs: str) -> None:
+    out = tmp_path / "out"
+    merged = tmp_path / "merged.pptx"
+    argv = ["build-pl", str(manifest), "-o", str(out), "-j", jobs]
+    assert cli.main([*argv, "--merge", str(merged), "--figure-format", "chart"]) == 0
+    assert sorted(p.name for p in out.iterdir()) == ["first.pptx", "second.pptx"]
+    titles = [s.shapes.title.text for s in pptx.Presentation(str(merged)).slides]
+    assert titles == ["Sample A", "Sample B"]
+
+
+def test_build_pl_failure(
+    manifest: pathlib.Path,
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    text = manifest.read_text().replace("2022-01-02", "2022-13-02")
+    manifest.write_text(text + "\n" + _row("", "Sample C", "2022-01-03", "x.csv"))
+    out = tmp_path / "out"
+    argv = ["build-pl", str(manifest), "-o", str(out), "-j", "1"]
+    assert cli.main([*argv, "--figure-format", "chart"]) == 1
+    assert sorted(p.name for p in out.iterdir()) == ["first.pptx"]
+    err = capsys.readouterr().err
+    assert "[2/3] failed second: ValueError" in err
+    assert "[3/3] failed 0002: FileNotFoundError" in err
+    assert "1 built, 2 failed" in err
+
+
+def test_build_pl_derived_peak(manifest: pathlib.Path, tmp_path: pathlib.Path) -> None:
+    lines = [line.split(",") for line in manifest.read_text().splitlines()]
+    lines = [[*line[:5], *line[7:]] for line in lines]
+    manifest.write_text("\n".join(",".join(line) for line in lines))
+    out = tmp_path / "out"
+    argv = ["build-pl", str(manifest), "-o", str(out), "-j", "1"]
+    assert cli.main([*argv, "--figure-format", "chart"]) == 0
+    shapes = pptx.Presentation(str(out / "first.pptx")).slides[0].shapes
+    texts = [shape.text_frame.text for shape in shapes if shape.has_text_frame]
+    assert any("Center wavelength : 450 nm" in text for text in texts)
+
+
+@pytest.mark.parametrize(
+    ["names", "message"],
+    [
+        (["a", "a"], "duplicate names: a"),
+        (["Deck", "deck"], "duplicate names: Deck, deck"),
+        (["0001", ""], "duplicate names: 0001"),
+        (["../x", "a/b"], "invalid names: ../x, a/b"),
+        (["..", "a\\b"], "invalid names: .., a\\b"),
+    ],
+)
+def test_build_pl_invalid_names(
+    manifest: pathlib.Path,
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+    names: list[str],
+    message: str,
+) -> None:
+    header, *rows = manifest.read_text().splitlines()
+    rows = [name + row[row.index(",") :] for name, row in zip(names, rows)]
+    manifest.write_text("\n".join([header, *rows]))
+    out = tmp_path / "out"
+    assert cli.main(["build-pl", str(manifest), "-o", str(out)]) == 2
+    assert message in capsys.readouterr().err
+    assert not out.exists()
+
+
+def test_build_pl_missing_columns(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text("title_text,date\nSample,2022-01-01\n")
+    assert cli.main(["build-pl", str(manifest), "-o", str(tmp_path)]) == 2
+    assert "missing columns: excitation_wavelength" in capsys.readouterr().err
+
+
+def test_serve(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with (
+        mock.patch.object(server.ReportServer, "warm_up") as warm_up,
+        mock.patch.object(
+            server.ReportServer, "serve_forever", side_effect=KeyboardInterrupt
+        ),
+    ):
+        argv = ["serve", "--port", "0", "-j", "1", "--cache-dir", str(tmp_path)]
+        assert cli.main(argv) == 0
+    warm_up.assert_called_once_with()
+    assert "serving on http://127.0.0.1:" in capsys.readouterr().err
+
+
+def test_help_loads_no_heavy_modules() -> None:
+    code = (
+        "import sys, tlab_pptx.cli\n"
+        "try:\n"
+        "    tlab_pptx.cli.main(['build-pl', '--help'])\n"
+        "except SystemExit:\n"
+        "    print(*sorted({m.split('.')[0] for m in sys.modules}))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    modules = set(result.stdout.splitlines()[-1].split())
+    assert "argparse" in modules
+    assert not modules & {"numpy", "pandas", "plotly", "pptx", "PIL"}
+
+
+def test_pl_columns() -> None:
+    fields = dataclasses.fields(photo_luminescence.Record)
+    assert cli._PL_COLUMNS == tuple(f.name for f in fields if "fig" not in f.name)
+    assert cli._PL_OPTIONAL_COLUMNS == tuple(
+        f.name for f in fields if types.NoneType in t.get_args(f.type)
+    )
+
+
+@pytest.mark.parametrize(["value", "expected"], [("print", "print"), ("150", 150.0)])
+def test_parse_dpi(value: str, expected: float | str) -> None:
+    assert cli._parse_dpi(value) == expected
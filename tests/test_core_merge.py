@@ -0,0 +1,142 @@
+import io
+import os
+import pathlib
+import zipfile
+
+import PIL.Image
+import plotly.graph_objects as go
+import pptx
+import pptx.enum.shapes
+import pytest
+
+from tlab_pptx import typing
+from tlab_pptx.core import merge, presentation
+
+
+def _png(color: tuple[int, int, int]) -> bytes:
+    with io.BytesIO() as f:
+        PIL.Image.new("RGB", (2, 2), color).save(f, "png")
+        return f.getvalue()
+
+
+def _save(prs: presentation.Presentation, path: pathlib.Path) -> pathlib.Path:
+    prs.save(path)
+    return path
+
+
+@pytest.fixture()
+def paths(tmp_path: pathlib.Path) -> list[pathlib.Path]:
+    paths = []
+    for i in range(3):
+        prs = presentation.new_presentation()
+        prs.add_slide(0).update_title(f"deck{i}").add_image(_png((i, 0, 0)), 0, 0)
+        sld = prs.add_slide(1).add_image(_png((255, 255, 255)), 0, 0)
+        if i == 1:
+            sld.add_chart(go.Figure(go.Scatter(x=[1, 2], y=[3, 4])), 0, 0)
+        paths.append(_save(prs, tmp_path / f"deck{i}.pptx"))
+    return paths
+
+
+@pytest.mark.parametrize(["filename", "open_mode"], [("merged.pptx", "wb")])
+def test_merge_presentations(
+    paths: list[pathlib.Path],
+    filepath: typing.FilePath,
+    filepath_or_buffer: typing.FilePathOrBuffer,
+) -> None:
+    merge.merge_presentations(paths, filepath_or_buffer)
+    if isinstance(filepath_or_buffer, io.BufferedIOBase):
+        filepath_or_buffer.flush()
+    prs = pptx.Presentation(os.fspath(filepath))
+    layouts = {layout.name for layout in prs.slide_layouts}
+    assert len(prs.slides) == 9
+    assert all(s.slide_layout.name in layouts for s in prs.slides)
+    colors = set()
+    for s in prs.slides:
+        for shape in s.shapes:
+            if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
+                with PIL.Image.open(io.BytesIO(shape.image.blob)) as img:
+                    colors.add(img.getpixel((0, 0)))
+    assert colors == {(0, 0, 0), (1, 0, 0), (2, 0, 0), (255, 255, 255)}
+
+
+def describe_merge_presentations() -> None:
+    @pytest.fixture()
+    def path(tmp_path: pathlib.Path) -> pathlib.Path:
+        return tmp_path / "merged.pptx"
+
+    def test_slides(paths: list[pathlib.Path], path: pathlib.Path) -> None:
+        merge.merge_presentations(paths, path)
+        slides = list(pptx.Presentation(str(path)).slides)
+        base = pptx.Presentation(str(paths[0]))
+        layouts = [layout.name for layout in base.slide_layouts]
+        assert len(slides) == 9
+        assert [s.slide_layout.name for s in slides[1::3]] == [layouts[0]] * 3
+        assert [s.slide_layout.name for s in slides[2::3]] == [layouts[1]] * 3
+        titles = [s.shapes.title.text for s in slides[1::3]]
+        assert titles == ["deck0", "deck1", "deck2"]
+        assert [len(s.shapes) for s in slides[2::3]] == [1, 2, 1]
+        ids = [s.slide_id for s in slides]
+        assert ids == sorted(set(ids))
+
+    def test_parts(paths: list[pathlib.Path], path: pathlib.Path) -> None:
+        merge.merge_presentations(paths, path)
+        with zipfile.ZipFile(path) as z:
+            names = z.namelist()
+        assert len(names) == len(set(names))
+        assert len([name for name in names if name.startswith("ppt/media/")]) == 4
+        assert len([name for name in names if name.startswith("ppt/slides/s")]) == 9
+        assert "ppt/charts/chart1.xml" in names
+        assert "ppt/embeddings/Microsoft_Excel_Sheet1.xlsx" in names
+
+    def test_layout_by_name(paths: list[pathlib.Path], path: pathlib.Path) -> None:
+        prs = presentation.new_presentation()
+        prs.slide_layouts[0]._element.set("preserve", "1")
+        prs.add_slide(0).update_title("modified")
+        modified = _save(prs, path.with_name("modified.pptx"))
+        merge.merge_presentations([paths[0], modified], path)
+        slides = list(pptx.Presentation(str(path)).slides)
+        assert slides[-1].shapes.title.text == "modified"
+        assert slides[-1].slide_layout == slides[1].slide_layout
+
+    def test_layout_not_found(paths: list[pathlib.Path], path: pathlib.Path) -> None:
+        prs = presentation.new_presentation()
+        prs.slide_layouts[0].name = "unknown"
+        modified = _save(prs, path.with_name("modified.pptx"))
+        with pytest.raises(ValueError):
+            merge.merge_presentations([paths[0], modified], path)
+
+    def test_no_paths(path: pathlib.Path) -> None:
+        with pytest.raises(ValueError):
+            merge.merge_presentations([], path)
+
+
+def test_copy_slides(paths: list[pathlib.Path]) -> None:
+    prs = presentation.new_presentation()
+    copied = merge.copy_slides(prs, paths[1], [2, 1])
+    assert tuple(prs.slides[1:]) == tuple(copied)
+    assert len(copied[0]._slide.shapes) == 2
+    assert copied[1]._slide.shapes.title.text == "deck1"
+    with zipfile.ZipFile(paths[1]) as z:
+        assert copied[1]._slide.part.blob == z.read("ppt/slides/slide2.xml")
+
+
+def test_copy_slides_add_image(paths: list[pathlib.Path]) -> None:
+    prs = presentation.new_presentation()
+    prs.add_slide().add_image(_png((0, 0, 1)), 0, 0)
+    merge.copy_slides(prs, paths[1], [1, 2])
+    prs.add_slide().add_image(_png((0, 0, 2)), 0, 0)
+    prs.add_slide().add_image(_png((1, 0, 0)), 0, 0)
+    images = [
+        part
+        for part in prs._prs.part.package.iter_parts()
+        if part.partname.startswith("/ppt/media/")
+    ]
+    assert len({part.partname for part in images}) == len(images) == 4
+
+
+def test_read_slide_tags(tmp_path: pathlib.Path) -> None:
+    prs = presentation.new_presentation()
+    prs.add_slide().set_tag("A", "1")
+    prs.add_slide().set_tag("B", "2")
+    path = _save(prs, tmp_path / "tags.pptx")
+    assert merge.read_slide_tags(path, "A") == [None, "1", None]
@@ -1,4 +1,6 @@
+import asyncio
 import functools
+import os
 from collections import abc
 from unittest import mock
 
@@ -13,7 +15,7 @@ from tlab_pptx.core import presentation, slide
 
 
 def test_new_presentation() -> None:
-    with mock.patch("pptx.Presentation", return_value=pptx.Presentation()) as m:
+    with mock.patch("tlab_pptx.pptx.load_pptx", return_value=pptx.Presentation()) as m:
         prs = presentation.new_presentation()
     m.assert_called_once_with(tpptx.DEFAULT_PPTX)
     assert prs._prs == m.return_value
@@ -26,9 +28,15 @@ def test_new_presentation() -> None:
 def test_new_presentation_filepath_or_buffer(
     filepath_or_buffer: typing.FilePathOrBuffer | None,
 ) -> None:
-    with mock.patch("pptx.Presentation", return_value=pptx.Presentation()) as m:
+    with (
+        mock.patch("pptx.Presentation", return_value=pptx.Presentation()) as m,
+        mock.patch("tlab_pptx.pptx.load_pptx", return_value=m.return_value) as lm,
+    ):
         prs = presentation.new_presentation(filepath_or_buffer)
-    m.assert_called_once_with(filepath_or_buffer)
+    if isinstance(filepath_or_buffer, str | os.PathLike):
+        lm.assert_called_once_with(filepath_or_buffer)
+    else:
+        m.assert_called_once_with(filepath_or_buffer)
     assert prs._prs == m.return_value
 
 
@@ -45,7 +53,11 @@ def describe_presentation() -> None:
         return presentation.Presentation(_new_presentation())
 
     def test_slides(prs: presentation.Presentation) -> None:
-        assert prs.slides == tuple(map(slide.Slide, prs._prs.slides))
+        assert tuple(prs.slides) == tuple(map(slide.Slide, prs._prs.slides))
+
+    def test_slides_figure_format(prs: presentation.Presentation) -> None:
+        prs.figure_format = "svg"
+        assert all(sld.figure_format == "svg" for sld in prs.slides)
 
     @pytest.fixture()
     def add_slide_mock() -> abc.Generator[mock.Mock, None, None]:
@@ -78,3 +90,101 @@ def describe_presentation() -> None:
     ) -> None:
         prs.save(filepath_or_buffer)
         save_mock.assert_called_once_with(filepath_or_buffer)
+
+    @pytest.mark.parametrize(
+        ["filename", "open_mode"],
+        [("test_presentation_save_async.pptx", "wb")],
+    )
+    @mock.patch("pptx.presentation.Presentation.save")
+    def test_save_async(
+        save_mock: mock.Mock,
+        prs: presentation.Presentation,
+        filepath_or_buffer: typing.FilePathOrBuffer,
+    ) -> None:
+        asyncio.run(prs.save_async(filepath_or_buffer))
+        save_mock.assert_called_once_with(filepath_or_buffer)
+
+
+def describe_slide_view() -> None:
+    @pytest.fixture()
+    def prs() -> presentation.Presentation:
+        prs = presentation.Presentation(pptx.Presentation())
+        for title in ("A", "B", "C"):
+            prs.add_slide().update_title(title)
+        return prs
+
+    def test_getitem(prs: presentation.Presentation) -> None:
+        assert len(prs.slides) == 3
+        assert prs.slides[0] is prs.slides[0]
+        assert prs.slides[-1] is prs.slides[2]
+        assert prs.slides[1:] == (prs.slides[1], prs.slides[2])
+        with pytest.raises(IndexError):
+            prs.slides[3]
+
+    def test_add_slide(prs: presentation.Presentation) -> None:
+        sld = prs.add_slide()
+        assert prs.slides[3] is sld
+        assert list(prs.slides)[3] is sld
+
+    def test_sync(prs: presentation.Presentation) -> None:
+        first = prs.slides[0]
+        prs._prs.slides.add_slide(prs.slide_layouts[0])
+        assert len(prs.slides) == 4
+        assert prs.slides[0] is first
+        assert prs.slides[3]._slide is prs._prs.slides[3]
+
+    def test_sync_reorder(prs: presentation.Presentation) -> None:
+        a, b, c = prs.slides
+        sld_id_lst = prs._prs.slides._sldIdLst
+        sld_id_lst.append(sld_id_lst[0])
+        assert tuple(prs.slides) == (b, c, a)
+        assert prs.slides[0] is b
+        assert prs.slides.get_by_id(prs._prs.slides[2].slide_id) is a
+
+    def test_sync_replace(prs: presentation.Presentation) -> None:
+        a, b, c = prs.slides
+        slide_id = prs._prs.slides[1].slide_id
+        sld_id_lst = prs._prs.slides._sldIdLst
+        sld_id = sld_id_lst[1]
+        sld_id_lst.remove(sld_id)
+        prs._prs.part.drop_rel(sld_id.rId)
+        prs._prs.slides.add_slide(prs.slide_layouts[0])
+        assert len(prs.slides) == 3
+        assert prs.slides[1] is c
+        assert prs.slides[2]._slide is prs._prs.slides[2]
+        assert prs.slides[2] not in (a, b, c)
+        assert prs.slides.get_by_id(slide_id) is None
+
+    def test_get_by_id(prs: presentation.Presentation) -> None:
+        slide_id = prs._prs.slides[1].slide_id
+        assert prs.slides.get_by_id(slide_id) is prs.slides[1]
+        assert prs.slides.get_by_id(0) is None
+
+    def test_get_by_title(prs: presentation.Presentation) -> None:
+        assert prs.slides.get_by_title("C") is prs.slides[2]
+        assert prs.slides.get_by_title("D") is None
+
+    def test_remove_slide(prs: presentation.Presentation) -> None:
+        a, b, c = prs.slides
+        prs.remove_slide(b)
+        assert tuple(prs.slides) == (a, c)
+        assert len(prs._prs.slides) == 2
+        with pytest.raises(ValueError):
+            prs.remove_slide(b)
+
+    def test_reorder_slides(prs: presentation.Presentation) -> None:
+        a, b, c = prs.slides
+        prs.reorder_slides([c, a, b])
+        assert tuple(prs.slides) == (c, a, b)
+        assert [s.shapes.title.text for s in prs._prs.slides] == ["C", "A", "B"]
+        with pytest.raises(ValueError):
+            prs.reorder_slides([a, a, b])
+
+
+def test_get_layout_by_name() -> None:
+    prs = presentation.Presentation(pptx.Presentation())
+    assert prs.get_layout_by_name("Blank") is prs.slide_layouts[6]
+    assert prs.get_layout_by_name("Unknown") is None
+    assert prs.add_slide("Blank")._slide.slide_layout is prs.slide_layouts[6]
+    with pytest.raises(KeyError):
+        prs.add_slide("Unknown")
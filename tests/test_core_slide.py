@@ -1,10 +1,18 @@
+import asyncio
 import copy
+import hashlib
+import io
+import zipfile
 from collections import abc
 from unittest import mock
 
+import PIL.Image
 import plotly.graph_objects as go
 import pptx
+import pptx.opc.constants
+import pptx.oxml.ns
 import pptx.shapes.autoshape
+import pptx.shapes.picture
 import pptx.shapes.placeholder
 import pptx.shapes.shapetree
 import pptx.slide
@@ -12,6 +20,7 @@ import pptx.text.text
 import pptx.util
 import pytest
 
+from tlab_pptx import render, typing
 from tlab_pptx.core import slide as tslide
 
 
@@ -22,12 +31,13 @@ def assert_add_picture_called_with(
     width: float | None = None,
     height: float | None = None,
 ) -> None:
-    slide._slide.shapes.add_picture.assert_called_once_with(
+    slide._slide.shapes._add_pic_from_image_part.assert_called_once_with(
         mock.ANY,
-        left=pptx.util.Cm(left) if left is not None else mock.ANY,
-        top=pptx.util.Cm(top) if top is not None else mock.ANY,
-        width=pptx.util.Cm(width) if width is not None else mock.ANY,
-        height=pptx.util.Cm(height) if height is not None else mock.ANY,
+        mock.ANY,
+        pptx.util.Cm(left) if left is not None else mock.ANY,
+        pptx.util.Cm(top) if top is not None else mock.ANY,
+        pptx.util.Cm(width) if width is not None else mock.ANY,
+        pptx.util.Cm(height) if height is not None else mock.ANY,
     )
 
 
@@ -48,7 +58,7 @@ def assert_add_textbox_called_with(
 
 def describe_slide() -> None:
     @pytest.fixture()
-    def slide() -> tslide.Slide:
+    def slide() -> abc.Generator[tslide.Slide, None, None]:
         slide_mock = mock.Mock(spec_set=pptx.slide.Slide)
         slide_mock.shapes = mock.Mock(spec_set=pptx.shapes.shapetree.SlideShapes)
         slide_mock.shapes.title = mock.Mock(
@@ -63,7 +73,8 @@ def describe_slide() -> None:
         slide_mock.shapes.add_textbox.return_value.text_frame.paragraphs = [
             mock.Mock(spec_set=pptx.text.text._Paragraph)
         ]
-        return tslide.Slide(slide_mock)
+        with mock.patch.object(tslide, "_get_or_add_image_part"):
+            yield tslide.Slide(slide_mock)
 
     @pytest.mark.parametrize("text", [None, "hello", "hello\ngoodbye"])
     def test_update_title_text(
@@ -156,6 +167,79 @@ def describe_slide() -> None:
         fig.to_image.assert_called_once_with("png", scale=10)
         assert_add_picture_called_with(slide, left, top)
 
+    def test_add_figure_cache(slide: tslide.Slide, fig: go.Figure) -> None:
+        cache = mock.Mock(spec_set=render.RenderCache)
+        cache.get.return_value = b"cached"
+        assert slide.add_figure(fig, 0.0, 0.0, cache=cache) == slide
+        fig.to_image.assert_not_called()
+        cache.get_key.assert_called_once_with(fig, format="png", scale=10)
+        assert_add_picture_called_with(slide, 0.0, 0.0)
+
+    @pytest.mark.parametrize(["dpi", "scale"], [(150, 1.5), ("print", 3.0)])
+    def test_add_figure_dpi(
+        slide: tslide.Slide, fig: go.Figure, dpi: float | typing.Quality, scale: float
+    ) -> None:
+        fig.update_layout(width=450, height=450)
+        assert slide.add_figure(fig, 0.0, 0.0, 11.43, 11.43, dpi=dpi) == slide
+        fig.to_image.assert_called_once_with("png", scale=pytest.approx(scale))
+
+    def test_add_figure_svg(slide: tslide.Slide, fig: go.Figure) -> None:
+        with mock.patch.object(tslide.Slide, "add_svg") as m:
+            slide.add_figure(fig, 0.0, 1.0, 2.0, 3.0, figure_format="svg")
+        fig.to_image.assert_has_calls(
+            [mock.call("svg", scale=1), mock.call("png", scale=mock.ANY)]
+        )
+        m.assert_called_once_with(b"", b"", 0.0, 1.0, width=2.0, height=3.0)
+
+    @pytest.mark.parametrize("optimize", ["lossless", "lossy"])
+    def test_add_figure_optimize(
+        slide: tslide.Slide, fig: go.Figure, optimize: typing.PngOptimization
+    ) -> None:
+        with (
+            mock.patch.object(render, "optimize_png", return_value=b"opt") as m,
+            mock.patch.object(tslide.Slide, "add_image") as add_image,
+        ):
+            slide.add_figure(fig, 0.0, 0.0, optimize=optimize)
+        m.assert_called_once_with(b"", optimize)
+        add_image.assert_called_once_with(b"opt", 0.0, 0.0, width=11.5, height=11.5)
+
+    def test_add_figure_chart(slide: tslide.Slide, fig: go.Figure) -> None:
+        with mock.patch.object(tslide.Slide, "add_chart") as m:
+            slide.add_figure(fig, 0.0, 1.0, 2.0, 3.0, figure_format="chart")
+        fig.to_image.assert_not_called()
+        m.assert_called_once_with(fig, 0.0, 1.0, width=2.0, height=3.0)
+
+    @pytest.mark.parametrize("figure_format", ["png", "svg", "chart"])
+    def test_add_figure_async(
+        slide: tslide.Slide, fig: go.Figure, figure_format: typing.FigureFormat
+    ) -> None:
+        with (
+            mock.patch.object(tslide.Slide, "add_image") as add_image,
+            mock.patch.object(tslide.Slide, "add_svg") as add_svg,
+            mock.patch.object(tslide.Slide, "add_chart") as add_chart,
+        ):
+            asyncio.run(
+                slide.add_figure_async(fig, 0.0, 1.0, figure_format=figure_format)
+            )
+        match figure_format:
+            case "png":
+                fig.to_image.assert_called_once_with("png", scale=10)
+                add_image.assert_called_once_with(
+                    b"", 0.0, 1.0, width=11.5, height=11.5
+                )
+            case "svg":
+                assert fig.to_image.call_count == 2
+                add_svg.assert_called_once()
+            case "chart":
+                fig.to_image.assert_not_called()
+                add_chart.assert_called_once()
+
+    def test_add_figure_default_svg(slide: tslide.Slide, fig: go.Figure) -> None:
+        slide.figure_format = "svg"
+        with mock.patch.object(tslide.Slide, "add_svg") as m:
+            slide.add_figure(fig, 0.0, 0.0)
+        m.assert_called_once()
+
     @pytest.mark.parametrize("width", [0.0, 1.0])
     def test_add_figure_size(
         slide: tslide.Slide,
@@ -176,6 +260,20 @@ def describe_slide() -> None:
         assert slide.add_figure(fig, left, top, height=height) == slide
         assert_add_picture_called_with(slide, left, top, height=height)
 
+    @pytest.mark.parametrize("left", [0.0, 1.0])
+    @pytest.mark.parametrize("top", [0.0, 1.0])
+    @pytest.mark.parametrize("width", [0.0, 1.0])
+    @pytest.mark.parametrize("height", [0.0, 1.0])
+    def test_add_image(
+        slide: tslide.Slide,
+        left: float,
+        top: float,
+        width: float,
+        height: float,
+    ) -> None:
+        assert slide.add_image(b"", left, top, width, height) == slide
+        assert_add_picture_called_with(slide, left, top, width, height)
+
     @pytest.fixture()
     def text() -> str:
         return "hello"
@@ -275,3 +373,131 @@ def describe_slide() -> None:
         textbox = slide._slide.shapes.add_textbox.return_value
         for paragraph in textbox.text_frame.paragraphs:
             assert paragraph.font.italic == font_italic
+
+
+def describe_slide_with_package() -> None:
+    @pytest.fixture()
+    def slide() -> tslide.Slide:
+        prs = pptx.Presentation()
+        return tslide.Slide(prs.slides.add_slide(prs.slide_layouts[6]))
+
+    @pytest.fixture()
+    def png() -> bytes:
+        with io.BytesIO() as f:
+            PIL.Image.new("RGB", (1, 1)).save(f, "png")
+            return f.getvalue()
+
+    def test_add_image(slide: tslide.Slide, png: bytes) -> None:
+        slide.add_image(png, 1.0, 2.0, 3.0, 4.0)
+        slide.add_image(png, 5.0, 6.0)
+        parts = {
+            rel.target_part
+            for rel in slide._slide.part.rels.values()
+            if rel.reltype == pptx.opc.constants.RELATIONSHIP_TYPE.IMAGE
+        }
+        assert len(parts) == 1
+        (part,) = parts
+        assert part.blob is png
+        assert part.partname == "/ppt/media/picture1.png"
+        assert part.content_type == "image/png"
+        assert part.sha1 == hashlib.sha1(png).hexdigest()
+        first, _ = slide._slide.shapes
+        assert isinstance(first, pptx.shapes.picture.Picture)
+        assert first.image.blob == png
+        assert (first.left, first.top) == (pptx.util.Cm(1.0), pptx.util.Cm(2.0))
+        assert (first.width, first.height) == (pptx.util.Cm(3.0), pptx.util.Cm(4.0))
+
+    def test_add_image_existing(slide: tslide.Slide, png: bytes) -> None:
+        with io.BytesIO(png) as f:
+            picture = slide._slide.shapes.add_picture(f, 0, 0)
+        assert isinstance(picture, pptx.shapes.picture.Picture)
+        slide.add_image(png, 0.0, 0.0)
+        slide.add_image(png[:-1] + b"\x00", 0.0, 0.0)
+        partnames = sorted(
+            rel.target_part.partname
+            for rel in slide._slide.part.rels.values()
+            if rel.reltype == pptx.opc.constants.RELATIONSHIP_TYPE.IMAGE
+        )
+        assert partnames == ["/ppt/media/image1.png", "/ppt/media/picture1.png"]
+
+    def test_add_image_mixed(slide: tslide.Slide, png: bytes) -> None:
+        # Images added by python-pptx after the index is built must not
+        # take the partnames of the index.
+        pngs = [png[:-1] + bytes([i]) for i in range(4)]
+        slide.add_image(pngs[0], 0.0, 0.0)
+        for image in pngs[1:3]:
+            with io.BytesIO(image) as f:
+                slide._slide.shapes.add_picture(f, 0, 0)
+        slide.add_image(pngs[3], 0.0, 0.0)
+        package = slide._slide.part.package
+        partnames = [
+            part.partname
+            for part in package.iter_parts()
+            if part.partname.startswith("/ppt/media/")
+        ]
+        assert len(partnames) == len(set(partnames)) == 4
+        with io.BytesIO() as f:
+            package.save(f)
+            with zipfile.ZipFile(f) as z:
+                names = z.namelist()
+        assert len(names) == len(set(names))
+
+    def test_add_svg(slide: tslide.Slide, png: bytes) -> None:
+        svg = b'<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1"/>'
+        assert slide.add_svg(svg, png, 1.0, 2.0) == slide
+        slide.add_svg(svg, png, 3.0, 4.0)
+        parts = [
+            rel.target_part
+            for rel in slide._slide.part.rels.values()
+            if rel.target_part.content_type == "image/svg+xml"
+        ]
+        assert len(parts) == 1
+        assert parts[0].blob == svg
+        for picture in slide._slide.shapes:
+            (svg_blip,) = picture._element.iter(f"{{{tslide._SVG_NS}}}svgBlip")
+            rId = svg_blip.get(pptx.oxml.ns.qn("r:embed"))
+            assert slide._slide.part.related_part(rId) is parts[0]
+
+    def test_add_chart(slide: tslide.Slide) -> None:
+        fig = go.Figure(go.Scatter(x=[0, 1], y=[1, 2])).add_annotation(
+            text="2022.01.01", x=1.0, y=-0.125, xref="paper", yref="paper"
+        )
+        assert slide.add_chart(fig, 1.0, 2.0, 10.0, 10.0) == slide
+        frame, textbox = slide._slide.shapes
+        assert frame.has_chart
+        assert textbox.text_frame.text == "2022.01.01"
+        assert textbox.left + textbox.width == pptx.util.Cm(11.0)
+        assert textbox.top + textbox.height == pptx.util.Cm(12.0)
+
+    def test_add_texts(slide: tslide.Slide) -> None:
+        specs = [
+            tslide.TextSpec("A & B\nC\vD", 1.0, 2.0, font_bold=True),
+            tslide.TextSpec("E", 3.0, 4.0, width=5.0, font_name="Cambria Math"),
+        ]
+        assert slide.add_texts(specs) == slide
+        slide.add_text("A & B\nC\vD", 1.0, 2.0, font_bold=True)
+        first, second, expected = slide._slide.shapes
+        assert [first.shape_id, second.shape_id] == [2, 3]
+        assert first.text_frame.text == "A & B\nC\vD"
+        assert first._element.txBody.xml == expected._element.txBody.xml
+        assert first._element.spPr.xml == expected._element.spPr.xml
+        assert second.left == pptx.util.Cm(3.0)
+        assert second.width == pptx.util.Cm(5.0)
+        assert second.text_frame.paragraphs[0].font.name == "Cambria Math"
+
+    def test_add_texts_empty(slide: tslide.Slide) -> None:
+        assert slide.add_texts([]) == slide
+        assert len(slide._slide.shapes) == 0
+
+    def test_tags(slide: tslide.Slide) -> None:
+        assert slide.get_tag("A") is None
+        assert slide.set_tag("A", "1").set_tag("B", "2").set_tag("A", "3") == slide
+        assert (slide.get_tag("A"), slide.get_tag("B"), slide.get_tag("C")) == (
+            "3",
+            "2",
+            None,
+        )
+        with io.BytesIO() as f:
+            slide._slide.part.package.save(f)
+            loaded = tslide.Slide(pptx.Presentation(f).slides[0])
+        assert loaded.get_tag("A") == "3"
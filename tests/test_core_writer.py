@@ -0,0 +1,74 @@
+import io
+import pathlib
+import zipfile
+
+import PIL.Image
+import pptx
+import pptx.shapes.picture
+import pytest
+
+from tlab_pptx import typing
+from tlab_pptx.core import presentation, writer
+
+
+def _png(color: tuple[int, int, int]) -> bytes:
+    with io.BytesIO() as f:
+        PIL.Image.new("RGB", (2, 2), color).save(f, "png")
+        return f.getvalue()
+
+
+@pytest.mark.parametrize(["filename", "open_mode"], [("writer.pptx", "wb")])
+def test_presentation_writer(filepath_or_buffer: typing.FilePathOrBuffer) -> None:
+    prs = presentation.new_presentation()
+    with writer.PresentationWriter(prs, filepath_or_buffer) as w:
+        for i in range(3):
+            w.add_slide().update_title(f"slide{i}").add_image(_png((i, 0, 0)), 0, 0)
+        w.add_slide().add_image(_png((0, 0, 0)), 0, 0)
+    assert w._zip.fp is None
+
+
+def describe_presentation_writer() -> None:
+    @pytest.fixture()
+    def path(tmp_path: pathlib.Path) -> pathlib.Path:
+        return tmp_path / "writer.pptx"
+
+    @pytest.fixture()
+    def prs() -> presentation.Presentation:
+        return presentation.new_presentation()
+
+    def test_write(path: pathlib.Path, prs: presentation.Presentation) -> None:
+        with writer.PresentationWriter(prs, path) as w:
+            for i in range(3):
+                w.add_slide().update_title(f"slide{i}").add_image(_png((i, 0, 0)), 0, 0)
+            w.add_slide().add_image(_png((0, 0, 0)), 0, 0)
+        result = pptx.Presentation(str(path))
+        assert len(result.slides) == 5
+        assert [s.shapes.title.text for s in list(result.slides)[1:4]] == [
+            "slide0",
+            "slide1",
+            "slide2",
+        ]
+        with zipfile.ZipFile(path) as z:
+            media = [name for name in z.namelist() if name.startswith("ppt/media/")]
+            assert len(media) == 3
+            assert len(z.namelist()) == len(set(z.namelist()))
+            assert z.getinfo(media[0]).compress_type == zipfile.ZIP_STORED
+
+    def test_release(path: pathlib.Path, prs: presentation.Presentation) -> None:
+        with writer.PresentationWriter(prs, path) as w:
+            first = w.add_slide().add_image(_png((1, 0, 0)), 0, 0)
+            (picture,) = (
+                shape
+                for shape in first._slide.shapes
+                if isinstance(shape, pptx.shapes.picture.Picture)
+            )
+            image_part = first._slide.part.related_part(picture._element.blip_rId)
+            w.add_slide()
+            assert image_part.blob == b""
+            assert len(first._slide.shapes) == 0
+
+    def test_close_twice(path: pathlib.Path, prs: presentation.Presentation) -> None:
+        w = writer.PresentationWriter(prs, path)
+        w.close()
+        w.close()
+        assert len(pptx.Presentation(str(path)).slides) == 1
@@ -0,0 +1,101 @@
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from tlab_pptx import downsample
+
+
+@pytest.fixture()
+def y() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return np.exp(-np.linspace(0, 10, 10001)) + rng.normal(scale=1e-2, size=10001)
+
+
+@pytest.mark.parametrize("n_out", [4, 100, 1001])
+def test_minmax_indices(y: np.ndarray, n_out: int) -> None:
+    indices = downsample.minmax_indices(y, n_out)
+    assert len(indices) <= n_out
+    assert (np.diff(indices) > 0).all()
+    assert indices[0] == 0 and indices[-1] == len(y) - 1
+    assert y[indices].max() == y.max()
+    assert y[indices].min() == y.min()
+
+
+def test_minmax_indices_nan() -> None:
+    y = np.array([0.0, np.nan, 5.0, np.nan, np.nan, np.nan, 1.0, 2.0, 3.0])
+    indices = downsample.minmax_indices(y, 6)
+    assert indices.tolist() == [0, 1, 2, 5, 6, 7, 8]
+
+
+def test_minmax_indices_short() -> None:
+    assert downsample.minmax_indices([1, 2, 3], 10).tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("n_out", [3, 100, 1000])
+def test_lttb_indices(y: np.ndarray, n_out: int) -> None:
+    x = np.arange(len(y))
+    indices = downsample.lttb_indices(x, y, n_out)
+    assert len(indices) == n_out
+    assert (np.diff(indices) > 0).all()
+    assert indices[0] == 0 and indices[-1] == len(y) - 1
+
+
+def test_lttb_indices_peak() -> None:
+    y = np.zeros(1000)
+    y[500] = 1.0
+    indices = downsample.lttb_indices(np.arange(1000), y, 10)
+    assert 500 in indices
+
+
+@pytest.mark.parametrize(
+    ["width", "dpi", "method", "expected"],
+    [
+        (2.54, 300, "minmax", 600),
+        (2.54, "screen", "lttb", 150),
+        (11.5, "print", "minmax", 2716),
+    ],
+)
+def test_get_n_points(
+    width: float, dpi: float | str, method: downsample.Method, expected: int
+) -> None:
+    assert downsample.get_n_points(width, dpi, method) == expected  # type: ignore[arg-type]
+
+
+def describe_downsample_figure() -> None:
+    @pytest.fixture()
+    def fig(y: np.ndarray) -> go.Figure:
+        return go.Figure(
+            [
+                go.Scatter(
+                    y=y, x0=1, dx=2, name="large", line=dict(color="red"),
+                    text=[str(i) for i in range(len(y))],
+                ),
+                go.Scatter(x=[0, 1], y=[1, 2], name="small"),
+                go.Bar(y=y),
+                go.Scatter(y=y, error_y=dict(array=y)),
+            ],
+            layout=dict(width=450),
+        )  # fmt: skip
+
+    @pytest.mark.parametrize("method", ["minmax", "lttb"])
+    def test_downsample_figure(
+        fig: go.Figure, y: np.ndarray, method: downsample.Method
+    ) -> None:
+        result = downsample.downsample_figure(fig, 100, method)
+        large, small, bar, error = result.data
+        assert len(large.y) <= 100
+        assert large.name == "large"
+        assert large.line.color == "red"
+        assert len(large.text) == len(large.y)
+        assert large.x[0] == 1 and large.x[-1] == 1 + 2 * (len(y) - 1)
+        assert [int(text) for text in large.text] == [(x - 1) // 2 for x in large.x]
+        assert small.y == (1, 2)
+        assert len(bar.y) == len(y)
+        assert len(error.y) == len(y)
+        assert result.layout.width == 450
+        assert len(fig.data[0].y) == len(y)
+
+    def test_downsample_figure_non_numeric() -> None:
+        fig = go.Figure(go.Scatter(x=["a", "b", "c", "d", "e"], y=[1, 2, 3, 4, 5]))
+        result = downsample.downsample_figure(fig, 3)
+        assert result.data[0].x == ("a", "b", "c", "d", "e")
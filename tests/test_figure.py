@@ -1,5 +1,6 @@
 import datetime
 
+import numpy as np
 import plotly.graph_objects as go
 import pytest
 
@@ -38,3 +39,49 @@ def test_get_default_axis() -> None:
     axis = figure.get_default_axis()
     assert go.layout.XAxis(axis)  # TODO: Expect assert not raises ValueError
     assert go.layout.YAxis(axis)  # TODO: Expect assert not raises ValueError
+
+
+def describe_update_figure_dict() -> None:
+    @pytest.fixture()
+    def fig() -> go.Figure:
+        return go.Figure(
+            [
+                go.Scatter(x=np.arange(3), y=[1, 2, 3], line=dict(color="red")),
+                go.Scatter(y=[1, 2], xaxis="x2"),
+            ],
+            layout=dict(xaxis2=dict(domain=[0.5, 1]), legend=dict(x=0)),
+        )
+
+    def test_update_figure_dict(fig: go.Figure) -> None:
+        annotation = figure.get_date_annotation((2022, 1, 1))
+        fig_dict = figure.update_figure_dict(
+            fig,
+            layout=dict(figure.get_default_layout(), showlegend=False),
+            xaxes=figure.get_default_axis(),
+            yaxes=figure.get_default_axis(),
+            traces=dict(line=dict(width=1)),
+            annotations=[annotation],
+        )
+        expected = (
+            go.Figure(fig)
+            .add_annotation(annotation)
+            .update_layout(figure.get_default_layout(), showlegend=False)
+            .update_xaxes(figure.get_default_axis())
+            .update_yaxes(figure.get_default_axis())
+            .update_traces(line=dict(width=1))
+        )
+        # A None value removes the property instead of resetting it to {}.
+        assert go.Figure(fig_dict).update_layout(legend_title=None) == expected
+
+    def test_shares_data(fig: go.Figure) -> None:
+        fig_dict = figure.update_figure_dict(fig, traces=dict(line=dict(width=1)))
+        assert fig_dict["data"][0]["x"] is fig.data[0].x
+        assert fig.data[0].line.width is None
+
+    def test_figure_dict(fig: go.Figure) -> None:
+        fig_dict = figure.update_figure_dict(
+            fig.to_plotly_json(), layout=dict(legend=dict(x=None), width=450)
+        )
+        assert fig_dict["layout"]["legend"] == {}
+        assert fig_dict["layout"]["width"] == 450
+        assert fig.layout.legend.x == 0
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from tlab_pptx import fitting
+
+
+@pytest.fixture()
+def t() -> np.ndarray:
+    return np.linspace(0, 20, 1001)
+
+
+@pytest.fixture()
+def params() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return np.column_stack(
+        [
+            rng.uniform(0.5, 5, 100),
+            rng.uniform(0.2, 2, 100),
+            rng.uniform(0.2, 1.5, 100),
+            rng.uniform(2.5, 8, 100),
+        ]
+    )
+
+
+def _decays(t: np.ndarray, params: np.ndarray) -> np.ndarray:
+    a, b, tau1, tau2 = (column[:, None] for column in params.T)
+    decays: np.ndarray = a * np.exp(-t / tau1) + b * np.exp(-t / tau2)
+    return decays
+
+
+def test_fit_biexponential(t: np.ndarray, params: np.ndarray) -> None:
+    fit = fitting.fit_biexponential(t, _decays(t, params))
+    assert len(fit) == 100
+    actual = np.column_stack([fit.a, fit.b, fit.tau1, fit.tau2])
+    np.testing.assert_allclose(actual, params, rtol=1e-4)
+    assert (fit.rmse < 1e-6).all()
+
+
+def test_fit_biexponential_noise(t: np.ndarray, params: np.ndarray) -> None:
+    rng = np.random.default_rng(1)
+    y = _decays(t, params) + rng.normal(scale=1e-2, size=(100, len(t)))
+    fit = fitting.fit_biexponential(t, y)
+    actual = np.column_stack([fit.a, fit.b, fit.tau1, fit.tau2])
+    assert np.median(np.abs(actual / params - 1)) < 1e-2
+    np.testing.assert_allclose(fit.rmse, 1e-2, rtol=0.2)
+
+
+def test_fit_biexponential_chunks(
+    t: np.ndarray, params: np.ndarray, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    y = _decays(t, params)
+    expected = fitting.fit_biexponential(t, y)
+    monkeypatch.setattr(fitting, "_CHUNK_SIZE", 7)
+    actual = fitting.fit_biexponential(t, y)
+    np.testing.assert_allclose(actual.tau2, expected.tau2)
+
+
+def test_fit_biexponential_offset_time(t: np.ndarray) -> None:
+    y = 2 * np.exp(-t / 0.5) + np.exp(-t / 3)
+    fit = fitting.fit_biexponential(t + 100, y)
+    assert fit.params(0) == pytest.approx(dict(a=2, b=1, tau1=0.5, tau2=3))
+
+
+def test_fit_biexponential_order(t: np.ndarray) -> None:
+    fit = fitting.fit_biexponential(t, [np.exp(-t / 4) + 3 * np.exp(-t / 0.4)])
+    assert fit.params(0) == pytest.approx(dict(a=3, b=1, tau1=0.4, tau2=4))
+
+
+def test_fit_biexponential_empty(t: np.ndarray) -> None:
+    assert len(fitting.fit_biexponential(t, np.empty((0, len(t))))) == 0
+
+
+@pytest.mark.parametrize(
+    ["t", "y"],
+    [
+        ([0, 1, 2, 3], [[1, 2, 3]]),
+        ([0, 1, 2], [1, 2, 3]),
+        ([0, 0, 0, 0], [1, 2, 3, 4]),
+    ],
+)
+def test_fit_biexponential_invalid(t: list[int], y: list[int]) -> None:
+    with pytest.raises(ValueError):
+        fitting.fit_biexponential(t, y)
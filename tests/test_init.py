@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pytest
+
+import tlab_pptx
+from tlab_pptx import core, figure, render
+
+
+def test_import_loads_no_heavy_modules() -> None:
+    code = (
+        "import sys, tlab_pptx; tlab_pptx.get_default_layout(); "
+        "print(*sorted({m.split('.')[0] for m in sys.modules}))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    modules = set(result.stdout.split())
+    assert "tlab_pptx" in modules
+    assert not modules & {"numpy", "pandas", "plotly", "pptx", "PIL"}
+
+
+@pytest.mark.parametrize(
+    ["name", "expected"],
+    [
+        ("Slide", core.Slide),
+        ("merge_presentations", core.merge_presentations),
+        ("get_default_layout", figure.get_default_layout),
+        ("render", render),
+    ],
+)
+def test_getattr(name: str, expected: object) -> None:
+    assert getattr(tlab_pptx, name) is expected
+    assert name in dir(tlab_pptx)
+
+
+@pytest.mark.parametrize("name", ["chart", "core", "figure", "pptx", "presentation"])
+def test_getattr_submodule(name: str) -> None:
+    # Runs in a fresh process since importing a submodule binds it to the package.
+    code = (
+        f"import tlab_pptx, types; "
+        f"assert isinstance(tlab_pptx.{name}, types.ModuleType); "
+        f"print(tlab_pptx.{name}.__name__)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == f"tlab_pptx.{name}"
+
+
+def test_getattr_unknown() -> None:
+    with pytest.raises(AttributeError):
+        tlab_pptx.unknown
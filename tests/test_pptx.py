@@ -1,3 +1,11 @@
+import io
+import os
+import pathlib
+import shutil
+from unittest import mock
+
+import pptx as python_pptx
+
 from tlab_pptx import pptx
 
 
@@ -9,3 +17,27 @@ def test_get_pptx_filenames() -> None:
 def test_get_pptx_filepaths() -> None:
     filepaths = pptx.get_pptx_filepaths()
     assert filepaths == [str(path) for path in pptx._PPTX_DIR.glob("**/*.pptx")]
+
+
+def test_load_pptx() -> None:
+    prs1 = pptx.load_pptx(pptx.DEFAULT_PPTX)
+    prs2 = pptx.load_pptx(pptx.DEFAULT_PPTX)
+    assert prs1 is not prs2
+    prs1.slides.add_slide(prs1.slide_layouts[0])
+    assert len(prs1.slides) == len(prs2.slides) + 1
+    with io.BytesIO() as f:
+        prs1.save(f)
+        assert len(python_pptx.Presentation(f).slides) == len(prs1.slides)
+
+
+def test_load_pptx_cache(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "template.pptx"
+    shutil.copy(pptx.DEFAULT_PPTX, path)
+    pptx._load_pptx.cache_clear()
+    with mock.patch("pptx.Presentation", wraps=python_pptx.Presentation) as m:
+        pptx.load_pptx(path)
+        pptx.load_pptx(str(path))
+        assert m.call_count == 1
+        os.utime(path, ns=(0, 0))
+        pptx.load_pptx(path)
+        assert m.call_count == 2
@@ -1,9 +1,20 @@
+import asyncio
 import datetime
+import io
+import pathlib
+import re
+import typing as t
+import zipfile
+from unittest import mock
 
+import numpy as np
+import PIL.Image
 import plotly.graph_objects as go
+import pptx.opc.constants
+import pptx.shapes.picture
 import pytest
 
-from tlab_pptx import core
+from tlab_pptx import core, render
 from tlab_pptx.presentation import photo_luminescence
 
 
@@ -53,3 +64,260 @@ def test_build(
     )
     assert isinstance(prs, core.Presentation)
     assert prs.slides[0]._slide.shapes.title.text == title_text
+
+
+@pytest.fixture()
+def png() -> bytes:
+    with io.BytesIO() as f:
+        PIL.Image.new("RGB", (1, 1)).save(f, "png")
+        return f.getvalue()
+
+
+def test_build_pool(png: bytes) -> None:
+    pool = mock.Mock(spec_set=render.RenderPool)
+    pool.render.return_value = [png, png]
+    prs = photo_luminescence.build(
+        "title", 400, 1, 5, 450, 30, 1000, datetime.date(2022, 1, 1),
+        go.Figure(), go.Figure(), 40, 60, 0.5, 1.5, pool=pool,
+    )  # fmt: skip
+    pool.render.assert_called_once_with([mock.ANY, mock.ANY], "png", 10, None)
+    shapes = prs.slides[0]._slide.shapes
+    assert sum(isinstance(shape, pptx.shapes.picture.Picture) for shape in shapes) == 2
+
+
+def test_build_downsample(png: bytes) -> None:
+    pool = mock.Mock(spec_set=render.RenderPool)
+    pool.render.return_value = [png, png]
+    fig = go.Figure(go.Scatter(y=list(range(10000))))
+    photo_luminescence.build(
+        "title", 400, 1, 5, 450, 30, 1000, datetime.date(2022, 1, 1),
+        fig, fig, 40, 60, 0.5, 1.5, pool=pool, dpi="draft", downsample=True,
+    )  # fmt: skip
+    (figs, *_), _ = pool.render.call_args
+    assert all(len(f["data"][0]["y"]) <= 2 * 326 for f in figs)
+    assert len(fig.data[0].y) == 10000
+
+
+def test_build_svg() -> None:
+    prs = photo_luminescence.build(
+        "title", 400, 1, 5, 450, 30, 1000, datetime.date(2022, 1, 1),
+        go.Figure(), go.Figure(), 40, 60, 0.5, 1.5, figure_format="svg",
+    )  # fmt: skip
+    assert prs.figure_format == "svg"
+    with io.BytesIO() as f:
+        prs.save(f)
+        with zipfile.ZipFile(f) as z:
+            assert sum(name.endswith(".svg") for name in z.namelist()) == 2
+
+
+def test_build_chart() -> None:
+    prs = photo_luminescence.build(
+        "title", 400, 1, 5, 450, 30, 1000, datetime.date(2022, 1, 1),
+        go.Figure(go.Scatter(x=[0, 1], y=[1, 2])), go.Figure(go.Scatter(y=[1])),
+        40, 60, 0.5, 1.5, figure_format="chart",
+    )  # fmt: skip
+    shapes = prs.slides[0]._slide.shapes
+    assert sum(shape.has_chart for shape in shapes) == 2
+
+
+def test_build_derived_peak() -> None:
+    wavelength = np.linspace(400, 600, 201)
+    v_fig = go.Figure(
+        go.Scatter(x=wavelength, y=np.exp(-(((wavelength - 482.8) / 25) ** 2)))
+    )
+    prs = photo_luminescence.build(
+        "title", 400, 1, 5, None, None, 1000, datetime.date(2022, 1, 1),
+        go.Figure(), v_fig, 40, 60, 0.5, 1.5, figure_format="chart",
+    )  # fmt: skip
+    texts = [
+        shape.text_frame.text
+        for shape in prs.slides[0]._slide.shapes
+        if shape.has_text_frame
+    ]
+    assert any("Center wavelength : 483 nm\nFWHM : 42 nm" in text for text in texts)
+
+
+@pytest.mark.parametrize("v_fig", [go.Figure(), go.Figure(go.Scatter(y=[0, 1, 2]))])
+def test_build_derived_peak_error(v_fig: go.Figure) -> None:
+    with pytest.raises(ValueError):
+        photo_luminescence.build(
+            "title", 400, 1, 5, 450, None, 1000, datetime.date(2022, 1, 1),
+            go.Figure(), v_fig, 40, 60, 0.5, 1.5, figure_format="chart",
+        )  # fmt: skip
+
+
+def describe_record() -> None:
+    @pytest.fixture()
+    def values() -> dict[str, t.Any]:
+        return dict(
+            title_text="title", excitation_wavelength="400", excitation_power=1.0,
+            time_range=5, center_wavelength=float("nan"), frame=1000,
+            date="2022-01-01", h_fig=go.Figure(), v_fig=go.Figure(),
+            a="40", b=60, tau1=0.5, tau2=1.5, name="ignored",
+        )  # fmt: skip
+
+    def test_from_mapping(values: dict[str, t.Any]) -> None:
+        record = photo_luminescence.Record.from_mapping(values)
+        assert record.excitation_wavelength == 400
+        assert isinstance(record.excitation_power, int)
+        assert record.center_wavelength is None and record.FWHM is None
+        assert record.date == datetime.date(2022, 1, 1)
+        assert record.a == 40.0
+        assert record.h_fig is values["h_fig"]
+
+    @pytest.mark.parametrize(
+        ["update", "message"],
+        [
+            (dict(frame=1000.5), "frame: 1000.5 is invalid"),
+            (dict(date="2022-13-01"), "date: '2022-13-01' is invalid"),
+            (dict(h_fig=[1, 2]), "h_fig: [1, 2] is invalid"),
+            (dict(tau1=None), "tau1: None is invalid"),
+        ],
+    )
+    def test_from_mapping_invalid(
+        values: dict[str, t.Any], update: dict[str, t.Any], message: str
+    ) -> None:
+        with pytest.raises(ValueError, match=re.escape(message)):
+            photo_luminescence.Record.from_mapping({**values, **update})
+
+    def test_from_mapping_missing(values: dict[str, t.Any]) -> None:
+        del values["a"], values["date"]
+        with pytest.raises(ValueError, match="missing fields: date, a"):
+            photo_luminescence.Record.from_mapping(values)
+
+
+def describe_build_all() -> None:
+    @pytest.fixture()
+    def records() -> list[photo_luminescence.Record]:
+        return [
+            photo_luminescence.Record(
+                f"title{i}",
+                400,
+                1,
+                5,
+                450,
+                30,
+                1000,
+                datetime.date(2022, 1, 1),
+                go.Figure(go.Scatter(y=[1, i])),
+                go.Figure(),
+                40,
+                60,
+                0.5,
+                1.5,
+            )  # fmt: skip
+            for i in range(3)
+        ]
+
+    def test_build_all(records: list[photo_luminescence.Record], png: bytes) -> None:
+        pool = mock.Mock(spec_set=render.RenderPool)
+        pool.render.return_value = [png] * 6
+        prs = photo_luminescence.build_all(records, pool=pool)
+        pool.render.assert_called_once_with([mock.ANY] * 6, "png", 10, None)
+        assert [s._slide.shapes.title.text for s in prs.slides] == [
+            "title0",
+            "title1",
+            "title2",
+        ]
+        image_parts = {
+            rel.target_part
+            for s in prs.slides
+            for rel in s._slide.part.rels.values()
+            if rel.reltype == pptx.opc.constants.RELATIONSHIP_TYPE.IMAGE
+        }
+        assert len(image_parts) == 1
+
+    def test_build_all_temporary_pool(
+        records: list[photo_luminescence.Record], png: bytes
+    ) -> None:
+        with mock.patch.object(render, "RenderPool") as m:
+            m.return_value.__enter__.return_value.render.return_value = [png] * 6
+            prs = photo_luminescence.build_all(records)
+        m.assert_called_once_with()
+        assert len(prs.slides) == len(records)
+
+    def test_build_all_previous(
+        records: list[photo_luminescence.Record], png: bytes, tmp_path: pathlib.Path
+    ) -> None:
+        pool = mock.Mock(spec_set=render.RenderPool)
+        pool.render.return_value = [png] * 6
+        previous = tmp_path / "previous.pptx"
+        photo_luminescence.build_all(records, pool=pool, previous=previous).save(
+            previous
+        )
+        records[1].title_text = "changed"
+        pool.render.return_value = [png] * 2
+        prs = photo_luminescence.build_all(records, pool=pool, previous=previous)
+        pool.render.assert_called_with([mock.ANY] * 2, "png", 10, None)
+        titles = [s._slide.shapes.title.text for s in prs.slides]
+        assert titles == ["title0", "changed", "title2"]
+        with zipfile.ZipFile(previous) as z:
+            blobs = {z.read(name) for name in z.namelist()}
+        assert prs.slides[0]._slide.part.blob in blobs
+        assert prs.slides[1]._slide.part.blob not in blobs
+        assert prs.slides[2]._slide.part.blob in blobs
+
+    def test_build_all_unchanged(
+        records: list[photo_luminescence.Record], tmp_path: pathlib.Path
+    ) -> None:
+        previous = tmp_path / "previous.pptx"
+        options: dict[str, t.Any] = dict(figure_format="chart", previous=previous)
+        photo_luminescence.build_all(records, **options).save(previous)
+        with mock.patch.object(core.Slide, "add_chart") as m:
+            prs = photo_luminescence.build_all(records, **options)
+        m.assert_not_called()
+        assert [s.get_tag("TLAB_PPTX_FINGERPRINT") for s in prs.slides] == [
+            s.get_tag("TLAB_PPTX_FINGERPRINT")
+            for s in core.new_presentation(previous).slides
+        ]
+
+    def test_build_all_chart(records: list[photo_luminescence.Record]) -> None:
+        prs = photo_luminescence.build_all(records, figure_format="chart")
+        assert len(prs.slides) == len(records)
+        for s in prs.slides:
+            assert sum(shape.has_chart for shape in s._slide.shapes) == 2
+
+
+def describe_build_async() -> None:
+    @pytest.fixture()
+    def record() -> photo_luminescence.Record:
+        return photo_luminescence.Record(
+            "title", 400, 1, 5, 450, 30, 1000, datetime.date(2022, 1, 1),
+            go.Figure(), go.Figure(), 40, 60, 0.5, 1.5,
+        )  # fmt: skip
+
+    def test_build_async(record: photo_luminescence.Record, png: bytes) -> None:
+        with mock.patch.object(
+            render, "to_image_async", mock.AsyncMock(return_value=png)
+        ) as m:
+            prs = asyncio.run(photo_luminescence.build_async(record))
+        assert m.await_count == 2
+        assert prs.slides[0]._slide.shapes.title.text == "title"
+
+    def test_build_async_semaphore(
+        record: photo_luminescence.Record, png: bytes
+    ) -> None:
+        running = 0
+        max_running = 0
+
+        async def to_image_async(*args: object) -> bytes:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return png
+
+        async def main() -> list[core.Presentation]:
+            semaphore = asyncio.Semaphore(1)
+            return await asyncio.gather(
+                *(
+                    photo_luminescence.build_async(record, semaphore=semaphore)
+                    for _ in range(3)
+                )
+            )
+
+        with mock.patch.object(render, "to_image_async", to_image_async):
+            prss = asyncio.run(main())
+        assert len(prss) == 3
+        assert max_running == 2
@@ -0,0 +1,116 @@
+import asyncio
+import io
+import threading
+
+import PIL.Image
+import pytest
+
+from tlab_pptx import core, profiling
+
+
+def test_span_without_hooks() -> None:
+    with profiling.span("stage") as recorder:
+        recorder.nbytes = 1
+    assert not recorder.enabled
+
+
+def test_add_hook_and_remove_hook() -> None:
+    spans: list[profiling.Span] = []
+    profiling.add_hook(spans.append)
+    try:
+        with profiling.span("stage") as recorder:
+            recorder.nbytes = 10
+    finally:
+        profiling.remove_hook(spans.append)
+    with profiling.span("stage"):
+        pass
+    assert [(s.name, s.nbytes) for s in spans] == [("stage", 10)]
+    assert spans[0].duration >= 0
+    with pytest.raises(ValueError):
+        profiling.remove_hook(spans.append)
+
+
+def test_span_on_error() -> None:
+    with profiling.Profile() as profile, pytest.raises(RuntimeError):
+        with profiling.span("stage"):
+            raise RuntimeError
+    assert [s.name for s in profile.spans] == ["stage"]
+
+
+def test_profile_tasks() -> None:
+    def save(name: str) -> None:
+        with profiling.span(f"{name}.save"):
+            pass
+
+    async def build(name: str) -> list[str]:
+        with profiling.Profile() as profile:
+            for _ in range(3):
+                with profiling.span(name):
+                    await asyncio.sleep(0)
+            await asyncio.to_thread(save, name)
+        return [s.name for s in profile.spans]
+
+    async def main() -> list[list[str]]:
+        return list(await asyncio.gather(build("a"), build("b")))
+
+    assert asyncio.run(main()) == [["a"] * 3 + ["a.save"], ["b"] * 3 + ["b.save"]]
+
+
+def test_profile_threads() -> None:
+    barrier = threading.Barrier(2)
+    results: dict[str, list[str]] = {}
+
+    def build(name: str) -> None:
+        with profiling.Profile() as profile:
+            barrier.wait()
+            with profiling.span(name):
+                barrier.wait()
+        results[name] = [s.name for s in profile.spans]
+
+    threads = [threading.Thread(target=build, args=(name,)) for name in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {"a": ["a"], "b": ["b"]}
+
+
+def describe_profile() -> None:
+    @pytest.fixture()
+    def profile() -> profiling.Profile:
+        return profiling.Profile(
+            [
+                profiling.Span("render", 0.5, 1024),
+                profiling.Span("save", 0.25),
+                profiling.Span("render", 1.0, 2048),
+            ]
+        )
+
+    def test_summary(profile: profiling.Profile) -> None:
+        assert profile.summary() == {
+            "render": dict(count=2, duration=1.5, nbytes=3072),
+            "save": dict(count=1, duration=0.25, nbytes=None),
+        }
+
+    def test_print(profile: profiling.Profile) -> None:
+        with io.StringIO() as f:
+            profile.print(f)
+            header, render, save = f.getvalue().splitlines()
+        assert header.split()[0] == "stage"
+        assert render.split() == ["render", "2", "1.500", "750.0", "3.0"]
+        assert save.split() == ["save", "1", "0.250", "250.0"]
+
+
+def test_build_stages() -> None:
+    with io.BytesIO() as f:
+        PIL.Image.new("RGB", (10, 10)).save(f, "png")
+        image = f.getvalue()
+    with profiling.Profile() as profile, io.BytesIO() as f:
+        prs = core.new_presentation()
+        prs.slides[0].add_image(image, left=0, top=0)
+        prs.save(f)
+        size = f.tell()
+    assert [(s.name, s.nbytes) for s in profile.spans] == [
+        ("insert_picture", len(image)),
+        ("save", size),
+    ]
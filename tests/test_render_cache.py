@@ -0,0 +1,81 @@
+import os
+import pathlib
+from unittest import mock
+
+import plotly.graph_objects as go
+import pytest
+
+from tlab_pptx.render import cache as rcache
+
+
+def test_get_default_cache_dir(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TLAB_PPTX_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", "/tmp/cache")
+    assert rcache.get_default_cache_dir() == os.path.join("/tmp/cache", "tlab-pptx")
+
+
+def test_get_default_cache_dir_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TLAB_PPTX_CACHE_DIR", "/tmp/tlab-pptx")
+    assert rcache.get_default_cache_dir() == "/tmp/tlab-pptx"
+
+
+def describe_render_cache() -> None:
+    @pytest.fixture()
+    def cache(tmp_path: pathlib.Path) -> rcache.RenderCache:
+        return rcache.RenderCache(tmp_path / "cache", max_bytes=10)
+
+    def test_get_key(cache: rcache.RenderCache) -> None:
+        fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+        key = cache.get_key(fig, format="png", scale=10)
+        assert key == cache.get_key(go.Figure(fig), scale=10, format="png")
+        assert key != cache.get_key(fig, format="png", scale=5)
+        assert key != cache.get_key(fig.update_layout(width=100), format="png")
+
+    def test_get_key_kaleido_version(cache: rcache.RenderCache) -> None:
+        fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+        key = cache.get_key(fig, format="png")
+        with mock.patch.object(rcache, "_get_kaleido_version", return_value="9.9.9"):
+            assert cache.get_key(fig, format="png") != key
+
+    def test_get_missing(cache: rcache.RenderCache) -> None:
+        assert cache.get("missing") is None
+
+    def test_put_and_get(cache: rcache.RenderCache) -> None:
+        cache.put("key", b"image")
+        assert cache.get("key") == b"image"
+
+    def test_put_evicts_least_recently_used(cache: rcache.RenderCache) -> None:
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        os.utime(cache._path / "a", ns=(0, 0))
+        os.utime(cache._path / "b", ns=(1, 1))
+        cache.get("a")
+        cache.put("c", b"1234")
+        assert cache.get("a") == b"1234"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"1234"
+
+    def test_put_scans_once(cache: rcache.RenderCache) -> None:
+        cache.put("a", b"12")
+        with mock.patch.object(cache, "_scan", wraps=cache._scan) as m:
+            cache.put("b", b"12")
+            cache.put("c", b"12")
+            m.assert_not_called()
+            cache.put("d", b"123456")
+            m.assert_called_once_with()
+        assert cache.get("a") is None
+        assert cache.get("d") == b"123456"
+
+    def test_keeps_other_files(cache: rcache.RenderCache) -> None:
+        directory = pathlib.Path(cache.directory)
+        directory.mkdir()
+        (directory / "notes.txt").write_bytes(b"0123456789")
+        cache.put("a", b"1234")
+        cache.put("b", b"1234567")
+        cache.clear()
+        assert (directory / "notes.txt").read_bytes() == b"0123456789"
+
+    def test_clear(cache: rcache.RenderCache) -> None:
+        cache.put("key", b"image")
+        cache.clear()
+        assert cache.get("key") is None
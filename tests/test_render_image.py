@@ -0,0 +1,98 @@
+import asyncio
+import pathlib
+from collections import abc
+from concurrent import futures
+from unittest import mock
+
+import plotly.graph_objects as go
+import pytest
+
+from tlab_pptx import typing
+from tlab_pptx.render import cache as rcache
+from tlab_pptx.render import image
+from tlab_pptx.render import pool as rpool
+
+
+@pytest.fixture()
+def fig() -> abc.Generator[go.Figure, None, None]:
+    with mock.patch("plotly.graph_objects.Figure.to_image", return_value=b"png"):
+        yield go.Figure()
+
+
+def test_to_image(fig: go.Figure) -> None:
+    assert image.to_image(fig) == b"png"
+    fig.to_image.assert_called_once_with("png", scale=10)
+
+
+def test_to_image_dict() -> None:
+    fig_dict = dict(data=[dict(type="scatter", y=[1, 2])], layout=dict(width=100))
+    with mock.patch("plotly.io.to_image", return_value=b"png") as m:
+        assert image.to_image(fig_dict, "png", scale=2) == b"png"
+    m.assert_called_once_with(fig_dict, "png", scale=2, validate=False)
+
+
+def test_to_image_cache(fig: go.Figure, tmp_path: pathlib.Path) -> None:
+    cache = rcache.RenderCache(tmp_path)
+    assert image.to_image(fig, "png", scale=5, cache=cache) == b"png"
+    assert image.to_image(fig, "png", scale=5, cache=cache) == b"png"
+    fig.to_image.assert_called_once_with("png", scale=5)
+    assert cache.get(cache.get_key(fig, format="png", scale=5)) == b"png"
+
+
+@pytest.mark.parametrize(
+    ["layout", "width", "height", "dpi", "expected"],
+    [
+        (dict(width=450, height=450), 11.43, 11.43, 150, 1.5),
+        (dict(width=450, height=450), 11.43, 11.43, "screen", 1.5),
+        (dict(width=450, height=450), 11.43, 11.43, "print", 3.0),
+        (dict(width=450, height=450), 11.43, 5.715, 300, 3.0),
+        (dict(width=450, height=225), 11.43, 11.43, 300, 6.0),
+        (dict(), 17.78, 12.7, 70, 0.7),
+    ],
+)
+def test_get_scale(
+    layout: dict[str, int],
+    width: float,
+    height: float,
+    dpi: float | typing.Quality,
+    expected: float,
+) -> None:
+    fig = go.Figure(layout=layout)
+    assert image.get_scale(fig, width, height, dpi) == pytest.approx(expected)
+    fig_dict = dict(layout=layout)
+    assert image.get_scale(fig_dict, width, height, dpi) == pytest.approx(expected)
+
+
+def test_get_scale_unknown_quality() -> None:
+    with pytest.raises(ValueError):
+        image.get_scale(go.Figure(), 1.0, 1.0, "unknown")  # type: ignore[arg-type]
+
+
+def test_to_image_async(fig: go.Figure) -> None:
+    assert asyncio.run(image.to_image_async(fig, "png", 5)) == b"png"
+    fig.to_image.assert_called_once_with("png", scale=5)
+
+
+@pytest.fixture()
+def pool() -> mock.Mock:
+    pool = mock.Mock(spec_set=rpool.RenderPool)
+    future: futures.Future[bytes] = futures.Future()
+    future.set_result(b"pooled")
+    pool.submit.return_value = future
+    return pool
+
+
+def test_to_image_async_pool(fig: go.Figure, pool: mock.Mock) -> None:
+    assert asyncio.run(image.to_image_async(fig, "png", 5, pool=pool)) == b"pooled"
+    pool.submit.assert_called_once_with(fig, "png", 5)
+    fig.to_image.assert_not_called()
+
+
+def test_to_image_async_pool_cache(
+    fig: go.Figure, pool: mock.Mock, tmp_path: pathlib.Path
+) -> None:
+    cache = rcache.RenderCache(tmp_path)
+    for _ in range(2):
+        data = asyncio.run(image.to_image_async(fig, "png", 5, cache, pool))
+        assert data == b"pooled"
+    pool.submit.assert_called_once()
@@ -0,0 +1,61 @@
+import io
+
+import PIL.Image
+import PIL.ImageDraw
+import pytest
+
+from tlab_pptx import profiling
+from tlab_pptx.render import optimize
+
+
+@pytest.fixture()
+def image() -> bytes:
+    img = PIL.Image.new("RGBA", (200, 200), "white")
+    draw = PIL.ImageDraw.Draw(img)
+    draw.line([(0, 0), (200, 200)], fill="black", width=3)
+    draw.ellipse([(50, 50), (150, 150)], outline="red", width=2)
+    with io.BytesIO() as f:
+        img.save(f, "png", compress_level=1)
+        return f.getvalue()
+
+
+def load(image: bytes) -> PIL.Image.Image:
+    with PIL.Image.open(io.BytesIO(image)) as img:
+        return img.convert("RGBA")
+
+
+def test_optimize_png_lossless(image: bytes) -> None:
+    optimized = optimize.optimize_png(image)
+    assert len(optimized) < len(image)
+    assert load(optimized).tobytes() == load(image).tobytes()
+
+
+def test_optimize_png_lossy(image: bytes) -> None:
+    optimized = optimize.optimize_png(image, "lossy", colors=16)
+    assert len(optimized) < len(image)
+    with PIL.Image.open(io.BytesIO(optimized)) as img:
+        assert img.mode == "P"
+        assert img.size == (200, 200)
+
+
+@pytest.mark.parametrize("colors", [0, -1, 257])
+def test_optimize_png_invalid_colors(image: bytes, colors: int) -> None:
+    with pytest.raises(ValueError, match=f"{colors} colors is not from 1 to 256"):
+        optimize.optimize_png(image, "lossy", colors=colors)
+
+
+def test_optimize_png_not_png() -> None:
+    assert optimize.optimize_png(b"<svg></svg>") == b"<svg></svg>"
+
+
+def test_optimize_png_not_smaller(image: bytes) -> None:
+    optimized = optimize.optimize_png(image)
+    assert optimize.optimize_png(optimized) == optimized
+
+
+def test_optimize_png_span(image: bytes) -> None:
+    with profiling.Profile() as profile:
+        optimized = optimize.optimize_png(image)
+    assert [(s.name, s.nbytes) for s in profile.spans] == [
+        ("optimize_png", len(image) - len(optimized))
+    ]
@@ -0,0 +1,81 @@
+import pathlib
+import threading
+import time
+from concurrent import futures
+from unittest import mock
+
+import plotly.graph_objects as go
+import pytest
+
+from tlab_pptx.render import cache as rcache
+from tlab_pptx.render import pool as rpool
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.fixture()
+def figs() -> list[go.Figure]:
+    return [
+        go.Figure(go.Scatter(x=[0, 1], y=[0, i]), layout=dict(width=50, height=50))
+        for i in range(3)
+    ]
+
+
+def test_to_images(figs: list[go.Figure]) -> None:
+    images = rpool.to_images(figs, scale=1, max_workers=2)
+    assert len(images) == len(figs)
+    assert all(image.startswith(PNG_SIGNATURE) for image in images)
+    assert len(set(images)) == len(figs)
+
+
+def describe_render_pool() -> None:
+    @pytest.fixture()
+    def pool() -> rpool.RenderPool:
+        return rpool.RenderPool(max_workers=1)
+
+    def test_render_keeps_order(pool: rpool.RenderPool, figs: list[go.Figure]) -> None:
+        with pool:
+            images = pool.render(figs, scale=1)
+        assert images == [rpool._render(fig.to_plotly_json(), "png", 1) for fig in figs]
+
+    def test_render_cache(
+        pool: rpool.RenderPool, figs: list[go.Figure], tmp_path: pathlib.Path
+    ) -> None:
+        cache = rcache.RenderCache(tmp_path)
+        cache.put(cache.get_key(figs[0], format="png", scale=1), b"cached")
+        with pool, mock.patch.object(pool, "submit", wraps=pool.submit) as m:
+            images = pool.render(figs, scale=1, cache=cache)
+        assert images[0] == b"cached"
+        assert m.call_count == len(figs) - 1
+        for fig, image in zip(figs[1:], images[1:]):
+            assert cache.get(cache.get_key(fig, format="png", scale=1)) == image
+
+    def test_submit_threads(pool: rpool.RenderPool, figs: list[go.Figure]) -> None:
+        def create(**kwargs: object) -> mock.MagicMock:
+            time.sleep(0.05)  # Widens the window for a race.
+            return mock.MagicMock()
+
+        barrier = threading.Barrier(8)
+
+        def submit() -> None:
+            barrier.wait()
+            pool.submit(figs[0], scale=1)
+
+        with mock.patch.object(futures, "ProcessPoolExecutor", side_effect=create) as m:
+            threads = [threading.Thread(target=submit) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            executor = pool._executor
+            pool.shutdown()
+        assert m.call_count == 1
+        assert isinstance(executor, mock.MagicMock)
+        assert executor.submit.call_count == 8
+        executor.shutdown.assert_called_once_with()
+
+    def test_shutdown(pool: rpool.RenderPool, figs: list[go.Figure]) -> None:
+        pool.submit(figs[0], scale=1).result()
+        assert pool._executor is not None
+        pool.shutdown()
+        assert pool._executor is None
@@ -0,0 +1,150 @@
+import http.client
+import io
+import json
+import threading
+import time
+import typing as t
+import urllib.error
+import urllib.request
+from collections import abc
+
+import pptx
+import pytest
+
+from tlab_pptx import server as tserver
+
+_REQUEST = dict(
+    title_text="Sample A",
+    excitation_wavelength=400,
+    excitation_power=1,
+    time_range=10,
+    frame=1000,
+    date="2022-01-01",
+    a=60,
+    b=40,
+    tau1=1,
+    tau2=3,
+    h_data=dict(x=[0, 1, 2], y=dict(intensity=[1, 0.5, 0.2]), x_title="time"),
+    v_data=dict(x=[400, 450, 500], y=dict(intensity=[0.1, 1, 0.1])),
+    figure_format="chart",
+)
+
+
+@pytest.fixture()
+def server() -> abc.Iterator[tserver.ReportServer]:
+    with tserver.ReportServer(
+        port=0, max_workers=1, max_builds=1, max_pending=1
+    ) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+def _request(
+    server: tserver.ReportServer, path: str, body: t.Any = None
+) -> tuple[int, bytes]:
+    host, port = server.address
+    data = None if body is None else json.dumps(body).encode()
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}{path}", data) as res:
+            return res.status, res.read()
+    except urllib.error.HTTPError as err:
+        return err.code, err.read()
+
+
+def test_health(server: tserver.ReportServer) -> None:
+    assert _request(server, "/health") == (200, b'{"status": "ok"}')
+
+
+@pytest.mark.parametrize("figure_format", ["chart", "png"])
+def test_build(server: tserver.ReportServer, figure_format: str) -> None:
+    status, data = _request(
+        server,
+        "/photo-luminescence",
+        {**_REQUEST, "figure_format": figure_format, "dpi": "draft"},
+    )
+    assert status == 200
+    slide = pptx.Presentation(io.BytesIO(data)).slides[0]
+    assert slide.shapes.title.text == "Sample A"
+    texts = [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+    assert any("Center wavelength : 450 nm" in text for text in texts)
+
+
+@pytest.mark.parametrize(
+    ["body", "message"],
+    [
+        ([], "not a JSON object"),
+        ({**_REQUEST, "date": "2022-13-01"}, "ValueError"),
+        ({**_REQUEST, "figure_format": "gif"}, "'gif' is not a figure format"),
+        ({**_REQUEST, "h_data": [1, 2]}, "h_data must be"),
+        ({**_REQUEST, "v_data": None}, "v_data must be"),
+        ({**_REQUEST, "downsample": "false"}, "downsample 'false' is not a boolean"),
+        ({**_REQUEST, "dpi": "high"}, "'high' is not a DPI or a quality"),
+        ({**_REQUEST, "frame": 1.5}, "frame: 1.5 is invalid"),
+        ({"title_text": "Sample A"}, "missing fields: h_data"),
+        (
+            {k: v for k, v in _REQUEST.items() if k != "a"},
+            "missing fields: a",
+        ),
+    ],
+)
+def test_build_bad_request(
+    server: tserver.ReportServer, body: t.Any, message: str
+) -> None:
+    status, data = _request(server, "/photo-luminescence", body)
+    assert status == 400
+    assert message in json.loads(data)["error"]
+
+
+def test_build_queue(server: tserver.ReportServer) -> None:
+    results: list[int] = []
+
+    def post() -> None:
+        results.append(_request(server, "/photo-luminescence", _REQUEST)[0])
+
+    # A build and a waiting request are admitted, and the next one is rejected.
+    with server._builds:
+        threads = [threading.Thread(target=post) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        while server._admission._value:
+            time.sleep(0.01)
+        status, data = _request(server, "/photo-luminescence", _REQUEST)
+    for thread in threads:
+        thread.join()
+    assert status == 503
+    assert json.loads(data) == {"error": "too many pending requests"}
+    assert results == [200, 200]
+
+
+@pytest.mark.parametrize(
+    ["headers", "expected"],
+    [
+        ({}, 411),
+        ({"Content-Length": "abc"}, 400),
+        ({"Content-Length": "-1"}, 400),
+        ({"Content-Length": str(1 << 40)}, 413),
+    ],
+)
+def test_build_content_length(
+    server: tserver.ReportServer, headers: dict[str, str], expected: int
+) -> None:
+    connection = http.client.HTTPConnection(*server.address, timeout=10)
+    try:
+        connection.putrequest("POST", "/photo-luminescence")
+        for key, value in headers.items():
+            connection.putheader(key, value)
+        connection.endheaders()
+        response = connection.getresponse()
+        assert response.status == expected
+        assert "error" in json.loads(response.read())
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("path", ["/unknown", "/health/"])
+def test_not_found(server: tserver.ReportServer, path: str) -> None:
+    assert _request(server, path)[0] == 404
+    assert _request(server, path, {})[0] == 404
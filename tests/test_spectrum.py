@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from tlab_pptx import spectrum
+
+
+def _gaussians(x: np.ndarray, center: np.ndarray, fwhm: np.ndarray) -> np.ndarray:
+    y: np.ndarray = np.exp(
+        -4 * np.log(2) * ((x - center[:, None]) / fwhm[:, None]) ** 2
+    )
+    return y
+
+
+def test_analyze_spectra() -> None:
+    rng = np.random.default_rng(0)
+    x = np.linspace(400, 600, 201)
+    center, fwhm = rng.uniform(450, 550, 100), rng.uniform(10, 40, 100)
+    peaks = spectrum.analyze_spectra(x, 2 * _gaussians(x, center, fwhm))
+    assert len(peaks) == 100
+    np.testing.assert_allclose(peaks.center_wavelength, center, atol=0.01)
+    np.testing.assert_allclose(peaks.FWHM, fwhm, rtol=0.01)
+    np.testing.assert_allclose(peaks.height, 2, rtol=1e-3)
+
+
+def test_analyze_spectra_descending() -> None:
+    x = np.linspace(600, 400, 201)
+    y = _gaussians(x, np.array([482.3]), np.array([30.0]))[0]
+    assert spectrum.analyze_spectra(x, y).params(0) == pytest.approx(
+        dict(center_wavelength=482.3, FWHM=30.0), rel=1e-3
+    )
+
+
+def test_analyze_spectra_wavelength_per_spectrum() -> None:
+    x = np.stack([np.linspace(400, 600, 201), np.linspace(450, 550, 201)])
+    y = _gaussians(x, np.array([500.0]), np.array([20.0]))
+    peaks = spectrum.analyze_spectra(x, y)
+    np.testing.assert_allclose(peaks.center_wavelength, [500, 500])
+
+
+def test_analyze_spectra_nan() -> None:
+    x = np.arange(5.0)
+    y = np.array([[0, 1, 2, 1, 0], [0, np.nan, 2, 1, 0], [np.nan] * 5, [0, 1, 2, 2, 2]])
+    peaks = spectrum.analyze_spectra(x, y)
+    np.testing.assert_allclose(peaks.center_wavelength, [2, 2, np.nan, 2.5])
+    np.testing.assert_allclose(peaks.FWHM, [2, np.nan, np.nan, np.nan])
+
+
+def test_analyze_spectra_empty() -> None:
+    peaks = spectrum.analyze_spectra([], np.empty((3, 0)))
+    assert len(peaks) == 3 and np.isnan(peaks.FWHM).all()
+
+
+def test_analyze_spectra_invalid() -> None:
+    with pytest.raises(ValueError):
+        spectrum.analyze_spectra([1, 2], [1, 2, 3])
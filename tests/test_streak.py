@@ -0,0 +1,117 @@
+import pathlib
+import typing as t
+
+import numpy as np
+import PIL.Image
+import PIL.TiffImagePlugin
+import pytest
+
+from tlab_pptx import streak
+
+
+@pytest.fixture()
+def frames() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1000, (3, 20, 30), dtype=np.uint16)
+
+
+@pytest.fixture()
+def raw(tmp_path: pathlib.Path, frames: np.ndarray) -> pathlib.Path:
+    path = tmp_path / "streak.raw"
+    path.write_bytes(b"header" + frames.astype("<u2").tobytes())
+    return path
+
+
+@pytest.fixture()
+def tiff(tmp_path: pathlib.Path, frames: np.ndarray) -> pathlib.Path:
+    path = tmp_path / "streak.tif"
+    first, *others = [PIL.Image.fromarray(frame) for frame in frames]
+    first.save(path, save_all=True, append_images=others)
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 1 << 20])
+def test_project(raw: pathlib.Path, frames: np.ndarray, chunk_size: int) -> None:
+    time, wavelength = np.linspace(0, 10, 20), np.linspace(400, 600, 30)
+    image = streak.open_streak_image(
+        raw, shape=(20, 30), offset=6, time=time, wavelength=wavelength
+    )
+    assert len(image.frames) == 3
+    assert all(isinstance(frame, np.memmap) for frame in image.frames)
+    projections = image.project(
+        time_roi=(4, 2), wavelength_roi=(450, 500), chunk_size=chunk_size
+    )
+    rows, columns = (2 <= time) & (time <= 4), (450 <= wavelength) & (wavelength <= 500)
+    total = frames.sum(axis=0, dtype=float)
+    np.testing.assert_array_equal(projections.decay, total[:, columns].sum(axis=1))
+    np.testing.assert_array_equal(projections.spectrum, total[rows].sum(axis=0))
+    np.testing.assert_array_equal(projections.time, time)
+
+
+def test_project_tiff(tiff: pathlib.Path, frames: np.ndarray) -> None:
+    image = streak.open_streak_image(tiff)
+    assert len(image.frames) == 3
+    np.testing.assert_array_equal(image.wavelength, np.arange(30))
+    projections = image.project()
+    np.testing.assert_array_equal(projections.decay, frames.sum(axis=(0, 2)))
+    np.testing.assert_array_equal(projections.spectrum, frames.sum(axis=(0, 1)))
+
+
+def test_project_tiff_tuple_tiles(
+    tiff: pathlib.Path, frames: np.ndarray, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Pillow before 11 gives the tiles as plain tuples.
+    setup = PIL.TiffImagePlugin.TiffImageFile._setup
+
+    def _setup(self: PIL.TiffImagePlugin.TiffImageFile) -> None:
+        setup(self)
+        self.tile = [tuple(tile) for tile in self.tile]  # type: ignore[misc]
+
+    monkeypatch.setattr(PIL.TiffImagePlugin.TiffImageFile, "_setup", _setup)
+    image = streak.open_streak_image(tiff)
+    with PIL.Image.open(tiff) as img:
+        assert type(img.tile[0]) is tuple
+    np.testing.assert_array_equal(image.project().decay, frames.sum(axis=(0, 2)))
+
+
+def test_project_tiff_many_pages(tmp_path: pathlib.Path) -> None:
+    # A mapping for each page would run out of file descriptors.
+    resource = pytest.importorskip("resource")
+    path = tmp_path / "streak.tif"
+    first, *others = [PIL.Image.new("L", (3, 2), i % 256) for i in range(600)]
+    first.save(path, save_all=True, append_images=others)
+    limits = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(512, limits[1]), limits[1]))
+    try:
+        image = streak.open_streak_image(path)
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, limits)
+    assert len(image.frames) == 600
+    assert all(isinstance(frame, np.memmap) for frame in image.frames)
+    total = 3 * sum(i % 256 for i in range(600))
+    np.testing.assert_array_equal(image.project().decay, [total, total])
+
+
+def test_to_figures(raw: pathlib.Path) -> None:
+    image = streak.open_streak_image(raw, shape=(20, 30), offset=6)
+    h_fig, v_fig = image.project().to_figures()
+    assert len(h_fig.data[0].y) == 20
+    assert len(v_fig.data[0].y) == 30
+    assert v_fig.layout.xaxis.title.text == "Wavelength (nm)"
+
+
+def test_open_streak_image_compressed(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "compressed.tif"
+    PIL.Image.new("L", (4, 3)).save(path, compression="tiff_lzw")
+    with pytest.raises(ValueError):
+        streak.open_streak_image(path)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(shape=(7, 30)), dict(offset=0), dict(time=[0, 1])],
+)
+def test_open_streak_image_invalid(raw: pathlib.Path, kwargs: dict[str, t.Any]) -> None:
+    kwargs = {"shape": (20, 30), "offset": 6, **kwargs}
+    with pytest.raises(ValueError):
+        streak.open_streak_image(raw, **kwargs)